@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Batch generation of many Brain-Bridges decks in one process
+
+A deck spec names an output file and the design tokens / data constants it
+overrides, e.g. another HERO_IMAGE_PATH or WHY_NOW_TITLE:
+
+    {"output": "output/Brain-Bridges_Customer-A.pptx",
+     "tokens": {"HERO_IMAGE_PATH": "assets/customer_a.png"},
+     "slides": "1-6"}                                   # optional
+
+Overrides may be given as JSON: dict tokens (AUTOREGRESS_STEP_1,
+WHY_NOW_STEP_2, ...) are merged key by key and "#RRGGBB" strings become
+colors; values must have the token's type and path tokens must point into
+assets/, see coerce_token_value().
+
+Everything that does not differ between decks is done once per batch:
+- slides whose fingerprint (see build_cache.py) is the same in several decks
+  are built once and merged into every deck as finished slide parts
+- the default template is read once (generate_pptx.default_template_blob)
+- every image file is read, measured and SHA1-hashed once
+- processed images (rounded hero image) are computed once per input
+- images are looked up by SHA1 in a dict instead of re-hashing every image
+  part of the package on each add_picture()
+
+    python3 batch_build.py decks.json
+    python3 batch_build.py decks.json --trace   # timeline, see build_trace.py
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import time
+
+from pptx.dml.color import RGBColor
+from pptx.package import _ImageParts
+from pptx.parts.image import Image as PptxImage
+from pptx.parts.image import ImagePart
+from pptx.util import Emu, Length
+
+import design_tokens
+import generate_pptx
+from build_cache import create_presentation_incremental
+
+
+# Path tokens (HERO_IMAGE_PATH, the icons) may only point at files in this directory
+ASSETS_DIR = "assets"
+
+COLOR_PATTERN = re.compile(r"^#?[0-9A-Fa-f]{6}$")
+
+
+class DeckSpecError(ValueError):
+    """A deck spec that can never render: unknown design tokens or slides, or token values of the wrong type"""
+
+
+def _asset_path(value, name):
+    """Returns `value` if it is a path inside assets/, so a spec cannot pull other files into a deck"""
+    assets_dir = os.path.realpath(ASSETS_DIR)
+    try:
+        path = os.path.realpath(value)
+        inside = path != assets_dir and os.path.commonpath([assets_dir, path]) == assets_dir
+    except ValueError:
+        # Null bytes, or a path on another drive
+        inside = False
+    if not inside:
+        raise DeckSpecError(f"{name} must be a path in {ASSETS_DIR}/, not '{value}'")
+    return value
+
+
+def coerce_token_value(current, value, name="token", merge=True):
+    """
+    Converts a JSON override to the type of the token it replaces.
+
+    Dicts (e.g. AUTOREGRESS_STEP_1, WHY_NOW_STEP_2) are merged key by key, so a
+    spec only lists what changes (dicts inside lists are replaced whole);
+    "#RRGGBB" strings become RGBColor, lists become tuples and integers become
+    lengths (EMU) where the token holds those types. Anything else of another
+    type than the token, and paths outside assets/, raise DeckSpecError.
+    """
+    def invalid(expected):
+        return DeckSpecError(f"{name} must be {expected}, not {type(value).__name__}")
+
+    if isinstance(current, dict):
+        if not isinstance(value, dict):
+            raise invalid("an object")
+        unknown = sorted(key for key in value if key not in current)
+        missing = [] if merge else sorted(key for key in current if key not in value)
+        if unknown or missing:
+            raise DeckSpecError(f"{name} keys must be {', '.join(sorted(current))}, "
+                                f"got {', '.join(sorted(value)) or 'none'}")
+        merged = dict(current)
+        for key, item in value.items():
+            merged[key] = coerce_token_value(current[key], item, f"{name}.{key}")
+        return merged
+    if isinstance(current, RGBColor):
+        if not isinstance(value, str) or not COLOR_PATTERN.match(value):
+            raise invalid('a color "#RRGGBB"')
+        return RGBColor.from_string(value.lstrip("#"))
+    if isinstance(current, (list, tuple)):
+        if not isinstance(value, list):
+            raise invalid("a list")
+        if isinstance(current, tuple):
+            # Fixed-length records, e.g. an RGB triple or a (heading, text) bullet
+            if len(value) != len(current):
+                raise DeckSpecError(f"{name} must have {len(current)} items, not {len(value)}")
+            return tuple(coerce_token_value(default, item, f"{name}[{i}]")
+                         for i, (default, item) in enumerate(zip(current, value)))
+        if not current:
+            return value
+        return [coerce_token_value(current[0], item, f"{name}[{i}]", merge=False) for i, item in enumerate(value)]
+    if current is None:
+        # Optional fields such as new_token_index or predicted
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int))):
+            raise invalid("a string, an integer or null")
+        return value
+    if isinstance(current, bool):
+        if not isinstance(value, bool):
+            raise invalid("true or false")
+        return value
+    if isinstance(current, int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise invalid("an integer")
+        return Emu(value) if isinstance(current, Length) else value
+    if isinstance(current, float):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise invalid("a number")
+        return float(value)
+    if isinstance(current, str):
+        if not isinstance(value, str):
+            raise invalid("a string")
+        return _asset_path(value, name) if current.startswith(f"{ASSETS_DIR}/") else value
+    if type(value) is not type(current):
+        raise invalid(type(current).__name__)
+    return value
+
+
+def is_design_token(name):
+    """Overridable names are the uppercase design tokens / data constants defined in design_tokens.py"""
+    return name.isupper() and hasattr(design_tokens, name)
+
+
+def coerce_tokens(tokens):
+    """Returns the JSON overrides of a deck spec converted to the tokens' types; raises DeckSpecError"""
+    if not isinstance(tokens, dict):
+        raise DeckSpecError("Deck spec \"tokens\" must be a JSON object")
+    unknown = sorted(name for name in tokens if not is_design_token(name))
+    if unknown:
+        raise DeckSpecError(f"Unknown design token(s): {', '.join(unknown)}")
+    return {name: coerce_token_value(getattr(generate_pptx, name), value, name) for name, value in tokens.items()}
+
+
+def check_deck_spec(spec):
+    """
+    Checks a deck spec before anything is rendered.
+
+    Returns:
+        The registry entries the spec selects
+    Raises:
+        DeckSpecError for unknown tokens or slides or invalid token values - the spec
+        would fail the same way on every attempt
+    """
+    coerce_tokens(spec.get("tokens", {}))
+    selection = spec.get("slides")
+    if selection is not None and not isinstance(selection, str):
+        raise DeckSpecError("Deck spec \"slides\" must be a string like \"1-6\" or \"why-now\"")
+    try:
+        return generate_pptx.select_slides(selection)
+    except ValueError as e:
+        raise DeckSpecError(str(e)) from None
+
+
+@contextlib.contextmanager
+def token_overrides(tokens):
+    """
+    Temporarily replaces design tokens / data constants used by the slide builders.
+
+    Only names defined in design_tokens.py are accepted (see is_design_token()),
+    so a spec cannot replace generator functions, imports or runtime state.
+    The theme, text styles and shape templates are defined again from the
+    overridden tokens, and once more from the original ones afterwards.
+    """
+    values = coerce_tokens(tokens)
+    saved = {name: getattr(generate_pptx, name) for name in values}
+    for name, value in values.items():
+        setattr(generate_pptx, name, value)
+    if values:
+        generate_pptx.define_styles()
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(generate_pptx, name, value)
+        if values:
+            generate_pptx.define_styles()
+
+
+def _file_key(path):
+    """Identifies a file version by path, mtime and size"""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@contextlib.contextmanager
+def shared_media():
+    """Shares loaded and processed images between all decks built inside the block"""
+    images = {}
+    processed = {}
+    original_from_file = PptxImage.from_file.__func__
+    original_get_or_add = _ImageParts.get_or_add_image_part
+    original_rounded_corners = generate_pptx.add_rounded_corners_to_image
+
+    def from_file(cls, image_file):
+        # Image is immutable, so one instance (blob, sha1, size, dpi) can back parts in many packages
+        if not isinstance(image_file, str):
+            return original_from_file(cls, image_file)
+        key = _file_key(image_file)
+        if key not in images:
+            images[key] = original_from_file(cls, image_file)
+        return images[key]
+
+    def get_or_add_image_part(self, image_file):
+        by_sha1 = self.__dict__.get("_parts_by_sha1")
+        if by_sha1 is None:
+            by_sha1 = self.__dict__["_parts_by_sha1"] = {part.sha1: part for part in self}
+        image = PptxImage.from_file(image_file)
+        if image.sha1 not in by_sha1:
+            by_sha1[image.sha1] = ImagePart.new(self._package, image)
+        return by_sha1[image.sha1]
+
+    def add_rounded_corners_to_image(image_path, corner_radius, border_color, border_width, output_path=None):
+        if output_path is not None:
+            return original_rounded_corners(image_path, corner_radius, border_color, border_width, output_path)
+        # In-memory PNG per source file version and parameters; every caller gets its own stream
+        key = (_file_key(image_path), corner_radius, tuple(border_color), border_width)
+        if key not in processed:
+            processed[key] = original_rounded_corners(image_path, corner_radius, border_color, border_width).getvalue()
+        return io.BytesIO(processed[key])
+
+    PptxImage.from_file = classmethod(from_file)
+    _ImageParts.get_or_add_image_part = get_or_add_image_part
+    generate_pptx.add_rounded_corners_to_image = add_rounded_corners_to_image
+    try:
+        yield
+    finally:
+        PptxImage.from_file = classmethod(original_from_file)
+        _ImageParts.get_or_add_image_part = original_get_or_add
+        generate_pptx.add_rounded_corners_to_image = original_rounded_corners
+
+
+def build_deck(spec, slide_parts):
+    """
+    Builds the presentation for one deck spec (output is not written).
+
+    Args:
+        spec: Deck spec ({"tokens": {...}, "slides": selection}; "output" is ignored)
+        slide_parts: {fingerprint: slide part} dict shared between decks
+
+    Returns:
+        (prs, rebuilt) - the presentation and the slide numbers not found in slide_parts
+    Raises:
+        DeckSpecError before anything is built if the spec is invalid
+    """
+    slides = check_deck_spec(spec)
+    with token_overrides(spec.get("tokens", {})):
+        return create_presentation_incremental(slides, cache_dir=None, memory_cache=slide_parts)
+
+
+def build_decks(specs, reproducible=False):
+    """
+    Builds one deck per spec in this process, sharing template and media.
+
+    Args:
+        specs: List of deck specs ({"output": path, "tokens": {...}, "slides": selection})
+        reproducible: Byte-identical output for identical decks (see reproducible.py)
+
+    Returns:
+        List of the written output paths, in spec order
+    """
+    outputs = []
+    slide_parts = {}
+    with shared_media():
+        for spec in specs:
+            prs, _ = build_deck(spec, slide_parts)
+
+            output_dir = os.path.dirname(spec["output"])
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            generate_pptx.save_atomic(prs, spec["output"], reproducible=reproducible)
+            outputs.append(spec["output"])
+    return outputs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build many Brain-Bridges decks in one process")
+    parser.add_argument("specs", metavar="DECK_SPECS.json", help="JSON list of deck specs")
+    parser.add_argument("--trace", nargs="?", const="output/Brain-Bridges_BATCH_TRACE.json", metavar="JSON_PATH",
+                        help="Record a Chrome/Perfetto timeline of the batch "
+                             "(default: output/Brain-Bridges_BATCH_TRACE.json)")
+    args = parser.parse_args()
+
+    with open(args.specs, encoding="utf-8") as f:
+        deck_specs = json.load(f)
+
+    if args.trace:
+        from build_trace import tracing
+        trace_context = tracing(args.trace, name="batch")
+    else:
+        trace_context = contextlib.nullcontext()
+
+    started = time.perf_counter()
+    with trace_context:
+        outputs = build_decks(deck_specs, reproducible="SOURCE_DATE_EPOCH" in os.environ)
+    for output_path in outputs:
+        print(f"✅ Deck created: {output_path}")
+    print(f"📦 {len(deck_specs)} decks in {time.perf_counter() - started:.2f} s")
+    if args.trace:
+        print(f"🧵 Trace written: {args.trace}")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Brain-Bridges generator
+
+Times the full build, every slide builder on its own, the hero image
+processing (add_rounded_corners_to_image), icon loading and prs.save() over
+repeated runs, and compares the fastest runs with the committed baseline in
+benchmark_baseline.json. A case that got slower than the threshold is
+reported as a regression (exit code 1), so a slow new slide shows up before
+it is merged.
+
+    python3 benchmarks.py                      # compare with the baseline
+    python3 benchmarks.py --threshold 15       # flag anything >15% slower
+    python3 benchmarks.py --only slide_1 save  # only cases starting with these names
+    python3 benchmarks.py --update-baseline    # store the current numbers as baseline
+
+Timings depend on the machine: update the baseline on the machine that runs
+the comparison, and commit it together with changes that are expected to
+change the numbers.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+import PIL
+import pptx
+from PIL import Image
+
+import generate_pptx
+from design_tokens import *
+
+BASELINE_PATH = "benchmark_baseline.json"
+
+# Default slowdown (in percent of the baseline median) reported as regression
+DEFAULT_THRESHOLD = 25.0
+
+# Differences below this are timer noise, even if the percentage is large
+MIN_DELTA_MS = 2.0
+
+# Icons the builders place with add_picture()
+ICON_PATHS = sorted(set(PROBLEM_ICONS.values()) | {
+    HERO_FEATURE_CHECKMARK_ICON, HERO_STATUS_ICON, PREDICTION_THERMO_ICON,
+    SECURITY_CLOUD_ICON, SECURITY_LOCAL_ICON, ENCRYPTION_LOCK_ICON, ENCRYPTION_UNLOCK_ICON,
+})
+
+# Size of the stand-in hero image when HERO_IMAGE_PATH is not checked out
+SYNTHETIC_HERO_SIZE = (1600, 1200)
+
+
+def _hero_image(work_dir):
+    """Returns HERO_IMAGE_PATH, or a generated image of typical size if the asset is missing"""
+    if os.path.exists(HERO_IMAGE_PATH):
+        return HERO_IMAGE_PATH
+    path = os.path.join(work_dir, "hero.png")
+    if not os.path.exists(path):
+        gradient = Image.linear_gradient("L").resize(SYNTHETIC_HERO_SIZE)
+        Image.merge("RGB", (gradient, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT), gradient)).save(path)
+    return path
+
+
+def _add_icons(prs):
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for path in ICON_PATHS:
+        slide.shapes.add_picture(path, 0, 0, width=HERO_FEATURE_ICON_SIZE)
+
+
+def benchmark_cases(work_dir):
+    """
+    Returns the benchmark cases as dicts with name, setup and run.
+
+    setup() prepares the input for one repetition (not timed), run(input) is timed.
+    """
+    cases = [{
+        "name": "create_presentation",
+        "setup": lambda: None,
+        "run": lambda _: generate_pptx.create_presentation(),
+    }]
+
+    for entry in generate_pptx.SLIDE_REGISTRY:
+        cases.append({
+            "name": f"slide_{entry['number']}_{entry['name']}",
+            "setup": generate_pptx.new_presentation,
+            "run": entry["builder"],
+        })
+
+    hero_image = _hero_image(work_dir)
+    cases.append({
+        "name": "add_rounded_corners_to_image",
+        "setup": lambda: None,
+        "run": lambda _: generate_pptx.add_rounded_corners_to_image(
+            hero_image, HERO_IMAGE_CORNER_RADIUS_PX, HERO_IMAGE_BORDER_COLOR_RGB,
+            int(HERO_IMAGE_BORDER_WIDTH.pt * 1.33)),
+    })
+
+    cases.append({
+        "name": "icon_loading",
+        "setup": generate_pptx.new_presentation,
+        "run": _add_icons,
+    })
+
+    cases.append({
+        "name": "save",
+        "setup": generate_pptx.create_presentation,
+        "run": lambda prs: prs.save(io.BytesIO()),
+    })
+    return cases
+
+
+def run_case(case, repeat):
+    """
+    Runs one warm-up plus `repeat` timed repetitions; returns the timings in ms.
+
+    Like timeit, the garbage collector is paused while a run is timed, so a
+    collection triggered by earlier garbage does not land in a random case.
+    """
+    timings = []
+    for iteration in range(repeat + 1):
+        # Builders print warnings (e.g. missing hero image) - keep them out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = case["setup"]()
+            gc.collect()
+            gc.disable()
+            try:
+                started = time.perf_counter()
+                case["run"](data)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            finally:
+                gc.enable()
+        if iteration > 0:
+            timings.append(elapsed_ms)
+    return timings
+
+
+def run_benchmarks(repeat=10, only=None):
+    """Runs all (or the selected) cases; returns {name: {"median_ms", "min_ms", "runs"}}"""
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for case in benchmark_cases(work_dir):
+            if only and not any(case["name"].startswith(prefix) for prefix in only):
+                continue
+            timings = run_case(case, repeat)
+            results[case["name"]] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "min_ms": round(min(timings), 3),
+                "runs": len(timings),
+            }
+    return results
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "python_pptx": pptx.__version__,
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Returns the stored baseline dict, or None if there is none yet"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_baseline(results, path=BASELINE_PATH):
+    """Stores `results` as the new baseline (cases not measured this time are kept)"""
+    baseline = load_baseline(path) or {"results": {}}
+    baseline["results"].update(results)
+    baseline["updated"] = datetime.now().isoformat(timespec="seconds")
+    baseline["machine"] = machine_info()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    """
+    Compares `results` with the baseline results by the fastest run of each
+    case (the least disturbed by other load on the machine; the median is
+    stored for reference).
+
+    Returns:
+        list of (name, baseline_ms, current_ms, change_percent, regressed) - change is None for new cases
+    """
+    rows = []
+    for name, result in results.items():
+        current_ms = result["min_ms"]
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, current_ms, None, False))
+            continue
+        change = (current_ms / base["min_ms"] - 1) * 100 if base["min_ms"] else 0.0
+        regressed = change > threshold and current_ms - base["min_ms"] > min_delta_ms
+        rows.append((name, base["min_ms"], current_ms, change, regressed))
+    return rows
+
+
+def print_comparison(rows, threshold):
+    print(f"{'case':<40} {'baseline ms':>12} {'current ms':>11} {'change':>8}")
+    print("-" * 74)
+    for name, base_ms, current_ms, change, regressed in rows:
+        base_text = f"{base_ms:12.2f}" if base_ms is not None else f"{'new':>12}"
+        change_text = f"{change:+7.1f}%" if change is not None else ""
+        marker = "  ❌ REGRESSION" if regressed else ""
+        print(f"{name:<40} {base_text} {current_ms:11.2f} {change_text:>8}{marker}")
+    print("-" * 74)
+    regressions = sum(1 for row in rows if row[4])
+    if regressions:
+        print(f"❌ {regressions} case(s) more than {threshold:g}% slower than the baseline")
+    else:
+        print(f"✅ No case more than {threshold:g}% slower than the baseline")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Brain-Bridges generator against the stored baseline")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per case, after one warm-up (default: 10)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown in percent reported as regression (default: {DEFAULT_THRESHOLD:g})")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Only run cases whose name starts with NAME")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"Baseline file (default: {BASELINE_PATH})")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.threshold < 0:
+        parser.error("--threshold must not be negative")
+
+    print(f"⏱️  Running benchmarks ({args.repeat} runs per case)...")
+    results = run_benchmarks(args.repeat, args.only)
+    if not results:
+        parser.error("--only matched no benchmark case")
+
+    if args.update_baseline:
+        write_baseline(results, args.baseline)
+        for name, result in results.items():
+            print(f"{name:<40} {result['min_ms']:11.2f} ms")
+        print(f"💾 Baseline written: {args.baseline}")
+        raise SystemExit(0)
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        parser.error(f"No baseline at {args.baseline} (create one with --update-baseline)")
+    if baseline.get("machine", {}).get("platform") != platform.platform():
+        print(f"⚠️  Baseline was recorded on {baseline.get('machine', {}).get('platform')} - timings may not be comparable")
+
+    rows = compare(results, baseline["results"], args.threshold)
+    print_comparison(rows, args.threshold)
+    raise SystemExit(1 if any(row[4] for row in rows) else 0)
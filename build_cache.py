@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Content-hashed slide cache for incremental rebuilds
+
+Every slide builder gets a fingerprint made from everything it reads:
+- its own source and the source of the helpers it calls
+  (create_autoregression_slide, create_why_now_slide, ...)
+- the current value of every design token / data constant it references
+  (FONT_SIZE_*, ATTENTION_MATRIX_DATA, AUTOREGRESS_STEP_*, ...)
+- the content of every asset file those tokens point to (icons, hero image)
+- the python-pptx and Pillow versions
+
+Unchanged slides are pulled from .build_cache/ as serialized slide XML plus
+media and merged like a parallel build (see parallel_build.py), so editing
+one string in create_slide_22 only rebuilds slide 22.
+"""
+
+import dis
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import os
+import types
+
+import PIL
+import pptx
+
+from parallel_build import export_slide_part, import_slide_part, render_slide_parts
+
+CACHE_DIR = ".build_cache"
+
+# Bump when the cache layout or the fingerprint recipe changes
+CACHE_FORMAT_VERSION = 2
+
+
+# Instructions that read a global name (co_names also holds attribute names like prs.slides)
+_GLOBAL_LOADS = {"LOAD_GLOBAL", "LOAD_NAME"}
+
+
+def _referenced_names(code):
+    """Yields all global names loaded by a code object, including nested functions"""
+    for instruction in dis.get_instructions(code):
+        if instruction.opname in _GLOBAL_LOADS:
+            yield instruction.argval
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _referenced_names(const)
+
+
+@functools.lru_cache(maxsize=1024)
+def _function_source(function):
+    """Returns the source of `function`; memoized because helpers are shared by many slides"""
+    return inspect.getsource(function)
+
+
+def _is_constant(value):
+    """
+    True for design tokens and data constants: plain values, enums, styles and
+    templates (stable repr via FIELDS) and containers of those. Runtime state
+    such as the weak-keyed allocator dicts has no stable repr and is not an input.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, enum.Enum)):
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_constant(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_constant(key) and _is_constant(item) for key, item in value.items())
+    return hasattr(type(value), "FIELDS")
+
+
+def _hash_value(digest, value):
+    """Feeds a token value into `digest`, plus the content of any asset file it points to"""
+    digest.update(repr(value).encode("utf-8"))
+
+    if isinstance(value, str):
+        if os.path.isfile(value):
+            with open(value, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    elif isinstance(value, dict):
+        for item in value.values():
+            _hash_value(digest, item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _hash_value(digest, item)
+
+
+def slide_fingerprint(builder):
+    """
+    Returns the cache key (hex string) for a slide builder.
+
+    Walks the builder and every function of the same module it calls, hashing
+    their source and the values of all design tokens / data constants they
+    load. Private "_" globals are the generator's runtime state (slide
+    allocators, slide totals, caches), not inputs, and are left out.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}|pptx {pptx.__version__}|PIL {PIL.__version__}".encode("utf-8"))
+
+    # Wrappers (e.g. build_trace spans) hash as the function they wrap
+    builder = inspect.unwrap(builder)
+    module_globals = builder.__globals__
+    seen_functions = set()
+    seen_tokens = set()
+    pending = [builder]
+
+    while pending:
+        function = pending.pop()
+        if function.__name__ in seen_functions:
+            continue
+        seen_functions.add(function.__name__)
+        digest.update(_function_source(function).encode("utf-8"))
+
+        for name in sorted(set(_referenced_names(function.__code__))):
+            if name not in module_globals:
+                continue
+            value = module_globals[name]
+            if isinstance(value, types.FunctionType):
+                value = inspect.unwrap(value)
+                # Helpers from the generator itself; library functions are covered by the versions
+                if value.__globals__ is module_globals:
+                    pending.append(value)
+            elif not name.startswith("_") and _is_constant(value) and name not in seen_tokens:
+                seen_tokens.add(name)
+                digest.update(name.encode("utf-8"))
+                _hash_value(digest, value)
+
+    return digest.hexdigest()
+
+
+def load_cached_slide(key, cache_dir=CACHE_DIR):
+    """Returns the cached slide part for `key` (see export_slide_part) or None on a cache miss"""
+    entry_path = os.path.join(cache_dir, "slides", f"{key}.json")
+    if not os.path.exists(entry_path):
+        return None
+
+    try:
+        with open(entry_path, encoding="utf-8") as f:
+            entry = json.load(f)
+        with open(os.path.join(cache_dir, "slides", f"{key}.xml"), "rb") as f:
+            slide_xml = f.read()
+
+        rels = []
+        for rId, reltype, is_external, target in entry["rels"]:
+            if not is_external:
+                with open(os.path.join(cache_dir, "media", target), "rb") as f:
+                    target = f.read()
+            rels.append((rId, reltype, is_external, target))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️  Warning: Ignoring broken cache entry {key[:12]}: {e}")
+        return None
+
+    return {"xml": slide_xml, "rels": rels}
+
+
+def _write_atomic(path, data):
+    """Writes `data` via a temp file + rename, so readers never see partial cache files"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def store_cached_slide(key, slide_data, cache_dir=CACHE_DIR):
+    """Stores a slide part under `key`; media blobs are stored once by content hash"""
+    os.makedirs(os.path.join(cache_dir, "slides"), exist_ok=True)
+    os.makedirs(os.path.join(cache_dir, "media"), exist_ok=True)
+
+    rels = []
+    for rId, reltype, is_external, target in slide_data["rels"]:
+        if not is_external:
+            media_key = hashlib.sha256(target).hexdigest()
+            media_path = os.path.join(cache_dir, "media", media_key)
+            if not os.path.exists(media_path):
+                _write_atomic(media_path, target)
+            target = media_key
+        rels.append((rId, reltype, is_external, target))
+
+    # XML first, entry last: an entry only exists once everything it points to is on disk
+    _write_atomic(os.path.join(cache_dir, "slides", f"{key}.xml"), slide_data["xml"])
+    _write_atomic(
+        os.path.join(cache_dir, "slides", f"{key}.json"),
+        json.dumps({"rels": rels}).encode("utf-8")
+    )
+
+
+def create_presentation_incremental(slides=None, cache_dir=CACHE_DIR, workers=1, memory_cache=None):
+    """
+    Creates the presentation, rebuilding only slides whose inputs changed.
+
+    Args:
+        slides: Registry entries to build (default: the whole deck)
+        cache_dir: Directory holding the slide cache (None = in-memory only)
+        workers: Rebuild cache misses in N worker processes (1 = in-process)
+        memory_cache: Optional {fingerprint: slide part} dict checked before the disk
+            cache and filled with every slide of this build (used by watch mode)
+
+    Returns:
+        (prs, rebuilt) - the presentation and the slide numbers that were rebuilt
+    """
+    import generate_pptx
+
+    if slides is None:
+        slides = generate_pptx.SLIDE_REGISTRY
+
+    if memory_cache is None:
+        memory_cache = {}
+
+    keys = [slide_fingerprint(entry["builder"]) for entry in slides]
+    cached = [memory_cache.get(key) for key in keys]
+    if cache_dir is not None:
+        cached = [slide_data or load_cached_slide(key, cache_dir) for key, slide_data in zip(keys, cached)]
+    missing = [i for i, slide_data in enumerate(cached) if slide_data is None]
+
+    if missing and workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        slide_numbers = [slides[i]["number"] for i in missing]
+        from build_trace import init_worker
+        with ProcessPoolExecutor(max_workers=workers or None, initializer=init_worker) as pool:
+            for i, slide_parts in zip(missing, pool.map(render_slide_parts, slide_numbers)):
+                cached[i] = slide_parts[0]
+                if cache_dir is not None:
+                    store_cached_slide(keys[i], cached[i], cache_dir)
+
+    prs = generate_pptx.new_presentation()
+    for i, entry in enumerate(slides):
+        if cached[i] is not None:
+            import_slide_part(prs, cached[i])
+        else:
+            # Cache miss: build straight into the deck, then keep a copy for next time
+            generate_pptx.build_slide(prs, entry)
+            cached[i] = export_slide_part(prs.slides[-1])
+            if cache_dir is not None:
+                store_cached_slide(keys[i], cached[i], cache_dir)
+        memory_cache[keys[i]] = cached[i]
+
+    generate_pptx.set_slide_total(prs)
+    return prs, [slides[i]["number"] for i in missing]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Render metrics in Prometheus text format and as JSON
+
+Counters and latency histograms for the render service (GET /metrics,
+GET /metrics.json on render_service.py): decks rendered, slides built per
+builder, shapes, media parts and bytes written, slide cache hits and misses,
+and the time per slide builder, per save() and per request.
+
+A metrics store is a plain dict ({"counters": {...}, "histograms": {...}})
+keyed by metric name and labels, so it pickles: render workers record into
+their own store and hand the delta back with every render (take()), the
+server merges the deltas into its store (merge()).
+"""
+
+import bisect
+import contextlib
+import functools
+import time
+
+METRIC_PREFIX = "brainbridges_"
+
+# Upper bounds of the latency histogram buckets in seconds (+Inf is implied)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name: (type, help) - every metric that is recorded, in the order they are exported
+METRICS = {
+    "decks_rendered_total": ("counter", "Decks built and saved"),
+    "render_requests_total": ("counter", "Render requests by response status"),
+    "slides_built_total": ("counter", "Slides built (not taken from the slide cache) per builder"),
+    "slide_cache_hits_total": ("counter", "Slides taken from the slide cache"),
+    "slide_cache_misses_total": ("counter", "Slides that had to be built"),
+    "shapes_total": ("counter", "Shapes in the rendered decks"),
+    "media_parts_total": ("counter", "Media parts (images) in the rendered decks"),
+    "bytes_written_total": ("counter", "Bytes of .pptx written"),
+    "slide_build_seconds": ("histogram", "Time per slide builder call"),
+    "save_seconds": ("histogram", "Time per save() of a deck"),
+    "render_seconds": ("histogram", "Time per render request, including the wait for a worker"),
+}
+
+
+def new_metrics():
+    return {"counters": {}, "histograms": {}}
+
+
+def _new_histogram():
+    # One count per bucket (not cumulative), the last one is +Inf
+    return {"buckets": [0] * (len(LATENCY_BUCKETS) + 1), "sum": 0.0, "count": 0}
+
+
+def _key(name, labels):
+    if name not in METRICS:
+        raise KeyError(f"Unknown metric: {name}")
+    return (name, tuple(sorted(labels.items())))
+
+
+def inc(metrics, name, amount=1, **labels):
+    """Adds `amount` to a counter"""
+    key = _key(name, labels)
+    metrics["counters"][key] = metrics["counters"].get(key, 0) + amount
+
+
+def observe(metrics, name, seconds, **labels):
+    """Records one latency in a histogram"""
+    key = _key(name, labels)
+    histogram = metrics["histograms"].setdefault(key, _new_histogram())
+    histogram["buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+    histogram["sum"] += seconds
+    histogram["count"] += 1
+
+
+def merge(metrics, other):
+    """Adds all counters and histograms of `other` to `metrics`"""
+    for key, value in other["counters"].items():
+        metrics["counters"][key] = metrics["counters"].get(key, 0) + value
+    for key, histogram in other["histograms"].items():
+        target = metrics["histograms"].setdefault(key, _new_histogram())
+        target["buckets"] = [a + b for a, b in zip(target["buckets"], histogram["buckets"])]
+        target["sum"] += histogram["sum"]
+        target["count"] += histogram["count"]
+
+
+def take(metrics):
+    """Returns what `metrics` recorded so far and resets it (the delta a worker hands back)"""
+    delta = {"counters": metrics["counters"], "histograms": metrics["histograms"]}
+    metrics["counters"], metrics["histograms"] = {}, {}
+    return delta
+
+
+def record_deck(metrics, prs, rebuilt, pptx_size, save_seconds):
+    """Records one rendered deck: cache hits/misses, shapes, media parts, bytes and save time"""
+    slides = list(prs.slides)
+    inc(metrics, "decks_rendered_total")
+    inc(metrics, "slide_cache_misses_total", len(rebuilt))
+    inc(metrics, "slide_cache_hits_total", len(slides) - len(rebuilt))
+    inc(metrics, "shapes_total", sum(len(slide.shapes) for slide in slides))
+    inc(metrics, "media_parts_total",
+        sum(1 for part in prs.part.package.iter_parts() if part.partname.startswith("/ppt/media/")))
+    inc(metrics, "bytes_written_total", pptx_size)
+    observe(metrics, "save_seconds", save_seconds)
+
+
+@contextlib.contextmanager
+def instrumented_builders(metrics):
+    """Counts and times every call of a registered slide builder inside the block"""
+    import generate_pptx
+
+    originals = [entry["builder"] for entry in generate_pptx.SLIDE_REGISTRY]
+
+    def instrument(builder):
+        @functools.wraps(builder)
+        def timed(prs):
+            started = time.perf_counter()
+            result = builder(prs)
+            observe(metrics, "slide_build_seconds", time.perf_counter() - started, builder=builder.__name__)
+            inc(metrics, "slides_built_total", builder=builder.__name__)
+            return result
+        return timed
+
+    for entry, builder in zip(generate_pptx.SLIDE_REGISTRY, originals):
+        entry["builder"] = instrument(builder)
+    try:
+        yield
+    finally:
+        for entry, builder in zip(generate_pptx.SLIDE_REGISTRY, originals):
+            entry["builder"] = builder
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def to_prometheus(metrics):
+    """Renders the store in the Prometheus text exposition format (version 0.0.4)"""
+    lines = []
+    for name, (metric_type, help_text) in METRICS.items():
+        full_name = METRIC_PREFIX + name
+        store = metrics["histograms"] if metric_type == "histogram" else metrics["counters"]
+        series = sorted((labels, value) for (metric, labels), value in store.items() if metric == name)
+        if not series:
+            continue
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        for labels, value in series:
+            if metric_type == "counter":
+                lines.append(f"{full_name}{_format_labels(labels)} {value}")
+                continue
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), value["buckets"]):
+                cumulative += count
+                lines.append(f"{full_name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{full_name}_sum{_format_labels(labels)} {value['sum']:.6f}")
+            lines.append(f"{full_name}_count{_format_labels(labels)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def to_json(metrics):
+    """Returns the store as a JSON-serializable snapshot: {name: [{"labels", "value" | histogram}]}"""
+    snapshot = {"latency_buckets": list(LATENCY_BUCKETS)}
+    for name, (metric_type, _) in METRICS.items():
+        store = metrics["histograms"] if metric_type == "histogram" else metrics["counters"]
+        series = []
+        for (metric, labels), value in sorted(store.items()):
+            if metric != name:
+                continue
+            if metric_type == "counter":
+                series.append({"labels": dict(labels), "value": value})
+            else:
+                series.append({"labels": dict(labels), "buckets": value["buckets"],
+                               "sum": round(value["sum"], 6), "count": value["count"]})
+        snapshot[name] = series
+    return snapshot
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Per-slide build profile (python3 generate_pptx.py --profile)
+
+Records for every create_slide_N call and for the save step:
+- wall time and CPU time
+- allocated memory (tracemalloc peak during the step, and what it retained)
+- shape count and serialized XML bytes of the slide (file size for save)
+
+The report is printed as a table sorted by wall time and written as JSON
+(with commit and library versions) so build time can be tracked over commits.
+
+tracemalloc slows allocation-heavy code down several times, so times come from
+the real (untraced) build and memory from a second, traced build of the same
+slides on a scratch presentation.
+"""
+
+import io
+import json
+import os
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+import PIL
+import pptx
+
+import generate_pptx
+from slide_budgets import SHAPE_XPATH
+
+DEFAULT_PROFILE_PATH = "output/Brain-Bridges_PROFILE.json"
+
+
+def _timed(function, *args, **kwargs):
+    """Returns (result, wall_ms, cpu_ms) for function(*args, **kwargs)"""
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - wall_started) * 1000, (time.process_time() - cpu_started) * 1000
+
+
+def _traced(function, *args, **kwargs):
+    """Returns (peak_kb, retained_kb): memory allocated by function(*args, **kwargs) per tracemalloc"""
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    function(*args, **kwargs)
+    memory_after, memory_peak = tracemalloc.get_traced_memory()
+    if started_tracing:
+        tracemalloc.stop()
+    return round((memory_peak - memory_before) / 1024, 1), round((memory_after - memory_before) / 1024, 1)
+
+
+def profile_presentation(slides=None):
+    """
+    Builds the presentation like create_presentation(), measuring every slide builder.
+
+    Slides go through generate_pptx.build_slide(), so they are checked against
+    their budgets (and raise SlideBudgetError with --budgets fail) as in any build.
+
+    Returns:
+        (prs, records) - the presentation and one record per slide
+    """
+    slides = generate_pptx.SLIDE_REGISTRY if slides is None else slides
+    prs = generate_pptx.new_presentation()
+    records = []
+
+    for entry in slides:
+        _, wall_ms, cpu_ms = _timed(generate_pptx.build_slide, prs, entry)
+        slide = prs.slides[-1]
+        records.append({
+            "step": entry["builder"].__name__,
+            "slide": entry["number"],
+            "name": entry["name"],
+            "wall_ms": round(wall_ms, 2),
+            "cpu_ms": round(cpu_ms, 2),
+            "shapes": len(slide.shapes._spTree.xpath(SHAPE_XPATH)),
+            "xml_bytes": len(slide.part.blob),
+        })
+    generate_pptx.set_slide_total(prs)
+
+    # Memory pass: same builders, same order, on a scratch deck
+    scratch = generate_pptx.new_presentation()
+    tracemalloc.start()
+    try:
+        for entry, record in zip(slides, records):
+            record["alloc_peak_kb"], record["alloc_retained_kb"] = _traced(entry["builder"], scratch)
+    finally:
+        tracemalloc.stop()
+
+    return prs, records
+
+
+def profile_save(records, prs, path, reproducible=False):
+    """Saves prs to `path` (atomically) as the profiled "save" step and appends its record"""
+    _, wall_ms, cpu_ms = _timed(generate_pptx.save_atomic, prs, path, reproducible=reproducible)
+    # Serialize once more under tracemalloc, to memory, for the allocation numbers
+    alloc_peak_kb, alloc_retained_kb = _traced(prs.save, io.BytesIO())
+    records.append({
+        "step": "save",
+        "wall_ms": round(wall_ms, 2),
+        "cpu_ms": round(cpu_ms, 2),
+        "alloc_peak_kb": alloc_peak_kb,
+        "alloc_retained_kb": alloc_retained_kb,
+        "shapes": sum(record["shapes"] for record in records),
+        "xml_bytes": os.path.getsize(path),
+    })
+
+
+def print_profile(records):
+    """Prints the records as a table, slowest step first"""
+    header = f"{'step':<28} {'slide':>5} {'wall ms':>9} {'cpu ms':>9} {'peak KB':>9} {'kept KB':>9} {'shapes':>7} {'bytes':>9}"
+    print(header)
+    print("-" * len(header))
+    for record in sorted(records, key=lambda r: r["wall_ms"], reverse=True):
+        print(f"{record['step']:<28} {record.get('slide', ''):>5} {record['wall_ms']:>9.1f} {record['cpu_ms']:>9.1f} "
+              f"{record['alloc_peak_kb']:>9.1f} {record['alloc_retained_kb']:>9.1f} "
+              f"{record.get('shapes', ''):>7} {record.get('xml_bytes', ''):>9}")
+    print("-" * len(header))
+    print(f"{'total':<28} {'':>5} {sum(r['wall_ms'] for r in records):>9.1f} {sum(r['cpu_ms'] for r in records):>9.1f}")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_profile_json(records, path=DEFAULT_PROFILE_PATH):
+    """Writes the records plus build context (commit, versions, time) as JSON"""
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python_pptx": pptx.__version__,
+        "pillow": PIL.__version__,
+        "total_wall_ms": round(sum(r["wall_ms"] for r in records), 2),
+        "steps": records,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Build timeline as Chrome trace-event JSON (python3 generate_pptx.py --trace)
+
+Records nested spans for every slide builder, the image operations
+(Image.open, add_rounded_corners_to_image, add_picture), the save and every
+ZIP member written, with process and thread ids. Open the file in
+chrome://tracing or https://ui.perfetto.dev to see the build as a timeline:
+overlap and idle time of parallel workers, and where I/O stalls the build.
+
+Worker processes (--workers N) trace into per-process files in a temporary
+directory that is passed on via the environment; the parent merges them into
+the final trace. Timestamps come from the monotonic clock, which all
+processes on a machine share.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+
+DEFAULT_TRACE_PATH = "output/Brain-Bridges_TRACE.json"
+
+# Directory for the per-process event files, set while tracing (inherited by worker processes)
+TRACE_DIR_ENV = "BRAIN_BRIDGES_TRACE_DIR"
+
+# Events of this process that are not flushed yet, and the open spans per thread
+_state = {"pid": None, "events": [], "depth": threading.local()}
+_patches = []
+_wrappers = {}
+_lock = threading.Lock()
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000
+
+
+def _flush():
+    """Appends the finished events of this process to its file in the trace directory"""
+    trace_dir = os.environ.get(TRACE_DIR_ENV)
+    with _lock:
+        events, _state["events"] = _state["events"], []
+    if trace_dir and events:
+        with open(os.path.join(trace_dir, f"{os.getpid()}.jsonl"), "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+
+
+@contextlib.contextmanager
+def span(name, category, **args):
+    """Records the enclosed block as one complete ("X") trace event"""
+    if _state["pid"] != os.getpid():
+        # Forked worker: the parent's pending events are not ours to write
+        _state.update(pid=os.getpid(), events=[], depth=threading.local())
+    depth = _state["depth"]
+    depth.value = getattr(depth, "value", 0) + 1
+    started = _now_us()
+    try:
+        yield
+    finally:
+        event = {"name": name, "cat": category, "ph": "X", "ts": started, "dur": _now_us() - started,
+                 "pid": os.getpid(), "tid": threading.get_native_id()}
+        if args:
+            event["args"] = args
+        with _lock:
+            _state["events"].append(event)
+        depth.value -= 1
+        if depth.value == 0:
+            _flush()
+
+
+def _patch(owner, attribute, category, describe=None, name=None):
+    """Replaces owner.attribute (or owner[attribute] for dicts) with a wrapper that records a span per call"""
+    if isinstance(owner, dict):
+        original = owner[attribute]
+    else:
+        # The raw attribute, so classmethods stay classmethods for subclasses
+        original = vars(owner).get(attribute, getattr(owner, attribute))
+    function = original.__func__ if isinstance(original, classmethod) else original
+    if hasattr(function, "__wrapped_by_trace__"):
+        return
+
+    # One wrapper per function: a function imported into several modules must stay the same object to pickle
+    traced = _wrappers.get(function)
+    if traced is None:
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            with span(name or function.__name__, category, **(describe(*args, **kwargs) if describe else {})):
+                return function(*args, **kwargs)
+
+        traced.__wrapped_by_trace__ = True
+        _wrappers[function] = traced
+
+    if isinstance(owner, dict):
+        owner[attribute] = traced
+    else:
+        setattr(owner, attribute, classmethod(traced) if isinstance(original, classmethod) else traced)
+    _patches.append((owner, attribute, original))
+
+
+def _loaded_modules(name):
+    """The module `name` if imported, plus __main__ when that module runs as a script"""
+    main = sys.modules.get("__main__")
+    modules = [sys.modules.get(name)]
+    if os.path.splitext(os.path.basename(getattr(main, "__file__", None) or ""))[0] == name:
+        modules.append(main)
+    return [module for module in modules if module is not None]
+
+
+def _describe_file(file):
+    return {"image": str(file) if isinstance(file, (str, os.PathLike)) else type(file).__name__}
+
+
+def _describe_zip_member(self, zinfo_or_arcname, data, *args, **kwargs):
+    member = getattr(zinfo_or_arcname, "filename", zinfo_or_arcname)
+    return {"member": member, "bytes": len(data)}
+
+
+def install():
+    """Wraps builders, image operations, save and ZIP writes of this process (skips what is wrapped already)"""
+    from PIL import Image
+    from pptx.opc.serialized import PackageWriter
+    from pptx.shapes.shapetree import _BaseGroupShapes
+
+    for module in _loaded_modules("generate_pptx"):
+        for entry in module.SLIDE_REGISTRY:
+            _patch(entry, "builder", "slide", lambda prs, _number=entry["number"]: {"slide": _number})
+        _patch(module, "add_rounded_corners_to_image", "image", lambda image_path, *args, **kwargs: _describe_file(image_path))
+        _patch(module, "save_atomic", "save", lambda prs, path, *args, **kwargs: {"path": path})
+
+    _patch(Image, "open", "image", lambda fp, *args, **kwargs: _describe_file(fp), name="Image.open")
+    _patch(_BaseGroupShapes, "add_picture", "image", lambda shapes, image_file, *args, **kwargs: _describe_file(image_file))
+    _patch(PackageWriter, "write", "save", name="PackageWriter.write")
+    _patch(zipfile.ZipFile, "writestr", "zip", _describe_zip_member, name="ZipFile.writestr")
+
+    # Modules of the other build modes, wrapped where they are in use
+    optional = [
+        ("parallel_build", "render_slide_parts", "worker", lambda slide_number: {"slide": slide_number}),
+        ("parallel_build", "import_slide_part", "merge", None),
+        ("build_cache", "render_slide_parts", "worker", lambda slide_number: {"slide": slide_number}),
+        ("build_cache", "import_slide_part", "merge", None),
+        ("stream_writer", "write_presentation_streaming", "save", lambda path, *args, **kwargs: {"path": path}),
+        ("batch_build", "build_deck", "batch", lambda spec, slide_parts: {"output": spec.get("output")}),
+    ]
+    for module_name, attribute, category, describe in optional:
+        for module in _loaded_modules(module_name):
+            _patch(module, attribute, category, describe)
+
+
+def uninstall():
+    """Restores everything install() wrapped"""
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        if isinstance(owner, dict):
+            owner[attribute] = original
+        else:
+            setattr(owner, attribute, original)
+    _wrappers.clear()
+
+
+def init_worker():
+    """ProcessPoolExecutor initializer: traces the worker if the parent is tracing"""
+    if os.environ.get(TRACE_DIR_ENV):
+        # Spawned workers import the task's module only after the initializer, so import it here
+        import build_cache, generate_pptx, parallel_build  # noqa: F401
+        install()
+
+
+def _metadata_events(events, main_pid):
+    """Names the processes and threads in the trace viewer"""
+    metadata = []
+    for pid in sorted({event["pid"] for event in events}):
+        name = "build" if pid == main_pid else f"worker {pid}"
+        metadata.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}})
+    for pid, tid in sorted({(event["pid"], event["tid"]) for event in events}):
+        name = "main" if tid == pid else f"thread {tid}"
+        metadata.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+    return metadata
+
+
+def write_trace(trace_dir, path):
+    """Merges the per-process event files into one Chrome trace JSON; returns the number of events"""
+    events = []
+    for filename in sorted(os.listdir(trace_dir)):
+        with open(os.path.join(trace_dir, filename), encoding="utf-8") as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    events.sort(key=lambda event: (event["ts"], -event["dur"]))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": _metadata_events(events, os.getpid()) + events, "displayTimeUnit": "ms"}, f)
+    return len(events)
+
+
+@contextlib.contextmanager
+def tracing(path=DEFAULT_TRACE_PATH, name="build"):
+    """
+    Traces everything inside the block (this process and worker processes it
+    starts) and writes the Chrome trace to `path` when the block ends.
+    """
+    trace_dir = tempfile.mkdtemp(prefix="brain-bridges-trace-")
+    os.environ[TRACE_DIR_ENV] = trace_dir
+    install()
+    try:
+        with span(name, "build"):
+            yield
+    finally:
+        uninstall()
+        try:
+            write_trace(trace_dir, path)
+        finally:
+            del os.environ[TRACE_DIR_ENV]
+            shutil.rmtree(trace_dir, ignore_errors=True)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Deck theme: color scheme and fonts from the design tokens
+
+A DeckTheme writes the design tokens into the presentation's theme
+(ppt/theme/theme1.xml): its color scheme, its heading (major) and body
+(minor) font. It also maps the master's colors to dark: background bg1 is
+dk1, the default text color tx1 is lt1.
+
+Text styles compiled against the theme (text_styles.set_theme) then refer
+to it instead of spelling out every run:
+
+    THEME = DeckTheme(THEME_NAME, THEME_COLORS, major_font=THEME_FONT_MAJOR,
+                      minor_font=THEME_FONT_MINOR)
+    THEME.text_color(COLOR_ACCENT_BLUE)   # MSO_THEME_COLOR.ACCENT_1 -> <a:schemeClr val="accent1"/>
+    THEME.text_color(COLOR_TEXT_WHITE)    # None: the default text color, left out
+    THEME.text_font(FONT_FAMILY_TITLE)    # "+mj-lt", the heading font
+    THEME.text_font(FONT_FAMILY_PRIMARY)  # None: the default font, left out
+    THEME.apply(prs)
+"""
+
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+# Order of the slots in <a:clrScheme>
+COLOR_SLOTS = ("dk1", "lt1", "dk2", "lt2", "accent1", "accent2", "accent3", "accent4", "accent5",
+               "accent6", "hlink", "folHlink")
+
+# Master color mapping: light text on a dark background
+DARK_COLOR_MAP = {"bg1": "dk1", "tx1": "lt1", "bg2": "dk2", "tx2": "lt2"}
+
+# Font reference of the theme's heading font
+MAJOR_FONT = "+mj-lt"
+
+
+class DeckTheme:
+    """Color scheme and fonts of the deck, written into the theme part once per presentation"""
+
+    FIELDS = ("name", "colors", "major_font", "minor_font")
+
+    def __init__(self, name, colors, major_font, minor_font):
+        self.name = name
+        self.colors = colors
+        self.major_font = major_font
+        self.minor_font = minor_font
+        # Text refers to dk1/lt1/dk2/lt2 through the master's mapping (bg1, tx1, ...),
+        # the first slot of a color wins (accent1 before hlink)
+        mapped = {slot: name for name, slot in DARK_COLOR_MAP.items()}
+        self._text_colors = {}
+        for slot in COLOR_SLOTS:
+            self._text_colors.setdefault(colors[slot], mapped.get(slot, slot))
+        # Rewritten theme XML per template theme XML
+        self._blobs = {}
+
+    def __repr__(self):
+        # Stable across processes: slide fingerprints (build_cache.py) hash the styles compiled against it
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"DeckTheme({fields})"
+
+    def text_color(self, color):
+        """
+        Returns how text refers to `color`: None for the default text color,
+        the MSO_THEME_COLOR of its slot, or `color` itself if it is not in the theme.
+        """
+        name = self._text_colors.get(color)
+        if name is None:
+            return color
+        if name == "tx1":
+            return None
+        return MSO_THEME_COLOR.from_xml(name)
+
+    def text_font(self, font):
+        """Returns how text refers to `font`: None for the body font, "+mj-lt" for the heading font, else `font`"""
+        if font == self.minor_font:
+            return None
+        if font == self.major_font:
+            return MAJOR_FONT
+        return font
+
+    def _theme_blob(self, blob):
+        """Returns the theme XML `blob` with this theme's name, colors and fonts"""
+        theme = parse_xml(blob)
+        theme.set("name", self.name)
+        elements = theme.find(qn("a:themeElements"))
+
+        clrScheme = elements.find(qn("a:clrScheme"))
+        clrScheme.set("name", self.name)
+        for slot in COLOR_SLOTS:
+            slot_element = clrScheme.find(qn(f"a:{slot}"))
+            slot_element.clear()
+            slot_element.append(parse_xml(f'<a:srgbClr {nsdecls("a")} val="{self.colors[slot]}"/>'))
+
+        fontScheme = elements.find(qn("a:fontScheme"))
+        fontScheme.set("name", self.name)
+        fontScheme.find(qn("a:majorFont")).find(qn("a:latin")).set("typeface", self.major_font)
+        fontScheme.find(qn("a:minorFont")).find(qn("a:latin")).set("typeface", self.minor_font)
+        return serialize_part_xml(theme)
+
+    def apply(self, prs):
+        """Writes the theme into the theme part of `prs` and maps the master's colors to dark"""
+        master = prs.slide_master
+        theme_part = master.part.part_related_by(RT.THEME)
+        blob = theme_part.blob
+        if blob not in self._blobs:
+            self._blobs[blob] = self._theme_blob(blob)
+        theme_part._blob = self._blobs[blob]
+
+        clrMap = master._element.find(qn("p:clrMap"))
+        for name, slot in DARK_COLOR_MAP.items():
+            clrMap.set(name, slot)
+        return prs
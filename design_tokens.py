@@ -61,6 +61,30 @@ FONT_FAMILY_VIOLATION = FONT_FAMILY_MONOSPACE        # Violation text (Menlo mon
 FONT_FAMILY_STAT_NUMBER = FONT_FAMILY_INTER_EXTRALIGHT  # Large stat numbers (font-weight: 200)
 FONT_FAMILY_STAT_LABEL = FONT_FAMILY_INTER_LIGHT        # Stat labels (font-weight: 300)
 
+# =============================================================================
+# THEME (ppt/theme/theme1.xml, see deck_theme.py)
+# =============================================================================
+# Text in these colors and fonts refers to the theme instead of spelling them out,
+# so the deck can be recolored under 'Design' -> 'Variants' in PowerPoint.
+
+THEME_NAME = "Brain Bridges"
+THEME_COLORS = {
+    "dk1": COLOR_BACKGROUND_DARK,      # Slide background
+    "lt1": COLOR_TEXT_WHITE,           # Default text color
+    "dk2": COLOR_BACKGROUND_LIGHT,
+    "lt2": COLOR_TEXT_GRAY,
+    "accent1": COLOR_ACCENT_BLUE,
+    "accent2": COLOR_ACCENT_CYAN,
+    "accent3": COLOR_ACCENT_GREEN,
+    "accent4": COLOR_ACCENT_RED,
+    "accent5": COLOR_ACCENT_PURPLE,
+    "accent6": COLOR_TEXT_GRAY_DARK,
+    "hlink": COLOR_ACCENT_BLUE,
+    "folHlink": COLOR_ACCENT_PURPLE,
+}
+THEME_FONT_MAJOR = FONT_FAMILY_TITLE       # Headings: Inter ExtraLight
+THEME_FONT_MINOR = FONT_FAMILY_PRIMARY     # Body text (default font): Inter Regular
+
 # Logo "BRAIN BRIDGES"
 FONT_SIZE_LOGO = Pt(21)
 FONT_BOLD_LOGO = True
@@ -1043,6 +1067,46 @@ FONT_SIZE_WHY_NOW_BULLET = Pt(9)
 FONT_SIZE_WHY_NOW_INDICATOR = Pt(9)
 FONT_SIZE_WHY_NOW_STEP_NUMBER = Pt(24)
 
+# Data for each slide
+WHY_NOW_STEP_1 = {
+    "number": "1",
+    "title": "AI Infrastructure Maturity",
+    "bullets": [
+        ("Cost Revolution:", "Dramatic hardware price reductions alongside significant power efficiency improvements"),
+        ("Container Management:", "Streamlined deployment and orchestration through Docker containerization technologies"),
+        ("Performance & Memory:", "Remarkable computational performance gains with extensive shared memory capabilities"),
+        ("Form & Operation:", "Ultra-compact form factors enabling whisper-quiet, enterprise-grade operation")
+    ],
+    "indicator": "⚡ TECHNICAL READINESS",
+    "indicator_color": COLOR_WHY_NOW_TECH
+}
+
+WHY_NOW_STEP_2 = {
+    "number": "2",
+    "title": "Knowledge Worker Evolution",
+    "bullets": [
+        ("Phase 1 - Playground:", "ChatGPT experimentation and individual productivity gains"),
+        ("Phase 2 - Copilot:", "AI-assisted workflows and collaborative human-AI work"),
+        ("Phase 3 - Workforce:", "Autonomous AI agents managing organizational knowledge"),
+        ("Current Reality:", "73% of enterprises remain stuck between Phase 1-2")
+    ],
+    "indicator": "📈 MARKET DEMAND",
+    "indicator_color": COLOR_WHY_NOW_MARKET
+}
+
+WHY_NOW_STEP_3 = {
+    "number": "3",
+    "title": "Data Sovereignty Crisis",
+    "bullets": [
+        ("Regulatory Enforcement:", "EU AI Act and GDPR violations creating existential compliance risks"),
+        ("Corporate Barriers:", "Fortune 500 companies cite data residency as primary AI adoption blocker"),
+        ("Market Solution:", "Local plug-and-play AI becoming the gold standard for enterprises"),
+        ("Value Proposition:", "Complete control, zero compliance risk, instant deployment capabilities")
+    ],
+    "indicator": "🏛️ REGULATORY FORCE",
+    "indicator_color": COLOR_WHY_NOW_REGULATORY
+}
+
 # =============================================================================
 # LAYOUT - PLACEHOLDER SLIDES
 # =============================================================================
@@ -9,15 +9,311 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.parts.slide import SlidePart
+from pptx.shapes.autoshape import Shape
 from datetime import datetime
+import argparse
+import contextlib
+import functools
+import io
 import os
-import shutil
+import time
+import weakref
 from PIL import Image, ImageDraw
 
 # Import all design tokens (colors, fonts, layouts)
 from design_tokens import *
+from slide_budgets import SlideBudgetError, check_slide_budget, BUDGET_MODE_ENV, BUDGET_MODES
+from deck_theme import DeckTheme
+from text_styles import TextStyle, set_theme
+from shape_templates import NO_FILL, ShapeTemplate
 
-def add_rounded_corners_to_image(image_path, corner_radius, border_color, border_width, output_path):
+def define_styles():
+    """
+    Defines THEME, the STYLE_* text styles and the SHAPE_* templates from the
+    current design tokens, as module globals. Runs at import, and again in
+    batch_build.token_overrides(), so overridden tokens reach the styles.
+    """
+    global THEME, STYLE_LOGO, STYLE_SLIDE_NUMBER, STYLE_KEYWORD, STYLE_CONTENT_TITLE, STYLE_CONTENT_SUBTITLE
+    global STYLE_PROBLEM_TITLE, STYLE_PROBLEM_DESC, STYLE_PROBLEM_VIOLATION, STYLE_LARGE_STAT_NUMBER
+    global STYLE_LARGE_STAT_LABEL, STYLE_STAT_NUMBER, STYLE_STAT_LABEL, STYLE_STAT_SOURCE, STYLE_HERO_TITLE
+    global STYLE_HERO_SUBTITLE, STYLE_HERO_FEATURE, STYLE_HERO_STATUS, STYLE_HERO_SPEC_LABEL
+    global STYLE_HERO_SPEC_VALUE, STYLE_HERO_DESCRIPTION, STYLE_HERO_DESCRIPTION_BOLD
+    global STYLE_TOKENIZATION_TITLE, STYLE_TOKENIZATION_ARROW, STYLE_TOKENIZATION_TOKEN, STYLE_TOKEN
+    global STYLE_ARROW, STYLE_VECTOR, STYLE_ATTENTION_TITLE, STYLE_ATTENTION_HEADER, STYLE_ATTENTION_SCORE
+    global STYLE_ATTENTION_FOOTNOTE, STYLE_PREDICTION_TITLE, STYLE_PREDICTION_VECTOR_LABEL
+    global STYLE_PREDICTION_ARROW, STYLE_PREDICTION_TOKEN, STYLE_PREDICTION_TOKEN_HIGHEST
+    global STYLE_PREDICTION_VALUE, STYLE_AUTOREGRESS_TITLE, STYLE_AUTOREGRESS_SUBTITLE
+    global STYLE_AUTOREGRESS_TOKEN, STYLE_AUTOREGRESS_TOKEN_NEW, STYLE_AUTOREGRESS_LLM_ARROW
+    global STYLE_SECURITY_TITLE, STYLE_SECURITY_COL_TITLE, STYLE_SECURITY_STEP_NUMBER
+    global STYLE_SECURITY_STEP_TEXT, STYLE_ENCRYPTION_TITLE, STYLE_ENCRYPTION_SUBTITLE
+    global STYLE_ENCRYPTION_STAGE_TITLE, STYLE_ENCRYPTION_STEP_NUMBER, STYLE_ENCRYPTION_PROCESSING
+    global STYLE_ENCRYPTION_DATA, STYLE_PLACEHOLDER, STYLE_CHAT_API_TITLE, STYLE_CHAT_API_BADGE
+    global STYLE_CHAT_API_NOTE, STYLE_CHAT_API_CONTENT, STYLE_DOC_PROC_TITLE, STYLE_DOC_PROC_PDF_HEADER
+    global STYLE_DOC_PROC_ARROW, STYLE_DOC_PROC_CHUNK_LABEL, STYLE_DOC_PROC_VECTOR, STYLE_DOC_PROC_USER_ICON
+    global STYLE_DOC_PROC_QUERY, STYLE_DOC_PROC_QUERY_ARROW, STYLE_DOC_PROC_SEARCH_LABEL
+    global STYLE_DOC_PROC_SEARCH_VECTOR, STYLE_WHY_NOW_TITLE, STYLE_WHY_NOW_SUBTITLE
+    global STYLE_WHY_NOW_STEP_NUMBER, STYLE_WHY_NOW_STEP_TITLE, STYLE_WHY_NOW_INDICATOR
+    global STYLE_WHY_NOW_BULLET_LABEL, STYLE_WHY_NOW_BULLET_TEXT, SHAPE_PROBLEM_CARD, SHAPE_STAT_CARD
+    global SHAPE_TOKENIZATION_TOKEN, SHAPE_TOKEN, SHAPE_VECTOR_CELL, SHAPE_ATTENTION_HEADER
+    global SHAPE_ATTENTION_SCORE, SHAPE_AUTOREGRESS_TOKEN, SHAPE_AUTOREGRESS_TOKEN_NEW
+    global SHAPE_DOC_PROC_VECTOR_CELL, SHAPE_DOC_PROC_SEARCH_CELL, SHAPE_WHY_NOW_CARD, SHAPE_WHY_NOW_CIRCLE
+    global SHAPE_WHY_NOW_INDICATOR
+
+    # =============================================================================
+    # THEME (written into every deck, see deck_theme.py)
+    # =============================================================================
+    # The text styles below compile against it: default color and body font are left
+    # out, theme colors and the heading font are references.
+    THEME = DeckTheme(THEME_NAME, THEME_COLORS, major_font=THEME_FONT_MAJOR, minor_font=THEME_FONT_MINOR)
+    set_theme(THEME)
+
+    # =============================================================================
+    # TEXT STYLES (compiled once from the design tokens, see text_styles.py)
+    # =============================================================================
+    # Styles without a color get it per text box: STYLE_KEYWORD.apply(tf, text, color=...).
+    # python-pptx cannot write letter-spacing, so the FONT_LETTER_SPACING_* tokens are not applied.
+
+    # Master elements
+    STYLE_LOGO = TextStyle(size=FONT_SIZE_LOGO, bold=FONT_BOLD_LOGO, color=FONT_COLOR_LOGO)
+    STYLE_SLIDE_NUMBER = TextStyle(size=FONT_SIZE_SLIDE_NUMBER, bold=FONT_BOLD_SLIDE_NUMBER,
+                                   color=FONT_COLOR_SLIDE_NUMBER, align=PP_ALIGN.RIGHT)
+
+    # Shared headers
+    STYLE_KEYWORD = TextStyle(size=FONT_SIZE_KEYWORD, bold=FONT_BOLD_KEYWORD,
+                              font=FONT_FAMILY_KEYWORD, align=PP_ALIGN.CENTER)
+    STYLE_CONTENT_TITLE = TextStyle(size=FONT_SIZE_CONTENT_TITLE, bold=FONT_BOLD_CONTENT_TITLE,
+                                    color=FONT_COLOR_CONTENT_TITLE, font=FONT_FAMILY_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_CONTENT_SUBTITLE = TextStyle(size=FONT_SIZE_CONTENT_SUBTITLE, bold=FONT_BOLD_CONTENT_SUBTITLE,
+                                       color=FONT_COLOR_CONTENT_SUBTITLE_ALERT, font=FONT_FAMILY_SUBTITLE,
+                                       align=PP_ALIGN.CENTER)
+
+    # Slide 2: Problem cards
+    STYLE_PROBLEM_TITLE = TextStyle(size=FONT_SIZE_PROBLEM_TITLE, bold=FONT_BOLD_PROBLEM_TITLE,
+                                    color=FONT_COLOR_PROBLEM_TITLE, font=FONT_FAMILY_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_PROBLEM_DESC = TextStyle(size=FONT_SIZE_PROBLEM_DESC, bold=FONT_BOLD_PROBLEM_DESC,
+                                   color=FONT_COLOR_PROBLEM_DESC, font=FONT_FAMILY_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_PROBLEM_VIOLATION = TextStyle(size=FONT_SIZE_PROBLEM_VIOLATION, bold=FONT_BOLD_PROBLEM_VIOLATION,
+                                        color=FONT_COLOR_PROBLEM_VIOLATION, font=FONT_FAMILY_VIOLATION,
+                                        align=PP_ALIGN.CENTER)
+
+    # Slide 3: Market stats
+    STYLE_LARGE_STAT_NUMBER = TextStyle(size=FONT_SIZE_LARGE_STAT_NUMBER, bold=False, color=COLOR_ACCENT_CYAN,
+                                        font=FONT_FAMILY_STAT_NUMBER, align=PP_ALIGN.CENTER)
+    STYLE_LARGE_STAT_LABEL = TextStyle(size=FONT_SIZE_LARGE_STAT_LABEL, bold=False, color=COLOR_TEXT_WHITE,
+                                       font=FONT_FAMILY_STAT_LABEL, align=PP_ALIGN.CENTER)
+    STYLE_STAT_NUMBER = TextStyle(size=FONT_SIZE_STAT_NUMBER, bold=False, color=COLOR_ACCENT_CYAN,
+                                  font=FONT_FAMILY_STAT_NUMBER, align=PP_ALIGN.CENTER)
+    STYLE_STAT_LABEL = TextStyle(size=FONT_SIZE_STAT_LABEL, bold=False, color=COLOR_TEXT_WHITE,
+                                 font=FONT_FAMILY_STAT_LABEL, align=PP_ALIGN.CENTER)
+    STYLE_STAT_SOURCE = TextStyle(size=FONT_SIZE_STAT_SOURCE, bold=False, color=FONT_COLOR_STAT_SOURCE,
+                                  font=FONT_FAMILY_PRIMARY, align=PP_ALIGN.CENTER)
+
+    # Slides 5-6: Hero
+    STYLE_HERO_TITLE = TextStyle(size=FONT_SIZE_HERO_TITLE, bold=FONT_BOLD_HERO_TITLE, color=COLOR_ACCENT_BLUE,
+                                 font=FONT_FAMILY_HERO_TITLE)
+    STYLE_HERO_SUBTITLE = TextStyle(size=FONT_SIZE_HERO_SUBTITLE, bold=FONT_BOLD_HERO_SUBTITLE,
+                                    color=FONT_COLOR_HERO_SUBTITLE, font=FONT_FAMILY_HERO_SUBTITLE)
+    STYLE_HERO_FEATURE = TextStyle(size=FONT_SIZE_HERO_FEATURE, color=FONT_COLOR_HERO_FEATURE,
+                                   font=FONT_FAMILY_HERO_FEATURE)
+    STYLE_HERO_STATUS = TextStyle(size=FONT_SIZE_HERO_STATUS, bold=True, color=FONT_COLOR_HERO_STATUS,
+                                  font=FONT_FAMILY_HERO_STATUS, align=PP_ALIGN.CENTER)
+    STYLE_HERO_SPEC_LABEL = TextStyle(size=FONT_SIZE_HERO_SPEC_LABEL, bold=True, color=FONT_COLOR_HERO_SPEC_LABEL,
+                                      font=FONT_FAMILY_HERO_SPEC_LABEL, align=PP_ALIGN.CENTER)
+    STYLE_HERO_SPEC_VALUE = TextStyle(size=FONT_SIZE_HERO_SPEC_VALUE, bold=FONT_BOLD_HERO_SPEC_VALUE,
+                                      color=FONT_COLOR_HERO_SPEC_VALUE, font=FONT_FAMILY_HERO_SPEC_VALUE,
+                                      align=PP_ALIGN.CENTER)
+    # Slide 5 description: plain and bold runs in one paragraph (add_run)
+    STYLE_HERO_DESCRIPTION = TextStyle(size=Pt(14), color=COLOR_TEXT_WHITE, font=FONT_FAMILY_PRIMARY)
+    STYLE_HERO_DESCRIPTION_BOLD = TextStyle(size=Pt(14), bold=True, color=COLOR_TEXT_WHITE, font=FONT_FAMILY_PRIMARY)
+
+    # Slides 8-9: Tokenization and embeddings
+    STYLE_TOKENIZATION_TITLE = TextStyle(size=FONT_SIZE_TOKENIZATION_TITLE, color=FONT_COLOR_TOKENIZATION_TITLE,
+                                         font=FONT_FAMILY_TOKENIZATION_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_TOKENIZATION_ARROW = TextStyle(size=FONT_SIZE_TOKENIZATION_ARROW, color=FONT_COLOR_TOKENIZATION_ARROW,
+                                         align=PP_ALIGN.CENTER)
+    STYLE_TOKENIZATION_TOKEN = TextStyle(size=FONT_SIZE_TOKENIZATION_TOKEN, color=FONT_COLOR_TOKENIZATION_TOKEN,
+                                         font=FONT_FAMILY_TOKENIZATION_TOKEN, align=PP_ALIGN.CENTER)
+    STYLE_TOKEN = TextStyle(size=FONT_SIZE_TOKEN, color=FONT_COLOR_TOKEN, font=FONT_FAMILY_TOKEN, align=PP_ALIGN.CENTER)
+    STYLE_ARROW = TextStyle(size=FONT_SIZE_ARROW, color=FONT_COLOR_ARROW, align=PP_ALIGN.CENTER)
+    STYLE_VECTOR = TextStyle(size=FONT_SIZE_VECTOR, color=FONT_COLOR_VECTOR, font=FONT_FAMILY_VECTOR,
+                             align=PP_ALIGN.CENTER)
+
+    # Slide 10: Attention matrix
+    STYLE_ATTENTION_TITLE = TextStyle(size=FONT_SIZE_ATTENTION_TITLE, color=FONT_COLOR_ATTENTION_TITLE,
+                                      font=FONT_FAMILY_ATTENTION_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_ATTENTION_HEADER = TextStyle(size=FONT_SIZE_ATTENTION_HEADER, color=FONT_COLOR_ATTENTION_HEADER,
+                                       font=FONT_FAMILY_ATTENTION_HEADER, align=PP_ALIGN.CENTER)
+    STYLE_ATTENTION_SCORE = TextStyle(size=FONT_SIZE_ATTENTION_SCORE, font=FONT_FAMILY_ATTENTION_SCORE,
+                                      align=PP_ALIGN.CENTER)
+    STYLE_ATTENTION_FOOTNOTE = TextStyle(size=FONT_SIZE_ATTENTION_FOOTNOTE, italic=True,
+                                         color=FONT_COLOR_ATTENTION_FOOTNOTE, align=PP_ALIGN.RIGHT)
+
+    # Slide 11: Next word prediction
+    STYLE_PREDICTION_TITLE = TextStyle(size=FONT_SIZE_PREDICTION_TITLE, color=FONT_COLOR_PREDICTION_TITLE,
+                                       font=FONT_FAMILY_PREDICTION_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_PREDICTION_VECTOR_LABEL = TextStyle(size=FONT_SIZE_PREDICTION_VECTOR_LABEL,
+                                              color=FONT_COLOR_PREDICTION_VECTOR_LABEL,
+                                              font=FONT_FAMILY_INTER_REGULAR, align=PP_ALIGN.CENTER)
+    STYLE_PREDICTION_ARROW = TextStyle(size=FONT_SIZE_PREDICTION_ARROW, color=FONT_COLOR_PREDICTION_ARROW,
+                                       align=PP_ALIGN.CENTER)
+    STYLE_PREDICTION_TOKEN = TextStyle(size=FONT_SIZE_PREDICTION_TOKEN, color=FONT_COLOR_PREDICTION_TOKEN,
+                                       font=FONT_FAMILY_PREDICTION_TOKEN, align=PP_ALIGN.RIGHT)
+    STYLE_PREDICTION_TOKEN_HIGHEST = TextStyle(size=FONT_SIZE_PREDICTION_TOKEN, bold=True,
+                                               color=FONT_COLOR_PREDICTION_TOKEN_HIGHEST,
+                                               font=FONT_FAMILY_PREDICTION_TOKEN, align=PP_ALIGN.RIGHT)
+    STYLE_PREDICTION_VALUE = TextStyle(size=FONT_SIZE_PREDICTION_VALUE, bold=True, color=FONT_COLOR_PREDICTION_VALUE,
+                                       font=FONT_FAMILY_PREDICTION_VALUE, align=PP_ALIGN.RIGHT)
+
+    # Slides 12-15: Autoregression
+    STYLE_AUTOREGRESS_TITLE = TextStyle(size=FONT_SIZE_AUTOREGRESS_TITLE, color=FONT_COLOR_AUTOREGRESS_TITLE,
+                                        font=FONT_FAMILY_AUTOREGRESS_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_AUTOREGRESS_SUBTITLE = TextStyle(size=FONT_SIZE_AUTOREGRESS_SUBTITLE, color=FONT_COLOR_AUTOREGRESS_SUBTITLE,
+                                           font=FONT_FAMILY_AUTOREGRESS_SUBTITLE, align=PP_ALIGN.CENTER)
+    STYLE_AUTOREGRESS_TOKEN = TextStyle(size=FONT_SIZE_AUTOREGRESS_TOKEN, color=FONT_COLOR_AUTOREGRESS_TOKEN,
+                                        font=FONT_FAMILY_AUTOREGRESS_TOKEN, align=PP_ALIGN.CENTER)
+    STYLE_AUTOREGRESS_TOKEN_NEW = TextStyle(size=FONT_SIZE_AUTOREGRESS_TOKEN, color=FONT_COLOR_AUTOREGRESS_TOKEN_NEW,
+                                            font=FONT_FAMILY_AUTOREGRESS_TOKEN, align=PP_ALIGN.CENTER)
+    STYLE_AUTOREGRESS_LLM_ARROW = TextStyle(size=FONT_SIZE_AUTOREGRESS_LLM_ARROW, color=FONT_COLOR_AUTOREGRESS_LLM_ARROW,
+                                            align=PP_ALIGN.CENTER)
+
+    # Slide 17: Security conflict
+    STYLE_SECURITY_TITLE = TextStyle(size=FONT_SIZE_SECURITY_TITLE, color=FONT_COLOR_SECURITY_TITLE,
+                                     font=FONT_FAMILY_SECURITY_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_SECURITY_COL_TITLE = TextStyle(size=FONT_SIZE_SECURITY_COL_TITLE, bold=True,
+                                         font=FONT_FAMILY_SECURITY_COL_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_SECURITY_STEP_NUMBER = TextStyle(size=FONT_SIZE_SECURITY_STEP_NUMBER, bold=True,
+                                           font=FONT_FAMILY_SECURITY_STEP, align=PP_ALIGN.CENTER)
+    STYLE_SECURITY_STEP_TEXT = TextStyle(size=FONT_SIZE_SECURITY_STEP_TEXT, color=COLOR_TEXT_WHITE,
+                                         font=FONT_FAMILY_SECURITY_STEP, align=PP_ALIGN.LEFT)
+
+    # Slide 18: Encryption dilemma
+    STYLE_ENCRYPTION_TITLE = TextStyle(size=FONT_SIZE_ENCRYPTION_TITLE, color=FONT_COLOR_ENCRYPTION_TITLE,
+                                       font=FONT_FAMILY_ENCRYPTION_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_ENCRYPTION_SUBTITLE = TextStyle(size=FONT_SIZE_ENCRYPTION_SUBTITLE, color=FONT_COLOR_CONTENT_SUBTITLE_ALERT,
+                                          font=FONT_FAMILY_SUBTITLE, align=PP_ALIGN.CENTER)
+    STYLE_ENCRYPTION_STAGE_TITLE = TextStyle(size=FONT_SIZE_ENCRYPTION_STAGE_TITLE,
+                                             font=FONT_FAMILY_ENCRYPTION_STAGE_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_ENCRYPTION_STEP_NUMBER = TextStyle(size=FONT_SIZE_ENCRYPTION_STEP_NUMBER, bold=True,
+                                             color=COLOR_ENCRYPTION_STEP_NUMBER_TEXT,
+                                             font=FONT_FAMILY_ENCRYPTION_STAGE_TITLE, align=PP_ALIGN.CENTER)
+    STYLE_ENCRYPTION_PROCESSING = TextStyle(size=FONT_SIZE_ENCRYPTION_PROCESSING, color=COLOR_ENCRYPTION_INFERENCE,
+                                            font=FONT_FAMILY_INTER_REGULAR, align=PP_ALIGN.CENTER)
+    STYLE_ENCRYPTION_DATA = TextStyle(size=FONT_SIZE_ENCRYPTION_DATA, bold=True, font=FONT_FAMILY_INTER_REGULAR,
+                                      align=PP_ALIGN.CENTER)
+
+    STYLE_PLACEHOLDER = TextStyle(size=FONT_SIZE_PLACEHOLDER, color=FONT_COLOR_PLACEHOLDER, align=PP_ALIGN.CENTER)
+
+    # Slides 19-20: Chat API
+    STYLE_CHAT_API_TITLE = TextStyle(size=FONT_SIZE_CHAT_API_TITLE, color=FONT_COLOR_CHAT_API_TITLE,
+                                     font=FONT_FAMILY_INTER_EXTRALIGHT, align=PP_ALIGN.CENTER)
+    STYLE_CHAT_API_BADGE = TextStyle(size=FONT_SIZE_CHAT_API_BADGE, bold=True, font=FONT_FAMILY_INTER_REGULAR,
+                                     align=PP_ALIGN.CENTER)
+    STYLE_CHAT_API_NOTE = TextStyle(size=FONT_SIZE_CHAT_API_NOTE, color=FONT_COLOR_CHAT_API_NOTE,
+                                    font=FONT_FAMILY_INTER_REGULAR, align=PP_ALIGN.LEFT)
+    STYLE_CHAT_API_CONTENT = TextStyle(size=FONT_SIZE_CHAT_API_CONTENT, color=FONT_COLOR_CHAT_API_CONTENT,
+                                       font=FONT_FAMILY_INTER_REGULAR, align=PP_ALIGN.LEFT)
+
+    # Slide 22: Document processing
+    STYLE_DOC_PROC_TITLE = TextStyle(size=FONT_SIZE_CONTENT_TITLE, bold=FONT_BOLD_CONTENT_TITLE,
+                                     color=FONT_COLOR_CONTENT_TITLE, font=FONT_FAMILY_INTER_SEMIBOLD,
+                                     align=PP_ALIGN.CENTER)
+    STYLE_DOC_PROC_PDF_HEADER = TextStyle(size=FONT_SIZE_DOC_PROC_PDF_HEADER, bold=True, font=FONT_FAMILY_INTER_SEMIBOLD)
+    STYLE_DOC_PROC_ARROW = TextStyle(size=DOC_PROC_ARROW_SIZE, color=COLOR_ACCENT_BLUE, align=PP_ALIGN.CENTER)
+    STYLE_DOC_PROC_CHUNK_LABEL = TextStyle(size=FONT_SIZE_DOC_PROC_LABEL, bold=True, color=COLOR_ACCENT_BLUE,
+                                           font=FONT_FAMILY_INTER_SEMIBOLD, align=PP_ALIGN.RIGHT)
+    STYLE_DOC_PROC_VECTOR = TextStyle(size=FONT_SIZE_DOC_PROC_VECTOR, color=COLOR_TEXT_GRAY,
+                                      font=FONT_FAMILY_MONOSPACE, align=PP_ALIGN.CENTER)
+    STYLE_DOC_PROC_USER_ICON = TextStyle(size=Pt(20), align=PP_ALIGN.CENTER)
+    STYLE_DOC_PROC_QUERY = TextStyle(size=FONT_SIZE_DOC_PROC_QUERY, italic=True, color=COLOR_TEXT_WHITE,
+                                     font=FONT_FAMILY_INTER_REGULAR, align=PP_ALIGN.LEFT)
+    STYLE_DOC_PROC_QUERY_ARROW = TextStyle(size=Pt(36), color=COLOR_ACCENT_BLUE, align=PP_ALIGN.CENTER)
+    STYLE_DOC_PROC_SEARCH_LABEL = TextStyle(size=FONT_SIZE_DOC_PROC_LABEL, bold=True, color=COLOR_ACCENT_BLUE,
+                                            font=FONT_FAMILY_INTER_SEMIBOLD, align=PP_ALIGN.LEFT)
+    STYLE_DOC_PROC_SEARCH_VECTOR = TextStyle(size=FONT_SIZE_DOC_PROC_VECTOR, bold=True, color=COLOR_ACCENT_BLUE,
+                                             font=FONT_FAMILY_MONOSPACE, align=PP_ALIGN.CENTER)
+
+    # Slides 23-25: Why now
+    STYLE_WHY_NOW_TITLE = TextStyle(size=FONT_SIZE_WHY_NOW_TITLE, bold=True, color=COLOR_ACCENT_BLUE,
+                                    font=FONT_FAMILY_INTER_BOLD, align=PP_ALIGN.CENTER)
+    STYLE_WHY_NOW_SUBTITLE = TextStyle(size=FONT_SIZE_WHY_NOW_SUBTITLE, bold=True, color=COLOR_ACCENT_BLUE,
+                                       font=FONT_FAMILY_MONOSPACE, align=PP_ALIGN.CENTER)
+    STYLE_WHY_NOW_STEP_NUMBER = TextStyle(size=FONT_SIZE_WHY_NOW_STEP_NUMBER, bold=True, color=COLOR_TEXT_WHITE,
+                                          font=FONT_FAMILY_INTER_BOLD, align=PP_ALIGN.CENTER)
+    STYLE_WHY_NOW_STEP_TITLE = TextStyle(size=FONT_SIZE_WHY_NOW_STEP_TITLE, bold=True, color=COLOR_TEXT_WHITE,
+                                         font=FONT_FAMILY_INTER_SEMIBOLD)
+    STYLE_WHY_NOW_INDICATOR = TextStyle(size=FONT_SIZE_WHY_NOW_INDICATOR, bold=True, font=FONT_FAMILY_INTER_SEMIBOLD,
+                                        align=PP_ALIGN.CENTER)
+    # Bullets: bold label and text in one paragraph (add_run)
+    STYLE_WHY_NOW_BULLET_LABEL = TextStyle(size=FONT_SIZE_WHY_NOW_BULLET, bold=True, color=COLOR_TEXT_WHITE,
+                                           font=FONT_FAMILY_INTER_SEMIBOLD)
+    STYLE_WHY_NOW_BULLET_TEXT = TextStyle(size=FONT_SIZE_WHY_NOW_BULLET, color=COLOR_TEXT_GRAY,
+                                          font=FONT_FAMILY_INTER_REGULAR)
+
+    # =============================================================================
+    # SHAPE TEMPLATES (repeated cards, cells and token boxes, see shape_templates.py)
+    # =============================================================================
+    # Colors given per shape override the template's: SHAPE_X.stamp(..., fill=..., line=..., text_color=...).
+
+    # Slides 2-3: Problem and stat cards
+    SHAPE_PROBLEM_CARD = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=PROBLEM_CARD_FILL_COLOR,
+                                       line=PROBLEM_CARD_BORDER_COLOR, line_width=PROBLEM_CARD_BORDER_WIDTH,
+                                       adjustment=0.05)
+    SHAPE_STAT_CARD = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=STAT_CARD_FILL_COLOR,
+                                    line=STAT_CARD_BORDER_COLOR, line_width=STAT_CARD_BORDER_WIDTH, adjustment=0.05)
+
+    # Slides 8-10: Tokens, vectors, attention matrix
+    SHAPE_TOKENIZATION_TOKEN = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=TOKENIZATION_TOKEN_FILL_COLOR,
+                                             line=TOKENIZATION_TOKEN_BORDER_COLOR,
+                                             line_width=TOKENIZATION_TOKEN_BORDER_WIDTH,
+                                             text_style=STYLE_TOKENIZATION_TOKEN, vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_TOKEN = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=TOKEN_BOX_FILL_COLOR, line=TOKEN_BOX_BORDER_COLOR,
+                                line_width=TOKEN_BOX_BORDER_WIDTH, text_style=STYLE_TOKEN,
+                                vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_VECTOR_CELL = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=VECTOR_CELL_FILL_COLOR,
+                                      line=VECTOR_CELL_BORDER_COLOR, line_width=VECTOR_CELL_BORDER_WIDTH,
+                                      text_style=STYLE_VECTOR, vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_ATTENTION_HEADER = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=ATTENTION_HEADER_FILL_COLOR,
+                                           line=ATTENTION_HEADER_BORDER_COLOR, line_width=ATTENTION_CELL_BORDER_WIDTH,
+                                           text_style=STYLE_ATTENTION_HEADER, vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_ATTENTION_SCORE = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=ATTENTION_SCORE_LOW_FILL,
+                                          line=ATTENTION_SCORE_LOW_BORDER, line_width=ATTENTION_CELL_BORDER_WIDTH,
+                                          text_style=STYLE_ATTENTION_SCORE, vertical_anchor=MSO_ANCHOR.MIDDLE)
+
+    # Slides 12-16: Autoregression
+    SHAPE_AUTOREGRESS_TOKEN = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=AUTOREGRESS_TOKEN_FILL_COLOR,
+                                            line=AUTOREGRESS_TOKEN_BORDER_COLOR,
+                                            line_width=AUTOREGRESS_TOKEN_BORDER_WIDTH,
+                                            text_style=STYLE_AUTOREGRESS_TOKEN, vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_AUTOREGRESS_TOKEN_NEW = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=AUTOREGRESS_TOKEN_NEW_FILL,
+                                                line=AUTOREGRESS_TOKEN_NEW_BORDER,
+                                                line_width=AUTOREGRESS_TOKEN_BORDER_WIDTH,
+                                                text_style=STYLE_AUTOREGRESS_TOKEN_NEW, vertical_anchor=MSO_ANCHOR.MIDDLE)
+
+    # Slide 22: Document processing
+    SHAPE_DOC_PROC_VECTOR_CELL = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=COLOR_BACKGROUND_LIGHT,
+                                               line=RGBColor(64, 64, 64), line_width=Pt(1),
+                                               text_style=STYLE_DOC_PROC_VECTOR, vertical_anchor=MSO_ANCHOR.MIDDLE)
+    SHAPE_DOC_PROC_SEARCH_CELL = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=RGBColor(30, 60, 90),
+                                               line=COLOR_ACCENT_BLUE, line_width=Pt(2),
+                                               text_style=STYLE_DOC_PROC_SEARCH_VECTOR,
+                                               vertical_anchor=MSO_ANCHOR.MIDDLE)
+
+    # Slides 23-25: Why now (indicator border color per step)
+    SHAPE_WHY_NOW_CARD = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=RGBColor(31, 41, 55), line=RGBColor(64, 64, 64),
+                                       line_width=WHY_NOW_CARD_BORDER_WIDTH, adjustment=0.08)
+    SHAPE_WHY_NOW_CIRCLE = ShapeTemplate(MSO_SHAPE.OVAL, fill=COLOR_ACCENT_BLUE, line_width=Pt(0))
+    SHAPE_WHY_NOW_INDICATOR = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=NO_FILL, line_width=Pt(1),
+                                            adjustment=0.25)
+
+define_styles()
+
+def add_rounded_corners_to_image(image_path, corner_radius, border_color, border_width, output_path=None):
     """
     Add rounded corners and border to an image using PIL.
 
@@ -26,7 +322,11 @@ def add_rounded_corners_to_image(image_path, corner_radius, border_color, border
         corner_radius: Radius of corners in pixels
         border_color: RGB tuple for border (e.g., (77, 171, 247))
         border_width: Border width in pixels
-        output_path: Path to save modified image
+        output_path: Path to save modified image; None returns the PNG in memory
+            (io.BytesIO), so concurrent builds never share a file
+
+    Returns:
+        output_path, or the in-memory PNG
     """
     # Open image
     img = Image.open(image_path).convert("RGBA")
@@ -60,61 +360,158 @@ def add_rounded_corners_to_image(image_path, corner_radius, border_color, border
         width=border_width
     )
 
-    # Save with transparency
-    new_img.save(output_path, "PNG")
+    if output_path is None:
+        stream = io.BytesIO()
+        new_img.save(stream, "PNG")
+        stream.seek(0)
+        return stream
+
+    # Save with transparency (write + rename, so parallel builds never read a half-written file)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    new_img.save(tmp_path, "PNG")
+    os.replace(tmp_path, output_path)
     return output_path
 
-def apply_master_elements(slide, slide_num, total_slides=17):
+# Slide allocation state per presentation part, see _slide_allocator()
+_slide_allocators = weakref.WeakKeyDictionary()
+
+def _slide_allocator(prs):
+    """
+    Returns the running counters for new slides of `prs`: slide count (for the
+    partname), next slide id and the last p:sldId element added.
+
+    If the slide list no longer ends with the element we added last (slides were
+    added or removed by other code), the counters are recomputed once.
+    """
+    sldIdLst = prs.element.get_or_add_sldIdLst()
+    try:
+        last_sldId = sldIdLst[-1]
+    except IndexError:
+        last_sldId = None
+
+    allocator = _slide_allocators.get(prs.part)
+    if allocator is None or allocator["last_sldId"] is not last_sldId:
+        slide_ids = [sldId.id for sldId in sldIdLst.sldId_lst]
+        allocator = {
+            "sldIdLst": sldIdLst,
+            "count": len(slide_ids),
+            "next_id": max(slide_ids, default=255) + 1,
+            "last_sldId": last_sldId,
+            "layouts": {},
+        }
+        _slide_allocators[prs.part] = allocator
+    return allocator
+
+def next_slide_partname(prs):
+    """Partname for the next slide of `prs` (/ppt/slides/slideN.xml), like python-pptx assigns it"""
+    return PackURI(f"/ppt/slides/slide{_slide_allocator(prs)['count'] + 1}.xml")
+
+def append_slide_part(prs, slide_part):
+    """
+    Appends `slide_part` (named with next_slide_partname()) to the slide list of
+    `prs`: relationship from the presentation plus a p:sldId entry.
+
+    prs.slides.add_slide() searches all existing relationships for one to reuse
+    and all slide ids for the highest one; for a new part neither is needed,
+    so both come from the allocator's counters instead.
+    """
+    allocator = _slide_allocator(prs)
+    rId = prs.part.rels._add_relationship(RT.SLIDE, slide_part)
+    allocator["last_sldId"] = allocator["sldIdLst"]._add_sldId(id=allocator["next_id"], rId=rId)
+    allocator["next_id"] += 1
+    allocator["count"] += 1
+    return rId
+
+def add_blank_slide(prs, layout_index=6):
+    """
+    Adds a slide with layout `layout_index` (6 = blank), like
+    prs.slides.add_slide(prs.slide_layouts[layout_index]), in constant time.
+
+    prs.slides renames every slide part on each access and add_slide() scans all
+    slides for the next id, which makes building N slides O(N²).
+
+    Shape ids come from a per-slide counter as well (python-pptx's turbo-add
+    mode): without it every add_shape/add_textbox scans all ids on the slide,
+    which makes dense slides O(shapes²). The counter only sees shapes added to
+    slide.shapes - a group shape would have to switch it off first
+    (slide.shapes.turbo_add_enabled = False).
     """
-    Applies master elements to a slide:
+    layouts = _slide_allocator(prs)["layouts"]
+    if layout_index not in layouts:
+        layouts[layout_index] = prs.slide_layouts[layout_index]
+    slide_layout = layouts[layout_index]
+
+    slide_part = SlidePart.new(next_slide_partname(prs), prs.part.package, slide_layout.part)
+    append_slide_part(prs, slide_part)
+    slide = slide_part.slide
+    slide.shapes.clone_layout_placeholders(slide_layout)
+    slide.shapes.turbo_add_enabled = True
+    return slide
+
+# Slide counter on the master: slide number field, then the deck's slide count ("9/25").
+# "‹#›" is what the field shows on the master itself; every slide shows its own number.
+SLIDE_COUNTER_PARAGRAPH = (
+    f'<a:p {nsdecls("a")}><a:fld id="{{8F3D2A61-5C47-4E0B-9B6A-2D1E7C4F0A93}}" type="slidenum">'
+    '<a:t>\u2039#\u203a</a:t></a:fld><a:r><a:t>/00</a:t></a:r></a:p>'
+)
+
+# The slide count text (<a:t> after the field) in the master's counter
+SLIDE_TOTAL_XPATH = ("./p:cSld/p:spTree/p:sp[p:nvSpPr/p:cNvPr/@name='Slide Counter']"
+                     "//a:p[a:fld[@type='slidenum']]/a:r/a:t")
+
+def apply_slide_master(prs):
+    """
+    Turns the template's slide master into the Brain-Bridges master, once per presentation:
     - Background color
     - Logo "BRAIN BRIDGES" top left
-    - Slide counter top right
+    - Slide counter top right: PowerPoint's slide number field plus the slide count
 
-    This function simulates a Slide Master, since python-pptx
-    does not allow direct master editing.
+    Every layout (and so every slide) inherits all three from the master, so
+    slides carry none of them and stay valid when slides are inserted or
+    reordered. Edit them in PowerPoint under 'View' -> 'Slide Master'.
     """
+    master = prs.slide_master
 
-    # Set background color
-    background = slide.background
-    fill = background.fill
+    # Background color
+    fill = master.background.fill
     fill.solid()
     fill.fore_color.rgb = COLOR_BACKGROUND_DARK
 
     # Logo "BRAIN BRIDGES" top left (without "v: xii")
-    logo_box = slide.shapes.add_textbox(
-        LOGO_X, LOGO_Y,
-        LOGO_WIDTH, LOGO_HEIGHT
-    )
-    logo_frame = logo_box.text_frame
-    logo_frame.text = LOGO_TEXT
-    logo_p = logo_frame.paragraphs[0]
-    logo_p.font.size = FONT_SIZE_LOGO
-    logo_p.font.bold = FONT_BOLD_LOGO
-    logo_p.font.color.rgb = FONT_COLOR_LOGO
-    # Letter-spacing
-    for run in logo_p.runs:
-        run.font.character_spacing = FONT_LETTER_SPACING_LOGO
-
-    # Slide counter top right
-    num_box = slide.shapes.add_textbox(
-        SLIDE_NUMBER_X, SLIDE_NUMBER_Y,
-        SLIDE_NUMBER_WIDTH, SLIDE_NUMBER_HEIGHT
-    )
-    num_frame = num_box.text_frame
-    num_frame.text = f"{slide_num:02d}/{total_slides:02d}"
-    num_p = num_frame.paragraphs[0]
-    num_p.alignment = PP_ALIGN.RIGHT
-    num_p.font.size = FONT_SIZE_SLIDE_NUMBER
-    num_p.font.bold = FONT_BOLD_SLIDE_NUMBER
-    num_p.font.color.rgb = FONT_COLOR_SLIDE_NUMBER
-    
-    return slide
+    spTree = master.shapes._spTree
+    # Not spTree.max_shape_id: on a master that also counts the (much larger) layout ids
+    logo_id = max(int(shape_id) for shape_id in spTree.xpath(".//p:cNvPr/@id")) + 1
+    logo = CT_Shape.new_textbox_sp(logo_id, "Logo", LOGO_X, LOGO_Y, LOGO_WIDTH, LOGO_HEIGHT)
+    spTree.insert_element_before(logo, "p:extLst")
+    STYLE_LOGO.apply(Shape(logo, None).text_frame, LOGO_TEXT)
+
+    # Slide counter top right, formatted by its list style, so field and count look the same
+    counter = CT_Shape.new_textbox_sp(logo_id + 1, "Slide Counter", SLIDE_NUMBER_X, SLIDE_NUMBER_Y,
+                                      SLIDE_NUMBER_WIDTH, SLIDE_NUMBER_HEIGHT)
+    spTree.insert_element_before(counter, "p:extLst")
+    txBody = counter.txBody
+    txBody.replace(txBody.find(qn("a:lstStyle")), STYLE_SLIDE_NUMBER.list_style())
+    paragraph = parse_xml(SLIDE_COUNTER_PARAGRAPH)
+    txBody.replace(txBody.p_lst[0], paragraph)
+    return prs
+
+def set_slide_total(prs, total=None):
+    """
+    Writes the deck's slide count into the master's slide counter ("/25").
+
+    Called once all slides exist (create_presentation() and the other build
+    paths); `total` defaults to the number of slides in prs, the stream writer
+    passes its own. Decks without the Brain-Bridges master have no counter.
+    """
+    if total is None:
+        total = len(prs.element.get_or_add_sldIdLst())
+    for total_text in prs.slide_master.element.xpath(SLIDE_TOTAL_XPATH):
+        total_text.text = f"/{total:02d}"
+    return prs
 
 def create_slide_1(prs):
     """Slide 1: THE AI PARADOX"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 1, 25)
+    slide = add_blank_slide(prs)
 
     # The three keywords - using KEYWORD_THEME_PROBLEM
     keywords = [
@@ -130,59 +527,27 @@ def create_slide_1(prs):
             KEYWORD_BOX_X, Inches(y_pos),
             KEYWORD_BOX_WIDTH, KEYWORD_BOX_HEIGHT
         )
-        tf = keyword_box.text_frame
-        tf.text = keyword["text"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_KEYWORD
-        p.font.bold = FONT_BOLD_KEYWORD
-        p.font.color.rgb = keyword["color"]
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_KEYWORD  # Inter ExtraLight (font-weight: 200)
-            run.font.character_spacing = FONT_LETTER_SPACING_KEYWORD
+        STYLE_KEYWORD.apply(keyword_box.text_frame, keyword["text"], color=keyword["color"])
 
     return prs
 
 def create_slide_2(prs):
     """Slide 2: Organisations want AI"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 2, 25)
+    slide = add_blank_slide(prs)
 
     # Fixed header
     title_box = slide.shapes.add_textbox(
         CONTENT_HEADER_X, CONTENT_HEADER_Y,
         CONTENT_HEADER_WIDTH, CONTENT_HEADER_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "Organisations want AI"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CONTENT_TITLE
-    p.font.bold = FONT_BOLD_CONTENT_TITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_TITLE
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_TITLE  # Inter ExtraLight (font-weight: 200)
+    STYLE_CONTENT_TITLE.apply(title_box.text_frame, "Organisations want AI")
 
     # Subtitle
     subtitle_box = slide.shapes.add_textbox(
         CONTENT_SUBTITLE_X, CONTENT_SUBTITLE_Y,
         CONTENT_SUBTITLE_WIDTH, CONTENT_SUBTITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = "but can't have it ¯\\_(ツ)_/¯"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CONTENT_SUBTITLE
-    p.font.bold = FONT_BOLD_CONTENT_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_SUBTITLE_ALERT
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SUBTITLE  # Menlo (monospace)
+    STYLE_CONTENT_SUBTITLE.apply(subtitle_box.text_frame, "but can't have it ¯\\_(ツ)_/¯")
 
     # Problem items grid with PNG icons
     problems = [
@@ -223,19 +588,7 @@ def create_slide_2(prs):
         box_height = Inches(PROBLEM_GRID_BOX_HEIGHT)
 
         # Card background with rounded corners and border
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            x, y_start,
-            box_width, box_height
-        )
-        # Fill
-        card.fill.solid()
-        card.fill.fore_color.rgb = PROBLEM_CARD_FILL_COLOR
-        # Border
-        card.line.color.rgb = PROBLEM_CARD_BORDER_COLOR
-        card.line.width = PROBLEM_CARD_BORDER_WIDTH
-        # Rounded corners
-        card.adjustments[0] = 0.05  # Corner radius adjustment
+        SHAPE_PROBLEM_CARD.stamp(slide.shapes, x, y_start, box_width, box_height)
 
         # Icon (PNG image)
         icon_x = x + Inches(PROBLEM_ICON_X_OFFSET)
@@ -253,17 +606,7 @@ def create_slide_2(prs):
             x, y_start + Inches(PROBLEM_TITLE_Y_OFFSET),
             box_width, Inches(PROBLEM_TITLE_HEIGHT)
         )
-        tf = title_box.text_frame
-        tf.text = problem["title"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_PROBLEM_TITLE
-        p.font.bold = FONT_BOLD_PROBLEM_TITLE
-        p.font.color.rgb = FONT_COLOR_PROBLEM_TITLE
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_TITLE  # Inter ExtraLight (font-weight: 200)
+        STYLE_PROBLEM_TITLE.apply(title_box.text_frame, problem["title"])
 
         # Description
         desc_box = slide.shapes.add_textbox(
@@ -271,109 +614,49 @@ def create_slide_2(prs):
             box_width, Inches(PROBLEM_DESC_HEIGHT)
         )
         tf = desc_box.text_frame
-        tf.text = problem["desc"]
+        STYLE_PROBLEM_DESC.apply(tf, problem["desc"])
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_PROBLEM_DESC
-        p.font.bold = FONT_BOLD_PROBLEM_DESC
-        p.font.color.rgb = FONT_COLOR_PROBLEM_DESC
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_TITLE  # Same as title (Inter ExtraLight)
 
         # Violation
         viol_box = slide.shapes.add_textbox(
             x, y_start + Inches(PROBLEM_VIOLATION_Y_OFFSET),
             box_width, Inches(PROBLEM_VIOLATION_HEIGHT)
         )
-        tf = viol_box.text_frame
-        tf.text = problem["violation"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_PROBLEM_VIOLATION
-        p.font.bold = FONT_BOLD_PROBLEM_VIOLATION
-        p.font.color.rgb = FONT_COLOR_PROBLEM_VIOLATION
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_VIOLATION  # Menlo (monospace)
+        STYLE_PROBLEM_VIOLATION.apply(viol_box.text_frame, problem["violation"])
 
     return prs
 
 def create_slide_3(prs):
     """Slide 3: Market Reality"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 3, 25)
+    slide = add_blank_slide(prs)
 
     # Fixed header
     title_box = slide.shapes.add_textbox(
         CONTENT_HEADER_X, CONTENT_HEADER_Y,
         CONTENT_HEADER_WIDTH, CONTENT_HEADER_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "Market Reality"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CONTENT_TITLE
-    p.font.bold = FONT_BOLD_CONTENT_TITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_TITLE
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_TITLE  # Inter ExtraLight (font-weight: 200)
+    STYLE_CONTENT_TITLE.apply(title_box.text_frame, "Market Reality")
 
     # Subtitle
     subtitle_box = slide.shapes.add_textbox(
         CONTENT_SUBTITLE_X, CONTENT_SUBTITLE_Y,
         CONTENT_SUBTITLE_WIDTH, CONTENT_SUBTITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = "Massive demand blocked by fundamental constraints"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CONTENT_SUBTITLE
-    p.font.bold = FONT_BOLD_CONTENT_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_SUBTITLE_ALERT  # Red like Slide 2
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SUBTITLE  # Menlo monospace like Slide 2
+    STYLE_CONTENT_SUBTITLE.apply(subtitle_box.text_frame, "Massive demand blocked by fundamental constraints")
 
     # Large stat: $1.7T
     large_stat_box = slide.shapes.add_textbox(
         LARGE_STAT_X, LARGE_STAT_Y,
         LARGE_STAT_WIDTH, LARGE_STAT_HEIGHT
     )
-    tf = large_stat_box.text_frame
-    tf.text = "$1.7T"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_LARGE_STAT_NUMBER
-    p.font.bold = False
-    p.font.color.rgb = COLOR_ACCENT_CYAN
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_STAT_NUMBER  # Inter ExtraLight (font-weight: 200)
+    STYLE_LARGE_STAT_NUMBER.apply(large_stat_box.text_frame, "$1.7T")
 
     # Large stat label
     large_stat_label_box = slide.shapes.add_textbox(
         LARGE_STAT_X, LARGE_STAT_LABEL_Y,
         LARGE_STAT_WIDTH, Inches(0.4)
     )
-    tf = large_stat_label_box.text_frame
-    tf.text = "Global AI market by 2032"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_LARGE_STAT_LABEL
-    p.font.bold = False
-    p.font.color.rgb = COLOR_TEXT_WHITE
-
-    # CRITICAL: Font name must be set at RUN level!
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_STAT_LABEL  # Inter Light (font-weight: 300)
+    STYLE_LARGE_STAT_LABEL.apply(large_stat_label_box.text_frame, "Global AI market by 2032")
 
     # Stat cards (4 cards in a row)
     stats = [
@@ -406,33 +689,14 @@ def create_slide_3(prs):
         card_height = Inches(STAT_CARD_HEIGHT)
 
         # Card background with rounded corners
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            x, y_start,
-            card_width, card_height
-        )
-        card.fill.solid()
-        card.fill.fore_color.rgb = STAT_CARD_FILL_COLOR
-        card.line.color.rgb = STAT_CARD_BORDER_COLOR
-        card.line.width = STAT_CARD_BORDER_WIDTH
-        card.adjustments[0] = 0.05
+        SHAPE_STAT_CARD.stamp(slide.shapes, x, y_start, card_width, card_height)
 
         # Stat number
         number_box = slide.shapes.add_textbox(
             x, y_start + Inches(STAT_NUMBER_Y_OFFSET),
             card_width, Inches(STAT_NUMBER_HEIGHT)
         )
-        tf = number_box.text_frame
-        tf.text = stat["number"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_STAT_NUMBER
-        p.font.bold = False
-        p.font.color.rgb = COLOR_ACCENT_CYAN
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_STAT_NUMBER  # Inter ExtraLight (font-weight: 200)
+        STYLE_STAT_NUMBER.apply(number_box.text_frame, stat["number"])
 
         # Stat label
         label_box = slide.shapes.add_textbox(
@@ -440,17 +704,8 @@ def create_slide_3(prs):
             card_width, Inches(STAT_LABEL_HEIGHT)
         )
         tf = label_box.text_frame
-        tf.text = stat["label"]
+        STYLE_STAT_LABEL.apply(tf, stat["label"])
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_STAT_LABEL
-        p.font.bold = False
-        p.font.color.rgb = COLOR_TEXT_WHITE
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_STAT_LABEL  # Inter Light (font-weight: 300)
 
         # Stat source
         source_box = slide.shapes.add_textbox(
@@ -458,24 +713,14 @@ def create_slide_3(prs):
             card_width, Inches(STAT_SOURCE_HEIGHT)
         )
         tf = source_box.text_frame
-        tf.text = stat["source"]
+        STYLE_STAT_SOURCE.apply(tf, stat["source"])
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_STAT_SOURCE
-        p.font.bold = False
-        p.font.color.rgb = FONT_COLOR_STAT_SOURCE
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_PRIMARY  # Inter Regular (small body text)
 
     return prs
 
 def create_slide_4(prs):
     """Slide 4: SOVEREIGN AI SOLUTION"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 4, 25)
+    slide = add_blank_slide(prs)
 
     # The three keywords - using KEYWORD_THEME_SOLUTION
     keywords = [
@@ -491,25 +736,13 @@ def create_slide_4(prs):
             KEYWORD_BOX_X, Inches(y_pos),
             KEYWORD_BOX_WIDTH, KEYWORD_BOX_HEIGHT
         )
-        tf = keyword_box.text_frame
-        tf.text = keyword["text"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_KEYWORD
-        p.font.bold = FONT_BOLD_KEYWORD
-        p.font.color.rgb = keyword["color"]
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_KEYWORD  # Inter ExtraLight (font-weight: 200)
-            run.font.character_spacing = FONT_LETTER_SPACING_KEYWORD
+        STYLE_KEYWORD.apply(keyword_box.text_frame, keyword["text"], color=keyword["color"])
 
     return prs
 
 def create_slide_5(prs):
     """Slide 5: BRAIN-BRIDGES Introduction (like Slide 6 but with text instead of features)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 5, 25)
+    slide = add_blank_slide(prs)
 
     # =========================================================================
     # LEFT SIDE: Title, Subtitle, Description Text
@@ -521,29 +754,15 @@ def create_slide_5(prs):
         HERO_TITLE_WIDTH, HERO_TITLE_HEIGHT
     )
     tf = title_box.text_frame
-    tf.text = "BRAIN-BRIDGES"
+    STYLE_HERO_TITLE.apply(tf, "BRAIN-BRIDGES")
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.font.name = FONT_FAMILY_HERO_TITLE
-    p.font.size = FONT_SIZE_HERO_TITLE
-    p.font.bold = FONT_BOLD_HERO_TITLE
-    p.font.color.rgb = COLOR_ACCENT_BLUE
-
-    for run in p.runs:
-        run.font.character_spacing = FONT_LETTER_SPACING_HERO_TITLE
 
     # Hero Subtitle: "SOVEREIGN AI FOR ORGANISATIONS"
     subtitle_box = slide.shapes.add_textbox(
         HERO_SUBTITLE_X, HERO_SUBTITLE_Y,
         HERO_SUBTITLE_WIDTH, HERO_SUBTITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = "SOVEREIGN AI FOR ORGANISATIONS"
-    p = tf.paragraphs[0]
-    p.font.name = FONT_FAMILY_HERO_SUBTITLE
-    p.font.size = FONT_SIZE_HERO_SUBTITLE
-    p.font.bold = FONT_BOLD_HERO_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_HERO_SUBTITLE
+    STYLE_HERO_SUBTITLE.apply(subtitle_box.text_frame, "SOVEREIGN AI FOR ORGANISATIONS")
 
     # Description text (3 paragraphs) - positioned below subtitle
     text_box = slide.shapes.add_textbox(
@@ -555,24 +774,13 @@ def create_slide_5(prs):
 
     # Paragraph 1
     p1 = tf.paragraphs[0]
-    p1.text = "We offer an AI Bot that enables users to have chat-like conversations about their organization. The bot has access to the organization's documents repository."
-    p1.font.size = Pt(14)
-    p1.font.color.rgb = COLOR_TEXT_WHITE
+    STYLE_HERO_DESCRIPTION.add_run(p1, "We offer an AI Bot that enables users to have chat-like conversations about their organization. The bot has access to the organization's documents repository.")
     p1.space_after = Pt(16)
-    for run in p1.runs:
-        run.font.name = FONT_FAMILY_PRIMARY
 
     # Paragraph 2 (with bold words)
     p2 = tf.add_paragraph()
-    p2.text = "To guarantee absolute data sovereignty, privacy, and security, we design the entire system – including AI model, database and documents – for full on-premises deployment."
-    p2.font.size = Pt(14)
-    p2.font.color.rgb = COLOR_TEXT_WHITE
     p2.space_after = Pt(16)
 
-    # Make specific words bold
-    text2 = p2.text
-    p2.clear()
-
     parts = [
         ("To guarantee absolute ", False),
         ("data sovereignty", True),
@@ -584,20 +792,12 @@ def create_slide_5(prs):
     ]
 
     for text, is_bold in parts:
-        run = p2.add_run()
-        run.text = text
-        run.font.name = FONT_FAMILY_PRIMARY
-        run.font.size = Pt(14)
-        run.font.bold = is_bold
-        run.font.color.rgb = COLOR_TEXT_WHITE
+        style = STYLE_HERO_DESCRIPTION_BOLD if is_bold else STYLE_HERO_DESCRIPTION
+        style.add_run(p2, text)
 
     # Paragraph 3
     p3 = tf.add_paragraph()
-    p3.text = "Everything is delivered as a compact, ready-to-use system – just plug in and start."
-    p3.font.size = Pt(14)
-    p3.font.color.rgb = COLOR_TEXT_WHITE
-    for run in p3.runs:
-        run.font.name = FONT_FAMILY_PRIMARY
+    STYLE_HERO_DESCRIPTION.add_run(p3, "Everything is delivered as a compact, ready-to-use system – just plug in and start.")
 
     # =========================================================================
     # RIGHT SIDE: Product Image with Status Badge (NO TECH SPECS)
@@ -616,19 +816,16 @@ def create_slide_5(prs):
 
     # Process image: add rounded corners and border
     try:
-        os.makedirs("temp", exist_ok=True)
         border_width_px = int(HERO_IMAGE_BORDER_WIDTH.pt * 1.33)
-        rounded_image_path = "temp/hero_image_rounded.png"
-        add_rounded_corners_to_image(
+        rounded_image = add_rounded_corners_to_image(
             HERO_IMAGE_PATH,
             HERO_IMAGE_CORNER_RADIUS_PX,
             HERO_IMAGE_BORDER_COLOR_RGB,
-            border_width_px,
-            rounded_image_path
+            border_width_px
         )
 
         product_img = slide.shapes.add_picture(
-            rounded_image_path,
+            rounded_image,
             HERO_IMAGE_X, HERO_IMAGE_Y,
             width=HERO_IMAGE_WIDTH
         )
@@ -651,8 +848,7 @@ def create_slide_5(prs):
 
 def create_slide_6(prs):
     """Slide 6: BRAIN-BRIDGES Hero Slide"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 6, 25)
+    slide = add_blank_slide(prs)
 
     # =========================================================================
     # LEFT SIDE: Title, Subtitle, Features
@@ -665,30 +861,15 @@ def create_slide_6(prs):
         HERO_TITLE_WIDTH, HERO_TITLE_HEIGHT
     )
     tf = title_box.text_frame
-    tf.text = "BRAIN-BRIDGES"
+    STYLE_HERO_TITLE.apply(tf, "BRAIN-BRIDGES")
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.font.name = FONT_FAMILY_HERO_TITLE  # Inter-ExtraBold (font-weight: 800)
-    p.font.size = FONT_SIZE_HERO_TITLE
-    p.font.bold = FONT_BOLD_HERO_TITLE
-    p.font.color.rgb = COLOR_ACCENT_BLUE  # Solid blue (gradient not reliable in pptx)
-
-    # Apply negative letter-spacing (like HTML version)
-    for run in p.runs:
-        run.font.character_spacing = FONT_LETTER_SPACING_HERO_TITLE
 
     # Hero Subtitle: "SOVEREIGN AI FOR ORGANISATIONS"
     subtitle_box = slide.shapes.add_textbox(
         HERO_SUBTITLE_X, HERO_SUBTITLE_Y,
         HERO_SUBTITLE_WIDTH, HERO_SUBTITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = "SOVEREIGN AI FOR ORGANISATIONS"
-    p = tf.paragraphs[0]
-    p.font.name = FONT_FAMILY_HERO_SUBTITLE  # Menlo (monospace font)
-    p.font.size = FONT_SIZE_HERO_SUBTITLE
-    p.font.bold = FONT_BOLD_HERO_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_HERO_SUBTITLE
+    STYLE_HERO_SUBTITLE.apply(subtitle_box.text_frame, "SOVEREIGN AI FOR ORGANISATIONS")
 
     # Hero Features List (6 items - 5 with checkmarks, last with plug icon)
     features = [
@@ -751,11 +932,7 @@ def create_slide_6(prs):
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE  # Vertically center text to align with icon
 
         # Feature text (white)
-        p = tf.paragraphs[0]
-        p.font.name = FONT_FAMILY_HERO_FEATURE  # Inter-Light (font-weight: 300)
-        p.font.size = FONT_SIZE_HERO_FEATURE
-        p.font.color.rgb = FONT_COLOR_HERO_FEATURE
-        p.text = feature_text
+        STYLE_HERO_FEATURE.apply(tf, feature_text)
 
     # =========================================================================
     # RIGHT SIDE: Product Image with border, Status Badge, Tech Specs
@@ -774,25 +951,20 @@ def create_slide_6(prs):
 
     # Process image: add rounded corners and border
     try:
-        # Create temp directory if it doesn't exist
-        os.makedirs("temp", exist_ok=True)
-
         # Convert border width from Pt to pixels (approximate: 1pt ≈ 1.33px)
         border_width_px = int(HERO_IMAGE_BORDER_WIDTH.pt * 1.33)
 
-        # Create rounded corner version of image with border
-        rounded_image_path = "temp/hero_image_rounded.png"
-        add_rounded_corners_to_image(
+        # Create rounded corner version of image with border, in memory (no shared temp file)
+        rounded_image = add_rounded_corners_to_image(
             HERO_IMAGE_PATH,
             HERO_IMAGE_CORNER_RADIUS_PX,
             HERO_IMAGE_BORDER_COLOR_RGB,
-            border_width_px,
-            rounded_image_path
+            border_width_px
         )
 
         # Add image with rounded corners and border
         product_img = slide.shapes.add_picture(
-            rounded_image_path,
+            rounded_image,
             HERO_IMAGE_X, HERO_IMAGE_Y,
             width=HERO_IMAGE_WIDTH
         )
@@ -856,14 +1028,8 @@ def create_slide_6(prs):
         HERO_STATUS_WIDTH - Inches(0.33), HERO_STATUS_HEIGHT
     )
     tf = text_box.text_frame
-    tf.text = HERO_STATUS_TEXT
+    STYLE_HERO_STATUS.apply(tf, HERO_STATUS_TEXT)
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE  # Vertically center text to align with icon
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.name = FONT_FAMILY_HERO_STATUS  # Inter-Medium (font-weight: 500)
-    p.font.size = FONT_SIZE_HERO_STATUS
-    p.font.bold = True
-    p.font.color.rgb = FONT_COLOR_HERO_STATUS
 
     # Tech Specs (3 columns: Processor, Memory, Users) INSIDE image at bottom
     spec_labels = ["PROCESSOR", "MEMORY", "USERS"]
@@ -906,17 +1072,7 @@ def create_slide_6(prs):
             x_pos, specs_y + Inches(0.18),
             single_card_width, Inches(0.25)
         )
-        tf = label_box.text_frame
-        tf.text = label
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_HERO_SPEC_LABEL
-        p.font.color.rgb = FONT_COLOR_HERO_SPEC_LABEL
-        p.font.bold = True
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_HERO_SPEC_LABEL  # Inter-SemiBold (font-weight: 600)
+        STYLE_HERO_SPEC_LABEL.apply(label_box.text_frame, label)
 
         # Value (bottom)
         value_box = slide.shapes.add_textbox(
@@ -924,24 +1080,14 @@ def create_slide_6(prs):
             single_card_width, Inches(0.4)
         )
         tf = value_box.text_frame
-        tf.text = value
+        STYLE_HERO_SPEC_VALUE.apply(tf, value)
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_HERO_SPEC_VALUE
-        p.font.color.rgb = FONT_COLOR_HERO_SPEC_VALUE
-        p.font.bold = FONT_BOLD_HERO_SPEC_VALUE
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_HERO_SPEC_VALUE  # Inter-Bold (font-weight: 700)
 
     return prs
 
 def create_slide_7(prs):
     """Slide 7: UNDERSTANDING INFERENCE MECHANICS"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 7, 25)
+    slide = add_blank_slide(prs)
 
     # The three keywords - using KEYWORD_THEME_TECH
     keywords = [
@@ -957,25 +1103,13 @@ def create_slide_7(prs):
             KEYWORD_BOX_X, Inches(y_pos),
             KEYWORD_BOX_WIDTH, KEYWORD_BOX_HEIGHT
         )
-        tf = keyword_box.text_frame
-        tf.text = keyword["text"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_KEYWORD
-        p.font.bold = FONT_BOLD_KEYWORD
-        p.font.color.rgb = keyword["color"]
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_KEYWORD  # Inter ExtraLight (font-weight: 200)
-            run.font.character_spacing = FONT_LETTER_SPACING_KEYWORD
+        STYLE_KEYWORD.apply(keyword_box.text_frame, keyword["text"], color=keyword["color"])
 
     return prs
 
 def create_slide_8(prs):
     """Slide 8: Tokenization Intro - A Sample from legal domain"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 8, 25)
+    slide = add_blank_slide(prs)
 
     # Title: "A Sample from legal domain:"
     title_box = slide.shapes.add_textbox(
@@ -983,14 +1117,8 @@ def create_slide_8(prs):
         TOKENIZATION_TITLE_WIDTH, TOKENIZATION_TITLE_HEIGHT
     )
     tf = title_box.text_frame
-    tf.text = "A Sample from legal domain:"
+    STYLE_TOKENIZATION_TITLE.apply(tf, "A Sample from legal domain:")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_TOKENIZATION_TITLE
-    p.font.color.rgb = FONT_COLOR_TOKENIZATION_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_TOKENIZATION_TITLE
 
     # Arrow down
     arrow_box = slide.shapes.add_textbox(
@@ -998,71 +1126,30 @@ def create_slide_8(prs):
         TOKENIZATION_ARROW_WIDTH, TOKENIZATION_ARROW_HEIGHT
     )
     tf = arrow_box.text_frame
-    tf.text = TOKENIZATION_ARROW_TEXT
+    STYLE_TOKENIZATION_ARROW.apply(tf, TOKENIZATION_ARROW_TEXT)
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_TOKENIZATION_ARROW
-    p.font.color.rgb = FONT_COLOR_TOKENIZATION_ARROW
 
     # Token boxes in horizontal row
     for i, token_text in enumerate(TOKENIZATION_TOKENS):
         x_pos = TOKENIZATION_TOKEN_X_START + (i * (TOKENIZATION_TOKEN_WIDTH + TOKENIZATION_TOKEN_GAP))
 
-        # Create token box
-        token_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            x_pos, TOKENIZATION_TOKENS_Y,
-            TOKENIZATION_TOKEN_WIDTH, TOKENIZATION_TOKEN_HEIGHT
-        )
-        token_box.fill.solid()
-        token_box.fill.fore_color.rgb = TOKENIZATION_TOKEN_FILL_COLOR
-        token_box.line.color.rgb = TOKENIZATION_TOKEN_BORDER_COLOR
-        token_box.line.width = TOKENIZATION_TOKEN_BORDER_WIDTH
-
-        # Token text
-        tf = token_box.text_frame
-        tf.text = token_text
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_TOKENIZATION_TOKEN
-        p.font.color.rgb = FONT_COLOR_TOKENIZATION_TOKEN
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_TOKENIZATION_TOKEN
+        # Token box with text
+        SHAPE_TOKENIZATION_TOKEN.stamp(slide.shapes, x_pos, TOKENIZATION_TOKENS_Y,
+                                       TOKENIZATION_TOKEN_WIDTH, TOKENIZATION_TOKEN_HEIGHT, token_text)
 
     return prs
 
 def create_slide_9(prs):
     """Slide 9: Vector Embeddings (Token → Vector Lookup)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 9, 25)
+    slide = add_blank_slide(prs)
 
     # Create each token row (Wit, nesses, must, tell, nothing)
     for i, token_info in enumerate(TOKEN_DATA):
         y_pos = TOKEN_ROW_Y_START + (i * TOKEN_ROW_GAP)
 
-        # Token box (left side)
-        token_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            TOKEN_BOX_X, Inches(y_pos),
-            TOKEN_BOX_WIDTH, TOKEN_BOX_HEIGHT
-        )
-        token_box.fill.solid()
-        token_box.fill.fore_color.rgb = TOKEN_BOX_FILL_COLOR
-        token_box.line.color.rgb = TOKEN_BOX_BORDER_COLOR
-        token_box.line.width = TOKEN_BOX_BORDER_WIDTH
-
-        # Token text
-        tf = token_box.text_frame
-        tf.text = token_info["token"]
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_TOKEN
-        p.font.color.rgb = FONT_COLOR_TOKEN
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_TOKEN
+        # Token box with text (left side)
+        SHAPE_TOKEN.stamp(slide.shapes, TOKEN_BOX_X, Inches(y_pos), TOKEN_BOX_WIDTH, TOKEN_BOX_HEIGHT,
+                          token_info["token"])
 
         # Arrow (center)
         arrow_box = slide.shapes.add_textbox(
@@ -1070,64 +1157,30 @@ def create_slide_9(prs):
             ARROW_WIDTH, TOKEN_BOX_HEIGHT
         )
         tf = arrow_box.text_frame
-        tf.text = ARROW_TEXT
+        STYLE_ARROW.apply(tf, ARROW_TEXT)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_ARROW
-        p.font.color.rgb = FONT_COLOR_ARROW
 
         # Vector cells (right side, 6 cells)
         for j, vector_value in enumerate(token_info["vectors"]):
             cell_x = VECTOR_GRID_X + (j * (VECTOR_CELL_WIDTH + VECTOR_CELL_GAP))
 
-            # Create vector cell box
-            vector_cell = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                cell_x, Inches(y_pos),
-                VECTOR_CELL_WIDTH, TOKEN_BOX_HEIGHT
-            )
-            vector_cell.fill.solid()
-            vector_cell.fill.fore_color.rgb = VECTOR_CELL_FILL_COLOR
-            vector_cell.line.color.rgb = VECTOR_CELL_BORDER_COLOR
-            vector_cell.line.width = VECTOR_CELL_BORDER_WIDTH
-
-            # Vector value text
-            tf = vector_cell.text_frame
-            tf.text = vector_value
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            p.font.size = FONT_SIZE_VECTOR
-            p.font.color.rgb = FONT_COLOR_VECTOR
-
-            # Last cell ("...") should be accent color
-            if vector_value == "...":
-                p.font.color.rgb = COLOR_ACCENT_BLUE
-
-            for run in p.runs:
-                run.font.name = FONT_FAMILY_VECTOR
+            # Vector cell with value (last cell "..." in accent color)
+            SHAPE_VECTOR_CELL.stamp(slide.shapes, cell_x, Inches(y_pos), VECTOR_CELL_WIDTH, TOKEN_BOX_HEIGHT,
+                                    vector_value,
+                                    text_color=COLOR_ACCENT_BLUE if vector_value == "..." else None)
 
     return prs
 
 def create_slide_10(prs):
     """Slide 10: Attention is all you need - Attention Matrix"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 10, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         ATTENTION_TITLE_X, ATTENTION_TITLE_Y,
         ATTENTION_TITLE_WIDTH, ATTENTION_TITLE_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "Attention is all you need"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ATTENTION_TITLE
-    p.font.color.rgb = FONT_COLOR_ATTENTION_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ATTENTION_TITLE
+    STYLE_ATTENTION_TITLE.apply(title_box.text_frame, "Attention is all you need")
 
     # Helper function to get score color
     def get_score_style(score):
@@ -1154,25 +1207,7 @@ def create_slide_10(prs):
         x_pos = ATTENTION_MATRIX_X + ((col_idx + 1) * (ATTENTION_CELL_WIDTH + ATTENTION_CELL_GAP))
         y_pos = ATTENTION_MATRIX_Y
 
-        cell = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            x_pos, y_pos,
-            ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT
-        )
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = ATTENTION_HEADER_FILL_COLOR
-        cell.line.color.rgb = ATTENTION_HEADER_BORDER_COLOR
-        cell.line.width = ATTENTION_CELL_BORDER_WIDTH
-
-        tf = cell.text_frame
-        tf.text = token
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_ATTENTION_HEADER
-        p.font.color.rgb = FONT_COLOR_ATTENTION_HEADER
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_ATTENTION_HEADER
+        SHAPE_ATTENTION_HEADER.stamp(slide.shapes, x_pos, y_pos, ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT, token)
 
     # Data rows (rows 1-5)
     for row_idx, (row_token, row_scores) in enumerate(zip(ATTENTION_TOKENS, ATTENTION_MATRIX_DATA)):
@@ -1180,25 +1215,8 @@ def create_slide_10(prs):
 
         # Row header (token name)
         x_pos = ATTENTION_MATRIX_X
-        cell = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            x_pos, y_pos,
-            ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT
-        )
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = ATTENTION_HEADER_FILL_COLOR
-        cell.line.color.rgb = ATTENTION_HEADER_BORDER_COLOR
-        cell.line.width = ATTENTION_CELL_BORDER_WIDTH
-
-        tf = cell.text_frame
-        tf.text = row_token
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_ATTENTION_HEADER
-        p.font.color.rgb = FONT_COLOR_ATTENTION_HEADER
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_ATTENTION_HEADER
+        SHAPE_ATTENTION_HEADER.stamp(slide.shapes, x_pos, y_pos, ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT,
+                                     row_token)
 
         # Score cells
         for col_idx, score in enumerate(row_scores):
@@ -1206,59 +1224,28 @@ def create_slide_10(prs):
 
             fill_color, border_color, text_color = get_score_style(score)
 
-            cell = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                x_pos, y_pos,
-                ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT
-            )
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = fill_color
-            cell.line.color.rgb = border_color
-            cell.line.width = ATTENTION_CELL_BORDER_WIDTH
-
-            tf = cell.text_frame
-            tf.text = f"{score:.2f}"
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            p.font.size = FONT_SIZE_ATTENTION_SCORE
-            p.font.color.rgb = text_color
-            for run in p.runs:
-                run.font.name = FONT_FAMILY_ATTENTION_SCORE
+            SHAPE_ATTENTION_SCORE.stamp(slide.shapes, x_pos, y_pos, ATTENTION_CELL_WIDTH, ATTENTION_CELL_HEIGHT,
+                                        f"{score:.2f}", fill=fill_color, line=border_color, text_color=text_color)
 
     # Footnote
     footnote_box = slide.shapes.add_textbox(
         ATTENTION_FOOTNOTE_X, ATTENTION_FOOTNOTE_Y,
         ATTENTION_FOOTNOTE_WIDTH, ATTENTION_FOOTNOTE_HEIGHT
     )
-    tf = footnote_box.text_frame
-    tf.text = ATTENTION_FOOTNOTE_TEXT
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.RIGHT
-    p.font.size = FONT_SIZE_ATTENTION_FOOTNOTE
-    p.font.color.rgb = FONT_COLOR_ATTENTION_FOOTNOTE
-    p.font.italic = True
+    STYLE_ATTENTION_FOOTNOTE.apply(footnote_box.text_frame, ATTENTION_FOOTNOTE_TEXT)
 
     return prs
 
 def create_slide_11(prs):
     """Slide 11: Next word prediction"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 11, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         PREDICTION_TITLE_X, PREDICTION_TITLE_Y,
         PREDICTION_TITLE_WIDTH, PREDICTION_TITLE_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "Next word prediction"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_PREDICTION_TITLE
-    p.font.color.rgb = FONT_COLOR_PREDICTION_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_PREDICTION_TITLE
+    STYLE_PREDICTION_TITLE.apply(title_box.text_frame, "Next word prediction")
 
     # Context Vector Bar
     vector_bar = slide.shapes.add_shape(
@@ -1277,14 +1264,7 @@ def create_slide_11(prs):
         PREDICTION_VECTOR_Y + PREDICTION_VECTOR_MARGIN,
         PREDICTION_CONTENT_WIDTH - (2 * PREDICTION_VECTOR_MARGIN), PREDICTION_VECTOR_LABEL_HEIGHT
     )
-    tf = label_box.text_frame
-    tf.text = "CONTEXT VECTOR"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_PREDICTION_VECTOR_LABEL
-    p.font.color.rgb = FONT_COLOR_PREDICTION_VECTOR_LABEL
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_REGULAR
+    STYLE_PREDICTION_VECTOR_LABEL.apply(label_box.text_frame, "CONTEXT VECTOR")
 
     # Vector Segments (10 colored rectangles, evenly distributed with equal margins)
     # Calculate available width: 12" - left margin - right margin
@@ -1313,12 +1293,8 @@ def create_slide_11(prs):
         Inches(0.6), Inches(0.5)
     )
     tf = arrow_box.text_frame
-    tf.text = PREDICTION_ARROW_TEXT
+    STYLE_PREDICTION_ARROW.apply(tf, PREDICTION_ARROW_TEXT)
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_PREDICTION_ARROW
-    p.font.color.rgb = FONT_COLOR_PREDICTION_ARROW
 
     # Helper function to get fill color
     def get_fill_color(category):
@@ -1340,22 +1316,13 @@ def create_slide_11(prs):
             PREDICTION_PROB_LABEL_X, y_pos,
             PREDICTION_PROB_LABEL_WIDTH, PREDICTION_PROB_BAR_HEIGHT
         )
-        tf = label_box.text_frame
-        tf.text = pred_data["token"]
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.RIGHT
-        p.font.size = FONT_SIZE_PREDICTION_TOKEN
-
         # Highest token gets green color
+        tf = label_box.text_frame
         if pred_data["category"] == "highest":
-            p.font.color.rgb = FONT_COLOR_PREDICTION_TOKEN_HIGHEST
-            p.font.bold = True
+            STYLE_PREDICTION_TOKEN_HIGHEST.apply(tf, pred_data["token"])
         else:
-            p.font.color.rgb = FONT_COLOR_PREDICTION_TOKEN
-
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_PREDICTION_TOKEN
+            STYLE_PREDICTION_TOKEN.apply(tf, pred_data["token"])
+        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
 
         # Probability bar background (right-aligned at fixed position)
         bar_bg = slide.shapes.add_shape(
@@ -1386,15 +1353,8 @@ def create_slide_11(prs):
             Inches(0.7), PREDICTION_PROB_BAR_HEIGHT
         )
         tf = value_box.text_frame
-        tf.text = f"{pred_data['probability']:.2f}"
+        STYLE_PREDICTION_VALUE.apply(tf, f"{pred_data['probability']:.2f}")
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.RIGHT
-        p.font.size = FONT_SIZE_PREDICTION_VALUE
-        p.font.color.rgb = FONT_COLOR_PREDICTION_VALUE
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_PREDICTION_VALUE
 
     # Thermometer Icon (left side, spans from but to no)
     # Drawn LAST so it appears in foreground (can be clicked in PowerPoint)
@@ -1406,38 +1366,23 @@ def create_slide_11(prs):
 
     return prs
 
-def create_autoregression_slide(prs, slide_num, step_data):
+def create_autoregression_slide(prs, step_data):
     """Helper function to create an autoregression slide"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, slide_num)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         AUTOREGRESS_TITLE_X, AUTOREGRESS_TITLE_Y,
         AUTOREGRESS_TITLE_WIDTH, AUTOREGRESS_TITLE_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = step_data["title"]
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_AUTOREGRESS_TITLE
-    p.font.color.rgb = FONT_COLOR_AUTOREGRESS_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_AUTOREGRESS_TITLE
+    STYLE_AUTOREGRESS_TITLE.apply(title_box.text_frame, step_data["title"])
 
     # Subtitle
     subtitle_box = slide.shapes.add_textbox(
         AUTOREGRESS_SUBTITLE_X, AUTOREGRESS_SUBTITLE_Y,
         AUTOREGRESS_SUBTITLE_WIDTH, AUTOREGRESS_SUBTITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = step_data["subtitle"]
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_AUTOREGRESS_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_AUTOREGRESS_SUBTITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_AUTOREGRESS_SUBTITLE
+    STYLE_AUTOREGRESS_SUBTITLE.apply(subtitle_box.text_frame, step_data["subtitle"])
 
     # Calculate total width of token row
     num_tokens = len(step_data["tokens"])
@@ -1458,40 +1403,10 @@ def create_autoregression_slide(prs, slide_num, step_data):
         is_new_token = (step_data["new_token_index"] is not None and
                       token_idx == step_data["new_token_index"])
 
-        # Token box
-        token_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            token_x, AUTOREGRESS_TOKEN_Y,
-            AUTOREGRESS_TOKEN_WIDTH, AUTOREGRESS_TOKEN_HEIGHT
-        )
-        token_box.fill.solid()
-
-        if is_new_token:
-            # New token: green fill and border
-            token_box.fill.fore_color.rgb = AUTOREGRESS_TOKEN_NEW_FILL
-            token_box.line.color.rgb = AUTOREGRESS_TOKEN_NEW_BORDER
-        else:
-            # Existing token: blue fill and border
-            token_box.fill.fore_color.rgb = AUTOREGRESS_TOKEN_FILL_COLOR
-            token_box.line.color.rgb = AUTOREGRESS_TOKEN_BORDER_COLOR
-
-        token_box.line.width = AUTOREGRESS_TOKEN_BORDER_WIDTH
-
-        # Token text
-        tf = token_box.text_frame
-        tf.text = token_text
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_AUTOREGRESS_TOKEN
-
-        if is_new_token:
-            p.font.color.rgb = FONT_COLOR_AUTOREGRESS_TOKEN_NEW
-        else:
-            p.font.color.rgb = FONT_COLOR_AUTOREGRESS_TOKEN
-
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_AUTOREGRESS_TOKEN
+        # Token box with text: new token green, existing tokens blue
+        template = SHAPE_AUTOREGRESS_TOKEN_NEW if is_new_token else SHAPE_AUTOREGRESS_TOKEN
+        template.stamp(slide.shapes, token_x, AUTOREGRESS_TOKEN_Y,
+                       AUTOREGRESS_TOKEN_WIDTH, AUTOREGRESS_TOKEN_HEIGHT, token_text)
 
     # LLM Arrow and Predicted token (if present)
     if step_data["predicted"] is not None:
@@ -1502,58 +1417,36 @@ def create_autoregression_slide(prs, slide_num, step_data):
             AUTOREGRESS_LLM_ARROW_WIDTH, AUTOREGRESS_TOKEN_HEIGHT
         )
         tf = llm_arrow_box.text_frame
-        tf.text = AUTOREGRESS_LLM_ARROW
+        STYLE_AUTOREGRESS_LLM_ARROW.apply(tf, AUTOREGRESS_LLM_ARROW)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_AUTOREGRESS_LLM_ARROW
-        p.font.color.rgb = FONT_COLOR_AUTOREGRESS_LLM_ARROW
 
         # Predicted token (right of arrow, in green)
         predicted_x = llm_arrow_x + AUTOREGRESS_LLM_ARROW_WIDTH + AUTOREGRESS_LLM_ARROW_GAP
-        predicted_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            predicted_x, AUTOREGRESS_TOKEN_Y,
-            AUTOREGRESS_TOKEN_WIDTH, AUTOREGRESS_TOKEN_HEIGHT
-        )
-        predicted_box.fill.solid()
-        predicted_box.fill.fore_color.rgb = AUTOREGRESS_TOKEN_NEW_FILL
-        predicted_box.line.color.rgb = AUTOREGRESS_TOKEN_NEW_BORDER
-        predicted_box.line.width = AUTOREGRESS_TOKEN_BORDER_WIDTH
-
-        tf = predicted_box.text_frame
-        tf.text = step_data["predicted"]
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_AUTOREGRESS_TOKEN
-        p.font.color.rgb = FONT_COLOR_AUTOREGRESS_TOKEN_NEW
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_AUTOREGRESS_TOKEN
+        SHAPE_AUTOREGRESS_TOKEN_NEW.stamp(slide.shapes, predicted_x, AUTOREGRESS_TOKEN_Y,
+                                          AUTOREGRESS_TOKEN_WIDTH, AUTOREGRESS_TOKEN_HEIGHT, step_data["predicted"])
     # Final slide: no completion message (user requested clean final slide)
 
     return prs
 
 def create_slide_12(prs):
     """Slide 12: Autoregression - Step 1"""
-    return create_autoregression_slide(prs, 12, AUTOREGRESS_STEP_1)
+    return create_autoregression_slide(prs, AUTOREGRESS_STEP_1)
 
 def create_slide_13(prs):
     """Slide 13: Autoregression - Step 2"""
-    return create_autoregression_slide(prs, 13, AUTOREGRESS_STEP_2)
+    return create_autoregression_slide(prs, AUTOREGRESS_STEP_2)
 
 def create_slide_14(prs):
     """Slide 14: Autoregression - Step 3"""
-    return create_autoregression_slide(prs, 14, AUTOREGRESS_STEP_3)
+    return create_autoregression_slide(prs, AUTOREGRESS_STEP_3)
 
 def create_slide_15(prs):
     """Slide 15: Autoregression - Final"""
-    return create_autoregression_slide(prs, 15, AUTOREGRESS_STEP_FINAL)
+    return create_autoregression_slide(prs, AUTOREGRESS_STEP_FINAL)
 
 def create_slide_16(prs):
     """Slide 16: ON PREMISE MATTERS"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 16, 25)
+    slide = add_blank_slide(prs)
 
     # The three keywords - using KEYWORD_THEME_SOLUTION
     keywords = [
@@ -1569,39 +1462,20 @@ def create_slide_16(prs):
             KEYWORD_BOX_X, Inches(y_pos),
             KEYWORD_BOX_WIDTH, KEYWORD_BOX_HEIGHT
         )
-        tf = keyword_box.text_frame
-        tf.text = keyword["text"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_KEYWORD
-        p.font.bold = FONT_BOLD_KEYWORD
-        p.font.color.rgb = keyword["color"]
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_KEYWORD  # Inter ExtraLight (font-weight: 200)
-            run.font.character_spacing = FONT_LETTER_SPACING_KEYWORD
+        STYLE_KEYWORD.apply(keyword_box.text_frame, keyword["text"], color=keyword["color"])
 
     return prs
 
 def create_slide_17(prs):
     """Slide 17: The Fundamental Security Conflict"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 17, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         SECURITY_TITLE_X, SECURITY_TITLE_Y,
         SECURITY_TITLE_WIDTH, SECURITY_TITLE_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "The Fundamental Security Conflict"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_SECURITY_TITLE
-    p.font.color.rgb = FONT_COLOR_SECURITY_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SECURITY_TITLE
+    STYLE_SECURITY_TITLE.apply(title_box.text_frame, "The Fundamental Security Conflict")
 
     # === LEFT CARD: Cloud Providers (Red) ===
     # Card container with red border
@@ -1621,15 +1495,7 @@ def create_slide_17(prs):
         SECURITY_CARD_LEFT_X, SECURITY_CARD_Y + Inches(SECURITY_COL_TITLE_Y_OFFSET),
         SECURITY_CARD_WIDTH, SECURITY_COL_TITLE_HEIGHT
     )
-    tf = cloud_title_box.text_frame
-    tf.text = "Cloud Providers"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_SECURITY_COL_TITLE
-    p.font.color.rgb = COLOR_SECURITY_CLOUD
-    p.font.bold = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SECURITY_COL_TITLE
+    STYLE_SECURITY_COL_TITLE.apply(cloud_title_box.text_frame, "Cloud Providers", color=COLOR_SECURITY_CLOUD)
 
     # Cloud icon
     cloud_icon_x = SECURITY_CARD_LEFT_X + (SECURITY_CARD_WIDTH - SECURITY_ICON_WIDTH) / 2
@@ -1651,15 +1517,8 @@ def create_slide_17(prs):
             Inches(0.5), SECURITY_STEP_HEIGHT
         )
         tf = num_box.text_frame
-        tf.text = str(i + 1)
+        STYLE_SECURITY_STEP_NUMBER.apply(tf, str(i + 1), color=COLOR_SECURITY_CLOUD)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_SECURITY_STEP_NUMBER
-        p.font.color.rgb = COLOR_SECURITY_CLOUD
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_SECURITY_STEP
 
         # Step text
         text_box = slide.shapes.add_textbox(
@@ -1667,15 +1526,9 @@ def create_slide_17(prs):
             SECURITY_CARD_WIDTH - Inches(SECURITY_STEP_X_OFFSET + 0.9), SECURITY_STEP_HEIGHT
         )
         tf = text_box.text_frame
-        tf.text = step_text
+        STYLE_SECURITY_STEP_TEXT.apply(tf, step_text)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_SECURITY_STEP_TEXT
-        p.font.color.rgb = COLOR_TEXT_WHITE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_SECURITY_STEP
 
     # === RIGHT CARD: Brain-Bridges (Green) ===
     # Card container with green border
@@ -1695,15 +1548,7 @@ def create_slide_17(prs):
         SECURITY_CARD_RIGHT_X, SECURITY_CARD_Y + Inches(SECURITY_COL_TITLE_Y_OFFSET),
         SECURITY_CARD_WIDTH, SECURITY_COL_TITLE_HEIGHT
     )
-    tf = local_title_box.text_frame
-    tf.text = "Brain-Bridges"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_SECURITY_COL_TITLE
-    p.font.color.rgb = COLOR_SECURITY_LOCAL
-    p.font.bold = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SECURITY_COL_TITLE
+    STYLE_SECURITY_COL_TITLE.apply(local_title_box.text_frame, "Brain-Bridges", color=COLOR_SECURITY_LOCAL)
 
     # Local icon
     local_icon_x = SECURITY_CARD_RIGHT_X + (SECURITY_CARD_WIDTH - SECURITY_ICON_WIDTH) / 2
@@ -1725,15 +1570,8 @@ def create_slide_17(prs):
             Inches(0.5), SECURITY_STEP_HEIGHT
         )
         tf = num_box.text_frame
-        tf.text = str(i + 1)
+        STYLE_SECURITY_STEP_NUMBER.apply(tf, str(i + 1), color=COLOR_SECURITY_LOCAL)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_SECURITY_STEP_NUMBER
-        p.font.color.rgb = COLOR_SECURITY_LOCAL
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_SECURITY_STEP
 
         # Step text
         text_box = slide.shapes.add_textbox(
@@ -1741,50 +1579,29 @@ def create_slide_17(prs):
             SECURITY_CARD_WIDTH - Inches(SECURITY_STEP_X_OFFSET + 0.9), SECURITY_STEP_HEIGHT
         )
         tf = text_box.text_frame
-        tf.text = step_text
+        STYLE_SECURITY_STEP_TEXT.apply(tf, step_text)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_SECURITY_STEP_TEXT
-        p.font.color.rgb = COLOR_TEXT_WHITE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_SECURITY_STEP
 
     return prs
 
 def create_slide_18(prs):
     """Slide 18: The Encryption Dilemma - Redesigned Layout"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 18, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         ENCRYPTION_TITLE_X, ENCRYPTION_TITLE_Y,
         ENCRYPTION_TITLE_WIDTH, ENCRYPTION_TITLE_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = "The Encryption Dilemma"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_TITLE
-    p.font.color.rgb = FONT_COLOR_ENCRYPTION_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_TITLE
+    STYLE_ENCRYPTION_TITLE.apply(title_box.text_frame, "The Encryption Dilemma")
 
     # Subtitle (red mono font like Slide 2)
     subtitle_box = slide.shapes.add_textbox(
         ENCRYPTION_TITLE_X, ENCRYPTION_SUBTITLE_Y,
         ENCRYPTION_TITLE_WIDTH, ENCRYPTION_TITLE_HEIGHT
     )
-    tf = subtitle_box.text_frame
-    tf.text = "Data must be decrypted for inference processing"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_SUBTITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_SUBTITLE_ALERT  # Red like Slide 2
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_SUBTITLE  # Menlo mono font
+    STYLE_ENCRYPTION_SUBTITLE.apply(subtitle_box.text_frame, "Data must be decrypted for inference processing")
 
     # === STEP 3: Remote Cloud Server (Top Center) ===
     # Card
@@ -1814,14 +1631,7 @@ def create_slide_18(prs):
         ENCRYPTION_TOP_Y + Inches(ENCRYPTION_STAGE_TITLE_Y_OFFSET),
         ENCRYPTION_TOP_CARD_WIDTH - Inches(0.6), Inches(0.4)
     )
-    tf = stage_title_box.text_frame
-    tf.text = "Remote Cloud Server"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STAGE_TITLE
-    p.font.color.rgb = COLOR_ENCRYPTION_INFERENCE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
+    STYLE_ENCRYPTION_STAGE_TITLE.apply(stage_title_box.text_frame, "Remote Cloud Server", color=COLOR_ENCRYPTION_INFERENCE)
 
     # Step number (blue circle, drawn last to appear on top)
     step3_num_circle = slide.shapes.add_shape(
@@ -1835,15 +1645,8 @@ def create_slide_18(prs):
     step3_num_circle.line.width = Pt(0)
     # Text directly in the OVAL shape
     tf = step3_num_circle.text_frame
-    tf.text = "3"
+    STYLE_ENCRYPTION_STEP_NUMBER.apply(tf, "3")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STEP_NUMBER
-    p.font.color.rgb = COLOR_ENCRYPTION_STEP_NUMBER_TEXT
-    p.font.bold = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
 
     # Processing text
     processing_box = slide.shapes.add_textbox(
@@ -1852,14 +1655,8 @@ def create_slide_18(prs):
         ENCRYPTION_TOP_CARD_WIDTH - Inches(1.0), Inches(0.6)
     )
     tf = processing_box.text_frame
-    tf.text = "Inferencing"
+    STYLE_ENCRYPTION_PROCESSING.apply(tf, "Inferencing")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_PROCESSING
-    p.font.color.rgb = COLOR_ENCRYPTION_INFERENCE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_REGULAR
 
     # Description - REMOVED (user request)
     # desc_box = slide.shapes.add_textbox(
@@ -1904,14 +1701,7 @@ def create_slide_18(prs):
         ENCRYPTION_BOTTOM_Y + Inches(ENCRYPTION_STAGE_TITLE_Y_OFFSET),
         ENCRYPTION_CARD_WIDTH - Inches(0.6), Inches(0.4)
     )
-    tf = stage_title_box.text_frame
-    tf.text = "Encrypted Data"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STAGE_TITLE
-    p.font.color.rgb = COLOR_ENCRYPTION_ENCRYPTED
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
+    STYLE_ENCRYPTION_STAGE_TITLE.apply(stage_title_box.text_frame, "Encrypted Data", color=COLOR_ENCRYPTION_ENCRYPTED)
 
     # Step number (blue circle, drawn last to appear on top)
     step1_num_circle = slide.shapes.add_shape(
@@ -1925,15 +1715,8 @@ def create_slide_18(prs):
     step1_num_circle.line.width = Pt(0)
     # Text directly in the OVAL shape
     tf = step1_num_circle.text_frame
-    tf.text = "1"
+    STYLE_ENCRYPTION_STEP_NUMBER.apply(tf, "1")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STEP_NUMBER
-    p.font.color.rgb = COLOR_ENCRYPTION_STEP_NUMBER_TEXT
-    p.font.bold = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
 
     # Data blocks (encrypted) - styled with borders
     for i, block_text in enumerate(ENCRYPTION_ENCRYPTED_BLOCKS):
@@ -1956,15 +1739,8 @@ def create_slide_18(prs):
 
         # Text directly in the shape
         tf = block_shape.text_frame
-        tf.text = block_text
+        STYLE_ENCRYPTION_DATA.apply(tf, block_text, color=COLOR_ENCRYPTION_ENCRYPTED)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_ENCRYPTION_DATA
-        p.font.color.rgb = COLOR_ENCRYPTION_ENCRYPTED
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
     # Description - REMOVED (user request)
     # desc_box = slide.shapes.add_textbox(
@@ -2009,14 +1785,7 @@ def create_slide_18(prs):
         ENCRYPTION_BOTTOM_Y + Inches(ENCRYPTION_STAGE_TITLE_Y_OFFSET),
         ENCRYPTION_CARD_WIDTH - Inches(0.6), Inches(0.4)
     )
-    tf = stage_title_box.text_frame
-    tf.text = "Decrypted Data"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STAGE_TITLE
-    p.font.color.rgb = COLOR_ENCRYPTION_DECRYPTED
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
+    STYLE_ENCRYPTION_STAGE_TITLE.apply(stage_title_box.text_frame, "Decrypted Data", color=COLOR_ENCRYPTION_DECRYPTED)
 
     # Step number (blue circle, drawn last to appear on top)
     step2_num_circle = slide.shapes.add_shape(
@@ -2030,15 +1799,8 @@ def create_slide_18(prs):
     step2_num_circle.line.width = Pt(0)
     # Text directly in the OVAL shape
     tf = step2_num_circle.text_frame
-    tf.text = "2"
+    STYLE_ENCRYPTION_STEP_NUMBER.apply(tf, "2")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_ENCRYPTION_STEP_NUMBER
-    p.font.color.rgb = COLOR_ENCRYPTION_STEP_NUMBER_TEXT
-    p.font.bold = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_ENCRYPTION_STAGE_TITLE
 
     # Data blocks (decrypted) - styled with borders
     for i, block_text in enumerate(ENCRYPTION_DECRYPTED_BLOCKS):
@@ -2061,15 +1823,8 @@ def create_slide_18(prs):
 
         # Text directly in the shape
         tf = block_shape.text_frame
-        tf.text = block_text
+        STYLE_ENCRYPTION_DATA.apply(tf, block_text, color=COLOR_ENCRYPTION_DECRYPTED)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_ENCRYPTION_DATA
-        p.font.color.rgb = COLOR_ENCRYPTION_DECRYPTED
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
     # Description - REMOVED (user request)
     # desc_box = slide.shapes.add_textbox(
@@ -2089,41 +1844,27 @@ def create_slide_18(prs):
     return prs
 def create_placeholder_slide(prs, slide_num):
     """Creates a placeholder slide for later editing"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, slide_num)
+    slide = add_blank_slide(prs)
 
     # Placeholder title
     title_box = slide.shapes.add_textbox(
         PLACEHOLDER_X, PLACEHOLDER_Y,
         PLACEHOLDER_WIDTH, PLACEHOLDER_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = f"Slide {slide_num}\n(To be designed)"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_PLACEHOLDER
-    p.font.color.rgb = FONT_COLOR_PLACEHOLDER
+    STYLE_PLACEHOLDER.apply(title_box.text_frame, f"Slide {slide_num}\n(To be designed)")
 
     return prs
 
 def create_slide_19(prs):
     """Slide 19: Chat API Architecture"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 19, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         Inches(1), CHAT_API_TITLE_Y,
         Inches(14), Inches(0.6)
     )
-    tf = title_box.text_frame
-    tf.text = "Chat API Architecture"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CHAT_API_TITLE
-    p.font.color.rgb = FONT_COLOR_CHAT_API_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_EXTRALIGHT
+    STYLE_CHAT_API_TITLE.apply(title_box.text_frame, "Chat API Architecture")
 
     # Card data: (role_name, badge_text, note_text, content_text, color)
     cards = [
@@ -2169,15 +1910,8 @@ def create_slide_19(prs):
 
         # Badge text (full color)
         tf = badge.text_frame
-        tf.text = badge_text
+        STYLE_CHAT_API_BADGE.apply(tf, badge_text, color=color)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_CHAT_API_BADGE
-        p.font.color.rgb = color
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
         # Message note (description under badge)
         note_box = slide.shapes.add_textbox(
@@ -2186,14 +1920,8 @@ def create_slide_19(prs):
             CHAT_API_METADATA_WIDTH, Inches(0.4)
         )
         tf = note_box.text_frame
-        tf.text = note_text
+        STYLE_CHAT_API_NOTE.apply(tf, note_text)
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_CHAT_API_NOTE
-        p.font.color.rgb = FONT_COLOR_CHAT_API_NOTE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
         # Vertical divider line (using a thin rectangle shape)
         divider_height = CHAT_API_CARD_HEIGHT - (2 * CHAT_API_DIVIDER_HEIGHT_OFFSET)
@@ -2217,36 +1945,22 @@ def create_slide_19(prs):
             CHAT_API_CARD_HEIGHT - Inches(0.3)
         )
         tf = content_box.text_frame
-        tf.text = content_text
+        STYLE_CHAT_API_CONTENT.apply(tf, content_text)
         tf.word_wrap = True
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_CHAT_API_CONTENT
-        p.font.color.rgb = FONT_COLOR_CHAT_API_CONTENT
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
     return prs
 
 def create_slide_20(prs):
     """Slide 20: Chat API Architecture (copy of slide 19)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 20, 25)
+    slide = add_blank_slide(prs)
 
     # Title
     title_box = slide.shapes.add_textbox(
         Inches(1), CHAT_API_TITLE_Y,
         Inches(14), Inches(0.6)
     )
-    tf = title_box.text_frame
-    tf.text = "Chat API Architecture"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CHAT_API_TITLE
-    p.font.color.rgb = FONT_COLOR_CHAT_API_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_EXTRALIGHT
+    STYLE_CHAT_API_TITLE.apply(title_box.text_frame, "Chat API Architecture")
 
     # Card data: (role_name, badge_text, note_text, content_text, color)
     cards = [
@@ -2286,15 +2000,8 @@ def create_slide_20(prs):
 
         # Badge text
         tf = badge.text_frame
-        tf.text = badge_text
+        STYLE_CHAT_API_BADGE.apply(tf, badge_text, color=color)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_CHAT_API_BADGE
-        p.font.color.rgb = color
-        p.font.bold = True
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
         # Message note
         note_box = slide.shapes.add_textbox(
@@ -2303,14 +2010,8 @@ def create_slide_20(prs):
             CHAT_API_METADATA_WIDTH, Inches(0.4)
         )
         tf = note_box.text_frame
-        tf.text = note_text
+        STYLE_CHAT_API_NOTE.apply(tf, note_text)
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_CHAT_API_NOTE
-        p.font.color.rgb = FONT_COLOR_CHAT_API_NOTE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
         # Vertical divider
         divider_height = CHAT_API_CARD_HEIGHT - (2 * CHAT_API_DIVIDER_HEIGHT_OFFSET)
@@ -2334,22 +2035,15 @@ def create_slide_20(prs):
             CHAT_API_CARD_HEIGHT - Inches(0.3)
         )
         tf = content_box.text_frame
-        tf.text = content_text
+        STYLE_CHAT_API_CONTENT.apply(tf, content_text)
         tf.word_wrap = True
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.LEFT
-        p.font.size = FONT_SIZE_CHAT_API_CONTENT
-        p.font.color.rgb = FONT_COLOR_CHAT_API_CONTENT
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_REGULAR
 
     return prs
 
 def create_slide_21(prs):
     """Slide 21: RETRIEVAL AUGMENTED GENERATION"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 21, 25)
+    slide = add_blank_slide(prs)
 
     # The three keywords - using KEYWORD_THEME_TECH (like slides 4, 7, 16)
     keywords = [
@@ -2365,40 +2059,20 @@ def create_slide_21(prs):
             KEYWORD_BOX_X, Inches(y_pos),
             KEYWORD_BOX_WIDTH, KEYWORD_BOX_HEIGHT
         )
-        tf = keyword_box.text_frame
-        tf.text = keyword["text"]
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_KEYWORD
-        p.font.bold = FONT_BOLD_KEYWORD
-        p.font.color.rgb = keyword["color"]
-
-        # CRITICAL: Font name must be set at RUN level!
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_KEYWORD  # Inter ExtraLight (font-weight: 200)
-            run.font.character_spacing = FONT_LETTER_SPACING_KEYWORD
+        STYLE_KEYWORD.apply(keyword_box.text_frame, keyword["text"], color=keyword["color"])
 
     return prs
 
 def create_slide_22(prs):
     """Slide 22: Document Processing (RAG)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, 22, 25)
+    slide = add_blank_slide(prs)
 
     # Title - Fixed header
     title_box = slide.shapes.add_textbox(
         CONTENT_HEADER_X, CONTENT_HEADER_Y,
         CONTENT_HEADER_WIDTH, CONTENT_HEADER_HEIGHT
     )
-    tf = title_box.text_frame
-    tf.text = DOC_PROC_TITLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_CONTENT_TITLE
-    p.font.bold = FONT_BOLD_CONTENT_TITLE
-    p.font.color.rgb = FONT_COLOR_CONTENT_TITLE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
+    STYLE_DOC_PROC_TITLE.apply(title_box.text_frame, DOC_PROC_TITLE)
 
     # === LEFT: PDF Documents ===
     # PDF1 (red) - bottom layer
@@ -2418,14 +2092,7 @@ def create_slide_22(prs):
         DOC_PROC_PDF_X + Inches(0.15), DOC_PROC_PDF_Y + Inches(0.15),
         DOC_PROC_PDF_WIDTH - Inches(0.3), Inches(0.4)
     )
-    tf = pdf1_header.text_frame
-    tf.text = "📄 PDF1"
-    p = tf.paragraphs[0]
-    p.font.size = FONT_SIZE_DOC_PROC_PDF_HEADER
-    p.font.bold = True
-    p.font.color.rgb = COLOR_PDF1
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
+    STYLE_DOC_PROC_PDF_HEADER.apply(pdf1_header.text_frame, "📄 PDF1", color=COLOR_PDF1)
 
     # PDF2 (cyan) - top layer, offset
     pdf2_x = DOC_PROC_PDF_X + Inches(0.4)
@@ -2446,26 +2113,14 @@ def create_slide_22(prs):
         pdf2_x + Inches(0.15), pdf2_y + Inches(0.15),
         DOC_PROC_PDF_WIDTH - Inches(0.3), Inches(0.4)
     )
-    tf = pdf2_header.text_frame
-    tf.text = "📄 PDF2"
-    p = tf.paragraphs[0]
-    p.font.size = FONT_SIZE_DOC_PROC_PDF_HEADER
-    p.font.bold = True
-    p.font.color.rgb = COLOR_PDF2
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
+    STYLE_DOC_PROC_PDF_HEADER.apply(pdf2_header.text_frame, "📄 PDF2", color=COLOR_PDF2)
 
     # === CENTER: Arrow ===
     arrow_box = slide.shapes.add_textbox(
         DOC_PROC_ARROW_X, DOC_PROC_ARROW_Y,
         Inches(1), Inches(1)
     )
-    tf = arrow_box.text_frame
-    tf.text = "→"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = DOC_PROC_ARROW_SIZE
-    p.font.color.rgb = COLOR_ACCENT_BLUE
+    STYLE_DOC_PROC_ARROW.apply(arrow_box.text_frame, "→")
 
     # === RIGHT: Vector Matrix ===
     chunks = [
@@ -2483,39 +2138,15 @@ def create_slide_22(prs):
             DOC_PROC_VECTOR_LABEL_WIDTH, DOC_PROC_VECTOR_CELL_HEIGHT
         )
         tf = label_box.text_frame
-        tf.text = chunk_label
+        STYLE_DOC_PROC_CHUNK_LABEL.apply(tf, chunk_label)
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.RIGHT
-        p.font.size = FONT_SIZE_DOC_PROC_LABEL
-        p.font.bold = True
-        p.font.color.rgb = COLOR_ACCENT_BLUE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_INTER_SEMIBOLD
 
         # Vector cells
         cell_x = DOC_PROC_VECTOR_X + DOC_PROC_VECTOR_LABEL_WIDTH + Inches(0.2)
         for i, value in enumerate(values):
-            cell = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                cell_x + (i * (DOC_PROC_VECTOR_CELL_WIDTH + Inches(0.08))), current_y,
-                DOC_PROC_VECTOR_CELL_WIDTH, DOC_PROC_VECTOR_CELL_HEIGHT
-            )
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = COLOR_BACKGROUND_LIGHT
-            cell.line.color.rgb = RGBColor(64, 64, 64)
-            cell.line.width = Pt(1)
-
-            # Cell text
-            tf = cell.text_frame
-            tf.text = value
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.alignment = PP_ALIGN.CENTER
-            p.font.size = FONT_SIZE_DOC_PROC_VECTOR
-            p.font.color.rgb = COLOR_TEXT_GRAY
-            for run in p.runs:
-                run.font.name = FONT_FAMILY_MONOSPACE
+            SHAPE_DOC_PROC_VECTOR_CELL.stamp(slide.shapes, cell_x + (i * (DOC_PROC_VECTOR_CELL_WIDTH + Inches(0.08))),
+                                             current_y, DOC_PROC_VECTOR_CELL_WIDTH, DOC_PROC_VECTOR_CELL_HEIGHT,
+                                             value)
 
         current_y += DOC_PROC_VECTOR_CELL_HEIGHT + Inches(0.2)
 
@@ -2535,11 +2166,8 @@ def create_slide_22(prs):
         DOC_PROC_USER_ICON_SIZE, DOC_PROC_USER_ICON_SIZE
     )
     tf = user_icon_text.text_frame
-    tf.text = "👤"
+    STYLE_DOC_PROC_USER_ICON.apply(tf, "👤")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = Pt(20)
 
     # Query text
     query_box = slide.shapes.add_textbox(
@@ -2547,15 +2175,8 @@ def create_slide_22(prs):
         DOC_PROC_QUERY_TEXT_WIDTH, Inches(0.5)
     )
     tf = query_box.text_frame
-    tf.text = '"What are the compliance requirements?"'
+    STYLE_DOC_PROC_QUERY.apply(tf, '"What are the compliance requirements?"')
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.LEFT
-    p.font.size = FONT_SIZE_DOC_PROC_QUERY
-    p.font.color.rgb = COLOR_TEXT_WHITE
-    p.font.italic = True
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_REGULAR
 
     # Arrow
     arrow_box2 = slide.shapes.add_textbox(
@@ -2563,114 +2184,50 @@ def create_slide_22(prs):
         Inches(0.5), Inches(0.5)
     )
     tf = arrow_box2.text_frame
-    tf.text = "→"
+    STYLE_DOC_PROC_QUERY_ARROW.apply(tf, "→")
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = Pt(36)
-    p.font.color.rgb = COLOR_ACCENT_BLUE
 
     # Search term vector
     search_label = slide.shapes.add_textbox(
         DOC_PROC_SEARCH_X, DOC_PROC_QUERY_Y - Inches(0.3),
         Inches(2), Inches(0.25)
     )
-    tf = search_label.text_frame
-    tf.text = "Search term"
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.LEFT
-    p.font.size = FONT_SIZE_DOC_PROC_LABEL
-    p.font.bold = True
-    p.font.color.rgb = COLOR_ACCENT_BLUE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
+    STYLE_DOC_PROC_SEARCH_LABEL.apply(search_label.text_frame, "Search term")
 
     # Search vector cells (highlighted in blue)
     search_values = ["0.19", "-0.73", "0.44", "0.88", "-0.31", "..."]
     cell_x = DOC_PROC_SEARCH_X
     cell_y = DOC_PROC_QUERY_Y + Inches(0.05)
     for i, value in enumerate(search_values):
-        cell = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            cell_x + (i * (DOC_PROC_VECTOR_CELL_WIDTH + Inches(0.08))), cell_y,
-            DOC_PROC_VECTOR_CELL_WIDTH, DOC_PROC_VECTOR_CELL_HEIGHT
-        )
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(30, 60, 90)  # Dark blue background
-        cell.line.color.rgb = COLOR_ACCENT_BLUE
-        cell.line.width = Pt(2)
-
-        # Cell text
-        tf = cell.text_frame
-        tf.text = value
-        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        p.font.size = FONT_SIZE_DOC_PROC_VECTOR
-        p.font.bold = True
-        p.font.color.rgb = COLOR_ACCENT_BLUE
-        for run in p.runs:
-            run.font.name = FONT_FAMILY_MONOSPACE
+        SHAPE_DOC_PROC_SEARCH_CELL.stamp(slide.shapes, cell_x + (i * (DOC_PROC_VECTOR_CELL_WIDTH + Inches(0.08))),
+                                         cell_y, DOC_PROC_VECTOR_CELL_WIDTH, DOC_PROC_VECTOR_CELL_HEIGHT, value)
 
     return prs
 
-def create_why_now_slide(prs, slide_num, step_data):
+def create_why_now_slide(prs, step_data):
     """Helper function to create a single Why Now slide with one card"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    apply_master_elements(slide, slide_num, 25)
+    slide = add_blank_slide(prs)
 
     # Title - prominent at top
     title_box = slide.shapes.add_textbox(
         Inches(1), WHY_NOW_TITLE_Y,
         Inches(14), Inches(0.6)
     )
-    tf = title_box.text_frame
-    tf.text = WHY_NOW_TITLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_WHY_NOW_TITLE
-    p.font.bold = True
-    p.font.color.rgb = COLOR_ACCENT_BLUE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_BOLD
+    STYLE_WHY_NOW_TITLE.apply(title_box.text_frame, WHY_NOW_TITLE)
 
     # Subtitle
     subtitle_box = slide.shapes.add_textbox(
         Inches(1), WHY_NOW_SUBTITLE_Y,
         Inches(14), Inches(0.3)
     )
-    tf = subtitle_box.text_frame
-    tf.text = WHY_NOW_SUBTITLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_WHY_NOW_SUBTITLE
-    p.font.bold = True
-    p.font.color.rgb = COLOR_ACCENT_BLUE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_MONOSPACE
+    STYLE_WHY_NOW_SUBTITLE.apply(subtitle_box.text_frame, WHY_NOW_SUBTITLE)
 
     # Card background
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        WHY_NOW_CARD_X, WHY_NOW_CARD_Y,
-        WHY_NOW_CARD_WIDTH, WHY_NOW_CARD_HEIGHT
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = RGBColor(31, 41, 55)
-    card.line.color.rgb = RGBColor(64, 64, 64)
-    card.line.width = WHY_NOW_CARD_BORDER_WIDTH
-    card.adjustments[0] = 0.08
+    SHAPE_WHY_NOW_CARD.stamp(slide.shapes, WHY_NOW_CARD_X, WHY_NOW_CARD_Y, WHY_NOW_CARD_WIDTH, WHY_NOW_CARD_HEIGHT)
 
     # Step number circle
-    circle = slide.shapes.add_shape(
-        MSO_SHAPE.OVAL,
-        WHY_NOW_CARD_X + WHY_NOW_CIRCLE_X_OFFSET,
-        WHY_NOW_CARD_Y + WHY_NOW_CIRCLE_Y_OFFSET,
-        WHY_NOW_CIRCLE_SIZE, WHY_NOW_CIRCLE_SIZE
-    )
-    circle.fill.solid()
-    circle.fill.fore_color.rgb = COLOR_ACCENT_BLUE
-    circle.line.width = Pt(0)
+    SHAPE_WHY_NOW_CIRCLE.stamp(slide.shapes, WHY_NOW_CARD_X + WHY_NOW_CIRCLE_X_OFFSET,
+                               WHY_NOW_CARD_Y + WHY_NOW_CIRCLE_Y_OFFSET, WHY_NOW_CIRCLE_SIZE, WHY_NOW_CIRCLE_SIZE)
 
     # Number text
     num_box = slide.shapes.add_textbox(
@@ -2679,15 +2236,8 @@ def create_why_now_slide(prs, slide_num, step_data):
         WHY_NOW_CIRCLE_SIZE, WHY_NOW_CIRCLE_SIZE
     )
     tf = num_box.text_frame
-    tf.text = step_data["number"]
+    STYLE_WHY_NOW_STEP_NUMBER.apply(tf, step_data["number"])
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_WHY_NOW_STEP_NUMBER
-    p.font.bold = True
-    p.font.color.rgb = COLOR_TEXT_WHITE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_BOLD
 
     # Step title
     title_x = WHY_NOW_CARD_X + WHY_NOW_CONTENT_X_OFFSET
@@ -2696,14 +2246,7 @@ def create_why_now_slide(prs, slide_num, step_data):
         title_x, title_y,
         Inches(9), Inches(0.35)
     )
-    tf = step_title_box.text_frame
-    tf.text = step_data["title"]
-    p = tf.paragraphs[0]
-    p.font.size = FONT_SIZE_WHY_NOW_STEP_TITLE
-    p.font.bold = True
-    p.font.color.rgb = COLOR_TEXT_WHITE
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
+    STYLE_WHY_NOW_STEP_TITLE.apply(step_title_box.text_frame, step_data["title"])
 
     # Bullets (stacked vertically)
     bullets_x = title_x
@@ -2722,30 +2265,14 @@ def create_why_now_slide(prs, slide_num, step_data):
 
         # Add text with bold label
         p = tf.paragraphs[0]
-        run1 = p.add_run()
-        run1.text = f"▸ {label} "
-        run1.font.size = FONT_SIZE_WHY_NOW_BULLET
-        run1.font.bold = True
-        run1.font.color.rgb = COLOR_TEXT_WHITE
-        run1.font.name = FONT_FAMILY_INTER_SEMIBOLD
-
-        run2 = p.add_run()
-        run2.text = text
-        run2.font.size = FONT_SIZE_WHY_NOW_BULLET
-        run2.font.color.rgb = COLOR_TEXT_GRAY
-        run2.font.name = FONT_FAMILY_INTER_REGULAR
+        STYLE_WHY_NOW_BULLET_LABEL.add_run(p, f"▸ {label} ")
+        STYLE_WHY_NOW_BULLET_TEXT.add_run(p, text)
 
     # Indicator badge
-    indicator = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        WHY_NOW_CARD_X + WHY_NOW_INDICATOR_X_OFFSET,
-        WHY_NOW_CARD_Y + WHY_NOW_INDICATOR_Y_OFFSET,
-        WHY_NOW_INDICATOR_WIDTH, WHY_NOW_INDICATOR_HEIGHT
-    )
-    indicator.fill.background()
-    indicator.line.color.rgb = step_data["indicator_color"]
-    indicator.line.width = Pt(1)
-    indicator.adjustments[0] = 0.25
+    SHAPE_WHY_NOW_INDICATOR.stamp(slide.shapes, WHY_NOW_CARD_X + WHY_NOW_INDICATOR_X_OFFSET,
+                                  WHY_NOW_CARD_Y + WHY_NOW_INDICATOR_Y_OFFSET,
+                                  WHY_NOW_INDICATOR_WIDTH, WHY_NOW_INDICATOR_HEIGHT,
+                                  line=step_data["indicator_color"])
 
     # Indicator text
     ind_text_box = slide.shapes.add_textbox(
@@ -2754,162 +2281,335 @@ def create_why_now_slide(prs, slide_num, step_data):
         WHY_NOW_INDICATOR_WIDTH, WHY_NOW_INDICATOR_HEIGHT
     )
     tf = ind_text_box.text_frame
-    tf.text = step_data["indicator"]
+    STYLE_WHY_NOW_INDICATOR.apply(tf, step_data["indicator"], color=step_data["indicator_color"])
     tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    p.font.size = FONT_SIZE_WHY_NOW_INDICATOR
-    p.font.bold = True
-    p.font.color.rgb = step_data["indicator_color"]
-    for run in p.runs:
-        run.font.name = FONT_FAMILY_INTER_SEMIBOLD
 
     return prs
 
 def create_slide_23(prs):
     """Slide 23: Why Now? - Card 1: AI Infrastructure Maturity"""
-    step_data = {
-        "number": "1",
-        "title": "AI Infrastructure Maturity",
-        "bullets": [
-            ("Cost Revolution:", "Dramatic hardware price reductions alongside significant power efficiency improvements"),
-            ("Container Management:", "Streamlined deployment and orchestration through Docker containerization technologies"),
-            ("Performance & Memory:", "Remarkable computational performance gains with extensive shared memory capabilities"),
-            ("Form & Operation:", "Ultra-compact form factors enabling whisper-quiet, enterprise-grade operation")
-        ],
-        "indicator": "⚡ TECHNICAL READINESS",
-        "indicator_color": COLOR_WHY_NOW_TECH
-    }
-    return create_why_now_slide(prs, 23, step_data)
+    return create_why_now_slide(prs, WHY_NOW_STEP_1)
 
 def create_slide_24(prs):
     """Slide 24: Why Now? - Card 2: Knowledge Worker Evolution"""
-    step_data = {
-        "number": "2",
-        "title": "Knowledge Worker Evolution",
-        "bullets": [
-            ("Phase 1 - Playground:", "ChatGPT experimentation and individual productivity gains"),
-            ("Phase 2 - Copilot:", "AI-assisted workflows and collaborative human-AI work"),
-            ("Phase 3 - Workforce:", "Autonomous AI agents managing organizational knowledge"),
-            ("Current Reality:", "73% of enterprises remain stuck between Phase 1-2")
-        ],
-        "indicator": "📈 MARKET DEMAND",
-        "indicator_color": COLOR_WHY_NOW_MARKET
-    }
-    return create_why_now_slide(prs, 24, step_data)
+    return create_why_now_slide(prs, WHY_NOW_STEP_2)
 
 def create_slide_25(prs):
     """Slide 25: Why Now? - Card 3: Data Sovereignty Crisis"""
-    step_data = {
-        "number": "3",
-        "title": "Data Sovereignty Crisis",
-        "bullets": [
-            ("Regulatory Enforcement:", "EU AI Act and GDPR violations creating existential compliance risks"),
-            ("Corporate Barriers:", "Fortune 500 companies cite data residency as primary AI adoption blocker"),
-            ("Market Solution:", "Local plug-and-play AI becoming the gold standard for enterprises"),
-            ("Value Proposition:", "Complete control, zero compliance risk, instant deployment capabilities")
-        ],
-        "indicator": "🏛️ REGULATORY FORCE",
-        "indicator_color": COLOR_WHY_NOW_REGULATORY
-    }
-    return create_why_now_slide(prs, 25, step_data)
-
-def create_presentation():
-    """Creates the complete presentation with consistent master elements"""
-    prs = Presentation()
+    return create_why_now_slide(prs, WHY_NOW_STEP_3)
+
+@functools.lru_cache(maxsize=1)
+def default_template_blob():
+    """Returns the bytes of python-pptx's default template, read from disk only once per process"""
+    from pptx.api import _default_pptx_path
+    with open(_default_pptx_path(), "rb") as f:
+        return f.read()
+
+def new_presentation():
+    """Creates an empty presentation with the Brain-Bridges slide size (16:9), theme and slide master"""
+    prs = Presentation(io.BytesIO(default_template_blob()))
     prs.slide_width = SLIDE_WIDTH
     prs.slide_height = SLIDE_HEIGHT
-    
-    # Slide 1: THE AI PARADOX
-    create_slide_1(prs)
-
-    # Slide 2: Organisations want AI
-    create_slide_2(prs)
-
-    # Slide 3: Market Reality
-    create_slide_3(prs)
-
-    # Slide 4: SOVEREIGN AI SOLUTION
-    create_slide_4(prs)
-
-    # Slide 5: TO BE DESIGNED
-    create_slide_5(prs)
-
-    # Slide 6: BRAIN-BRIDGES Hero Slide
-    create_slide_6(prs)
-
-    # Slide 7: TECHNICAL DEEP DIVE
-    create_slide_7(prs)
-
-    # Slide 8: Tokenization Intro - A Sample from legal domain
-    create_slide_8(prs)
-
-    # Slide 9: Vector Embeddings (Token → Vector Lookup)
-    create_slide_9(prs)
-
-    # Slide 10: Attention is all you need
-    create_slide_10(prs)
-
-    # Slide 11: Next word prediction
-    create_slide_11(prs)
-
-    # Slides 12-15: Autoregression (4 separate slides)
-    create_slide_12(prs)  # Step 1
-    create_slide_13(prs)  # Step 2
-    create_slide_14(prs)  # Step 3
-    create_slide_15(prs)  # Final
+    THEME.apply(prs)
+    apply_slide_master(prs)
+    return prs
 
-    # Slide 16: ON PREMISE MATTERS
-    create_slide_16(prs)
+def save_atomic(prs, path, reproducible=False):
+    """
+    Saves prs via a temp file + rename, so an open viewer never sees a half-written deck.
 
-    # Slide 17: The Fundamental Security Conflict
-    create_slide_17(prs)
+    With reproducible=True the file is byte-identical for identical content (see reproducible.py).
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        if reproducible:
+            from reproducible import save_reproducible
+            save_reproducible(prs, tmp_path)
+        else:
+            prs.save(tmp_path)
+    except BaseException:
+        # No half-written temp file left behind when saving fails
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+@contextlib.contextmanager
+def output_lock(directory="output"):
+    """Holds an exclusive lock on `directory`, so concurrent builds publish one after another"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".build.lock"), "a+b") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Closing the file releases the lock
+        yield
+
+# Limits every slide is checked against after it is built (see slide_budgets.py);
+# a registry entry overrides single limits with its own "budget"
+DEFAULT_SLIDE_BUDGET = {"cpu_ms": 100, "shapes": 50, "xml_kb": 40, "media_kb": 256}
+
+# Slide registry in deck order - each builder appends exactly one slide.
+# "section" groups slides that are previewed together (python3 generate_pptx.py --slides autoregression)
+SLIDE_REGISTRY = [
+    {"number": 1, "name": "ai-paradox", "section": "problem", "builder": create_slide_1},
+    {"number": 2, "name": "organisations-want-ai", "section": "problem", "builder": create_slide_2},
+    {"number": 3, "name": "market-reality", "section": "problem", "builder": create_slide_3},
+    {"number": 4, "name": "sovereign-ai-solution", "section": "solution", "builder": create_slide_4},
+    {"number": 5, "name": "brain-bridges-intro", "section": "solution", "builder": create_slide_5,
+     "budget": {"cpu_ms": 200}},
+    {"number": 6, "name": "brain-bridges-hero", "section": "solution", "builder": create_slide_6,
+     # Rounds and re-encodes the hero image on every build
+     "budget": {"cpu_ms": 250, "media_kb": 4096}},
+    {"number": 7, "name": "inference-mechanics", "section": "inference", "builder": create_slide_7},
+    {"number": 8, "name": "tokenization", "section": "inference", "builder": create_slide_8},
+    {"number": 9, "name": "vector-embeddings", "section": "inference", "builder": create_slide_9},
+    {"number": 10, "name": "attention-matrix", "section": "inference", "builder": create_slide_10},
+    {"number": 11, "name": "next-word-prediction", "section": "inference", "builder": create_slide_11},
+    {"number": 12, "name": "autoregression-step-1", "section": "autoregression", "builder": create_slide_12},
+    {"number": 13, "name": "autoregression-step-2", "section": "autoregression", "builder": create_slide_13},
+    {"number": 14, "name": "autoregression-step-3", "section": "autoregression", "builder": create_slide_14},
+    {"number": 15, "name": "autoregression-final", "section": "autoregression", "builder": create_slide_15},
+    {"number": 16, "name": "on-premise-matters", "section": "security", "builder": create_slide_16},
+    {"number": 17, "name": "security-conflict", "section": "security", "builder": create_slide_17},
+    {"number": 18, "name": "encryption-dilemma", "section": "security", "builder": create_slide_18},
+    {"number": 19, "name": "chat-api", "section": "chat-api", "builder": create_slide_19},
+    {"number": 20, "name": "chat-api-copy", "section": "chat-api", "builder": create_slide_20},
+    {"number": 21, "name": "rag", "section": "rag", "builder": create_slide_21},
+    {"number": 22, "name": "document-processing", "section": "rag", "builder": create_slide_22,
+     # Rotated PDF cards plus the vector grid
+     "budget": {"cpu_ms": 120, "shapes": 60, "xml_kb": 48}},
+    {"number": 23, "name": "why-now-infrastructure", "section": "why-now", "builder": create_slide_23},
+    {"number": 24, "name": "why-now-knowledge-workers", "section": "why-now", "builder": create_slide_24},
+    {"number": 25, "name": "why-now-sovereignty", "section": "why-now", "builder": create_slide_25},
+]
+
+def select_slides(selection=None):
+    """
+    Returns the registry entries matching a slide selection, in deck order.
 
-    # Slide 18: The Encryption Dilemma
-    create_slide_18(prs)
+    Args:
+        selection: Comma-separated slide numbers, ranges, slide names or sections,
+                   e.g. "10-15", "1,3,why-now" or "attention-matrix" (None = all slides)
+    """
+    if not selection:
+        return list(SLIDE_REGISTRY)
+
+    selected = set()
+    for item in selection.split(","):
+        item = item.strip()
+        if not item:
+            continue
+
+        if item.isdigit() or (item.count("-") == 1 and item.replace("-", "").isdigit()):
+            first, _, last = item.partition("-")
+            first = int(first)
+            last = int(last) if last else first
+            matches = {n for n in range(first, last + 1) if any(e["number"] == n for e in SLIDE_REGISTRY)}
+        else:
+            matches = {e["number"] for e in SLIDE_REGISTRY if item in (e["name"], e["section"])}
 
-    # Slide 19: Chat API Architecture
-    create_slide_19(prs)
+        if not matches:
+            sections = sorted({e["section"] for e in SLIDE_REGISTRY})
+            raise ValueError(
+                f"Unknown slide selection '{item}' "
+                f"(use numbers 1-{len(SLIDE_REGISTRY)}, slide names or sections: {', '.join(sections)})"
+            )
+        selected |= matches
 
-    # Slide 20: Chat API Architecture (copy)
-    create_slide_20(prs)
+    return [entry for entry in SLIDE_REGISTRY if entry["number"] in selected]
 
-    # Slide 21: RAG
-    create_slide_21(prs)
+def build_slide(prs, entry):
+    """Runs the entry's builder on prs and checks the new slide against its budget"""
+    started = time.process_time()
+    entry["builder"](prs)
+    check_slide_budget(entry, prs, (time.process_time() - started) * 1000, DEFAULT_SLIDE_BUDGET)
 
-    # Slide 22: Document Processing
-    create_slide_22(prs)
+def create_presentation(slides=None):
+    """Creates the complete presentation (or only the given registry entries) with consistent master elements"""
+    prs = new_presentation()
 
-    # Slide 23: Why Now? - Card 1: AI Infrastructure Maturity
-    create_slide_23(prs)
+    for entry in (SLIDE_REGISTRY if slides is None else slides):
+        build_slide(prs, entry)
 
-    # Slide 24: Why Now? - Card 2: Knowledge Worker Evolution
-    create_slide_24(prs)
+    return set_slide_total(prs)
 
-    # Slide 25: Why Now? - Card 3: Data Sovereignty Crisis
-    create_slide_25(prs)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the Brain-Bridges PowerPoint deck")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Render slides in N worker processes (default: 1 = serial build, 0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Reuse unchanged slides from the content-hashed cache in .build_cache/"
+    )
+    parser.add_argument(
+        "--slides", metavar="SELECTION",
+        help="Build only these slides into a preview deck, e.g. 10-15, 1,3,22 or a section like autoregression"
+    )
+    parser.add_argument(
+        "--list-slides", action="store_true",
+        help="Print the slide registry (numbers, names, sections) and exit"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Stay running and rebuild changed slides whenever generate_pptx.py, design_tokens.py or assets/ change"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Write each slide into the package as soon as it is built (flat memory for very large decks)"
+    )
+    parser.add_argument(
+        "--reproducible", action="store_true", default="SOURCE_DATE_EPOCH" in os.environ,
+        help="Byte-identical output for identical inputs: fixed ZIP metadata and docProps "
+             "(default when SOURCE_DATE_EPOCH is set)"
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="output/Brain-Bridges_PROFILE.json", metavar="JSON_PATH",
+        help="Measure time, memory, shapes and XML size per slide and for the save step; "
+             "prints a table and writes JSON (default: output/Brain-Bridges_PROFILE.json)"
+    )
+    parser.add_argument(
+        "--memory-profile", nargs="?", const="output/Brain-Bridges_MEMORY.json", metavar="JSON_PATH",
+        help="tracemalloc snapshots around every slide builder and the save step: top allocation sites "
+             "and retained growth (default: output/Brain-Bridges_MEMORY.json)"
+    )
+    parser.add_argument(
+        "--budgets", choices=BUDGET_MODES, default=os.environ.get(BUDGET_MODE_ENV, "warn"),
+        help="Slides over their CPU time/shape/XML/media budget (DEFAULT_SLIDE_BUDGET, \"budget\" in SLIDE_REGISTRY): "
+             "warn (default), fail the build, or off"
+    )
+    parser.add_argument(
+        "--trace", nargs="?", const="output/Brain-Bridges_TRACE.json", metavar="JSON_PATH",
+        help="Record a timeline of slide builders, image operations, save and ZIP writes (also in worker "
+             "processes) for chrome://tracing or Perfetto (default: output/Brain-Bridges_TRACE.json)"
+    )
+    args = parser.parse_args()
+
+    if args.list_slides:
+        for entry in SLIDE_REGISTRY:
+            print(f"{entry['number']:>3}  {entry['section']:<15} {entry['name']}")
+        raise SystemExit(0)
 
-    return prs
+    try:
+        slides = select_slides(args.slides)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.stream and (args.incremental or args.workers != 1 or args.watch):
+        parser.error("--stream builds slide by slide and cannot be combined with --workers, --incremental or --watch")
+    if args.profile and (args.stream or args.incremental or args.workers != 1 or args.watch):
+        parser.error("--profile measures the serial build and cannot be combined with "
+                     "--stream, --workers, --incremental or --watch")
+    if args.memory_profile and (args.profile or args.stream or args.incremental or args.workers != 1 or args.watch):
+        parser.error("--memory-profile traces the serial build and cannot be combined with "
+                     "--profile, --stream, --workers, --incremental or --watch")
+    if args.trace and (args.profile or args.memory_profile or args.watch):
+        parser.error("--trace cannot be combined with --profile, --memory-profile or --watch")
+
+    # Via the environment, so worker processes check budgets the same way
+    os.environ[BUDGET_MODE_ENV] = args.budgets
+
+    if args.watch:
+        import watch_mode
+        watch_mode.watch(args.slides)
+        raise SystemExit(0)
+
+    if args.slides:
+        print(f"🔍 Building preview deck with {len(slides)} slides: {', '.join(str(e['number']) for e in slides)}")
+    else:
+        print("🎨 Generating Brain-Bridges PowerPoint V3 with consistent master elements...")
+
+    if args.trace:
+        import atexit
+        from build_trace import tracing
+        # Imported before tracing starts, so their functions are wrapped as well
+        import build_cache, parallel_build, stream_writer  # noqa: F401
+        # Closed when the process exits, so the trace covers the preview as well as the full build
+        trace_context = contextlib.ExitStack()
+        trace_context.callback(print, f"🧵 Trace written: {args.trace}")
+        trace_context.enter_context(tracing(args.trace))
+        atexit.register(trace_context.close)
 
-if __name__ == "__main__":
-    print("🎨 Generating Brain-Bridges PowerPoint V3 with consistent master elements...")
-    prs = create_presentation()
+    try:
+        if args.stream:
+            # Slides are built while the package is written, see write_deck() below
+            prs = None
+        elif args.incremental:
+            from build_cache import create_presentation_incremental
+            prs, rebuilt = create_presentation_incremental(slides, workers=args.workers)
+            print(f"♻️  Incremental build: {len(prs.slides) - len(rebuilt)} slides from cache, {len(rebuilt)} rebuilt")
+        elif args.profile:
+            from build_profile import profile_presentation
+            prs, profile_records = profile_presentation(slides)
+        elif args.memory_profile:
+            from memory_profile import memory_profile_presentation
+            prs, memory_session = memory_profile_presentation(slides)
+        elif args.workers == 1:
+            prs = create_presentation(slides)
+        else:
+            from parallel_build import create_presentation_parallel
+            prs = create_presentation_parallel(slides, workers=args.workers or None)
+            print(f"⚡ Slides rendered in parallel ({args.workers or os.cpu_count()} workers)")
+    except SlideBudgetError as e:
+        parser.exit(1, f"❌ {e}\n")
+
+    def write_deck(path):
+        if args.stream:
+            from stream_writer import write_presentation_streaming
+            try:
+                write_presentation_streaming(path, (functools.partial(build_slide, entry=entry) for entry in slides),
+                                             reproducible=args.reproducible)
+            except SlideBudgetError as e:
+                parser.exit(1, f"❌ {e}\n")
+        elif args.profile:
+            from build_profile import print_profile, profile_save, write_profile_json
+            profile_save(profile_records, prs, path, reproducible=args.reproducible)
+            print_profile(profile_records)
+            write_profile_json(profile_records, args.profile)
+            print(f"⏱️  Profile written: {args.profile}")
+        elif args.memory_profile:
+            from memory_profile import memory_profile_save, print_memory_profile, write_memory_profile_json
+            memory_profile_save(memory_session, prs, path, reproducible=args.reproducible)
+            print_memory_profile(memory_session)
+            write_memory_profile_json(memory_session, args.memory_profile)
+            print(f"🧠 Memory profile written: {args.memory_profile}")
+        else:
+            save_atomic(prs, path, reproducible=args.reproducible)
 
     # Create output directory if it doesn't exist
     os.makedirs("output", exist_ok=True)
 
-    # Generate timestamp in format: YYYY_MM_DD___HH_MM_SS
-    timestamp = datetime.now().strftime("%Y_%m_%d___%H_%M_%S")
-
-    # Save timestamped version
-    timestamped_path = f"output/{timestamp}__Brain-Bridges.pptx"
-    prs.save(timestamped_path)
-    print(f"✅ Timestamped version created: {timestamped_path}")
-
-    # Save LATEST version (copy of timestamped file)
-    latest_path = "output/Brain-Bridges_LATEST.pptx"
-    shutil.copy2(timestamped_path, latest_path)
-    print(f"✅ Latest version updated: {latest_path}")
+    if args.slides:
+        # Previews never replace the timestamped history or the LATEST deck
+        preview_path = "output/Brain-Bridges_PREVIEW.pptx"
+        write_deck(preview_path)
+        print(f"✅ Preview deck created: {preview_path}")
+        raise SystemExit(0)
+
+    # The lock keeps concurrent builds from publishing over each other
+    with output_lock("output"):
+        # Build id = timestamp in format: YYYY_MM_DD___HH_MM_SS
+        from history_store import list_builds, record_build
+        timestamp = datetime.now().strftime("%Y_%m_%d___%H_%M_%S")
+        build_id = timestamp
+        suffix = 2
+        while build_id in list_builds():
+            build_id = f"{timestamp}_{suffix}"
+            suffix += 1
+
+        # Serialized once, written via temp file + rename
+        latest_path = "output/Brain-Bridges_LATEST.pptx"
+        write_deck(latest_path)
+        print(f"✅ Latest version updated: {latest_path}")
+
+        # History keeps every part once by content hash, instead of a full copy per run
+        new_parts, new_bytes = record_build(latest_path, build_id)
+        print(f"🗂️  Build {build_id} recorded in output/.history ({new_parts} new parts, {new_bytes / 1024:.1f} KB)")
     print("")
     print("📋 Slide Master Configuration:")
     print("   ✓ Background color: rgb(17, 24, 39)")
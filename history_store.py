@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Content-addressed build history for output/
+
+Instead of a full timestamped copy per run, every build is recorded as a
+small manifest that lists the package parts (ZIP members) of the deck by
+content hash. Each part is stored once in output/.history/objects/, so the
+hero image, the icons and every unchanged slide cost disk space only the
+first time they appear. Any recorded build can be restored to a .pptx again.
+
+    python3 history_store.py list
+    python3 history_store.py restore 2025_11_17___15_26_22
+    python3 history_store.py prune --keep 20
+    python3 history_store.py compact
+    python3 history_store.py import     # move old timestamped decks into the store
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import zipfile
+import zlib
+from datetime import datetime
+
+HISTORY_DIR = "output/.history"
+
+# Loose timestamped decks from before the history store, see import_timestamped_decks()
+TIMESTAMPED_DECK_PATTERN = re.compile(r"^(\d{4}_\d{2}_\d{2}___\d{2}_\d{2}_\d{2}(?:_\d+)?)__Brain-Bridges\.pptx$")
+
+# Build id: timestamp plus a counter for builds within the same second (..._2, ..._10)
+BUILD_ID_PATTERN = re.compile(r"^(\d{4}_\d{2}_\d{2}___\d{2}_\d{2}_\d{2})(?:_(\d+))?$")
+
+
+def _write_atomic(path, data):
+    """Writes `data` via a temp file + rename, so an interrupted run never leaves a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _object_path(digest, history_dir):
+    return os.path.join(history_dir, "objects", digest[:2], digest)
+
+
+def _manifest_path(build_id, history_dir):
+    return os.path.join(history_dir, "manifests", f"{build_id}.json")
+
+
+def _build_order(build_id):
+    """Sort key for build ids: by timestamp, then numerically by the counter (_2 before _10)"""
+    match = BUILD_ID_PATTERN.match(build_id)
+    if match is None:
+        return (build_id, 0)
+    return (match.group(1), int(match.group(2) or 1))
+
+
+def list_builds(history_dir=HISTORY_DIR):
+    """Returns the recorded build ids, oldest first"""
+    return sorted((os.path.basename(path)[:-len(".json")]
+                   for path in glob.glob(os.path.join(history_dir, "manifests", "*.json"))),
+                  key=_build_order)
+
+
+def load_manifest(build_id, history_dir=HISTORY_DIR):
+    """Returns the manifest dict of a recorded build; raises KeyError for unknown builds"""
+    try:
+        with open(_manifest_path(build_id, history_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise KeyError(f"Unknown build '{build_id}' (see: python3 history_store.py list)") from None
+
+
+def record_build(pptx_path, build_id, history_dir=HISTORY_DIR):
+    """
+    Records the deck at `pptx_path` as build `build_id`.
+
+    Returns:
+        (new_parts, new_bytes) - parts and compressed bytes that were not stored yet
+    """
+    os.makedirs(os.path.join(history_dir, "manifests"), exist_ok=True)
+
+    with open(pptx_path, "rb") as f:
+        file_hash = hashlib.sha256(f.read()).hexdigest()
+
+    members = []
+    new_parts = new_bytes = 0
+    with zipfile.ZipFile(pptx_path) as zipf:
+        for info in zipf.infolist():
+            data = zipf.read(info)
+            digest = hashlib.sha256(data).hexdigest()
+            object_path = _object_path(digest, history_dir)
+            if not os.path.exists(object_path):
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                compressed = zlib.compress(data, 9)
+                _write_atomic(object_path, compressed)
+                new_parts += 1
+                new_bytes += len(compressed)
+            # ZIP metadata is kept so restore() can write the same archive again
+            members.append({
+                "name": info.filename,
+                "sha256": digest,
+                "date_time": list(info.date_time),
+                "compress_type": info.compress_type,
+                "create_system": info.create_system,
+                "external_attr": info.external_attr,
+            })
+
+    manifest = {
+        "build": build_id,
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "sha256": file_hash,
+        "size": os.path.getsize(pptx_path),
+        "members": members,
+    }
+    _write_atomic(_manifest_path(build_id, history_dir), json.dumps(manifest, indent=1).encode("utf-8"))
+    return new_parts, new_bytes
+
+
+def restore_build(build_id, output_path, history_dir=HISTORY_DIR):
+    """
+    Writes the recorded build `build_id` to `output_path`.
+
+    Returns:
+        True if the restored file is byte-identical to the recorded one
+        (False means same parts, but the local zlib compresses differently)
+    """
+    manifest = load_manifest(build_id, history_dir)
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp_path, "w") as zipf:
+        for member in manifest["members"]:
+            with open(_object_path(member["sha256"], history_dir), "rb") as f:
+                data = zlib.decompress(f.read())
+            info = zipfile.ZipInfo(member["name"], date_time=tuple(member["date_time"]))
+            info.compress_type = member["compress_type"]
+            info.create_system = member["create_system"]
+            info.external_attr = member["external_attr"]
+            zipf.writestr(info, data)
+    os.replace(tmp_path, output_path)
+
+    with open(output_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest() == manifest["sha256"]
+
+
+def prune(keep, history_dir=HISTORY_DIR):
+    """Deletes all but the newest `keep` builds; returns the removed build ids (run compact() afterwards)"""
+    if keep < 1:
+        raise ValueError(f"keep must be at least 1, got {keep}")
+    builds = list_builds(history_dir)
+    removed = builds[:-keep]
+    for build_id in removed:
+        os.remove(_manifest_path(build_id, history_dir))
+    return removed
+
+
+def import_timestamped_decks(output_dir="output", history_dir=HISTORY_DIR):
+    """
+    Records the loose timestamped decks in `output_dir` (from before the
+    history store) as builds and deletes the files.
+
+    Returns:
+        (imported, freed_bytes)
+    """
+    imported = freed_bytes = 0
+    for name in sorted(os.listdir(output_dir)):
+        match = TIMESTAMPED_DECK_PATTERN.match(name)
+        if match:
+            path = os.path.join(output_dir, name)
+            record_build(path, match.group(1), history_dir)
+            freed_bytes += os.path.getsize(path)
+            os.remove(path)
+            imported += 1
+    return imported, freed_bytes
+
+
+def compact(history_dir=HISTORY_DIR):
+    """Deletes every stored part that no manifest references anymore; returns the freed bytes"""
+    referenced = set()
+    for build_id in list_builds(history_dir):
+        referenced.update(member["sha256"] for member in load_manifest(build_id, history_dir)["members"])
+
+    freed_bytes = 0
+    for object_path in glob.glob(os.path.join(history_dir, "objects", "*", "*")):
+        if os.path.basename(object_path) not in referenced:
+            freed_bytes += os.path.getsize(object_path)
+            os.remove(object_path)
+    return freed_bytes
+
+
+def disk_usage(history_dir=HISTORY_DIR):
+    """Returns the bytes used by the history store"""
+    return sum(os.path.getsize(path)
+               for path in glob.glob(os.path.join(history_dir, "**", "*"), recursive=True)
+               if os.path.isfile(path))
+
+
+if __name__ == "__main__":
+    from generate_pptx import output_lock
+
+    parser = argparse.ArgumentParser(description="Manage the Brain-Bridges build history in output/.history")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List recorded builds")
+    restore_parser = commands.add_parser("restore", help="Write a recorded build back to a .pptx")
+    restore_parser.add_argument("build", help="Build id as shown by 'list' (e.g. 2025_11_17___15_26_22)")
+    restore_parser.add_argument("--output", help="Target file (default: output/<build>__Brain-Bridges.pptx)")
+    prune_parser = commands.add_parser("prune", help="Keep only the newest builds and free unused parts")
+    prune_parser.add_argument("--keep", type=int, required=True, help="Number of builds to keep (at least 1)")
+    commands.add_parser("compact", help="Free stored parts that no build references anymore")
+    commands.add_parser("import", help="Move the timestamped decks in output/ into the history store")
+    args = parser.parse_args()
+
+    with output_lock("output"):
+        if args.command == "list":
+            for build_id in list_builds():
+                manifest = load_manifest(build_id)
+                print(f"{build_id}  {manifest['size'] / 1024:8.1f} KB  {len(manifest['members'])} parts  {manifest['sha256'][:12]}")
+            print(f"📦 History store: {disk_usage() / 1024:.1f} KB on disk")
+
+        elif args.command == "restore":
+            output_path = args.output or f"output/{args.build}__Brain-Bridges.pptx"
+            try:
+                identical = restore_build(args.build, output_path)
+            except KeyError as e:
+                parser.error(e.args[0])
+            print(f"✅ Restored {args.build}: {output_path}" + ("" if identical else " (same parts, recompressed)"))
+
+        elif args.command == "prune":
+            if args.keep < 1:
+                parser.error("--keep must be at least 1")
+            removed = prune(args.keep)
+            freed_bytes = compact()
+            print(f"🧹 Removed {len(removed)} builds, freed {freed_bytes / 1024:.1f} KB")
+
+        elif args.command == "compact":
+            print(f"🧹 Freed {compact() / 1024:.1f} KB")
+
+        elif args.command == "import":
+            imported, freed_bytes = import_timestamped_decks()
+            print(f"🗂️  Imported {imported} timestamped decks, freed {freed_bytes / 1024:.1f} KB")
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Durable job queue for large batches of deck renders (SQLite in WAL mode)
+
+Deck specs (the same format as batch_build.py) are enqueued into a SQLite
+file. N worker processes claim jobs one at a time, render them with the
+batch builder (shared template, media and slide parts per worker) and record
+the result. A claimed job carries a lease that the worker renews while it
+renders; if a worker crashes, its lease runs out and another worker picks the
+job up again. A crash therefore loses at most the decks that were in flight,
+and a stopped batch continues where it left off when the workers are started
+again.
+
+Failed renders are retried with a growing delay up to --max-attempts times
+(this includes slides over budget with --budgets fail: a time overrun may be
+a one-off pause); invalid specs (unknown tokens or slides, checked before
+rendering and raised as batch_build.DeckSpecError) fail at once.
+
+    python3 job_queue.py enqueue decks.json           # add jobs to output/jobs.sqlite
+    python3 job_queue.py work --workers 8             # render until the queue is empty
+    python3 job_queue.py status                       # counts and failed jobs
+    python3 job_queue.py retry                        # queue the failed jobs again
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+
+DEFAULT_DB_PATH = "output/jobs.sqlite"
+
+# Seconds a claimed job stays with its worker without a lease renewal
+LEASE_SECONDS = 30
+
+# Attempts per job (first try included) before it is marked failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Delay before a failed job is retried, multiplied by the number of attempts so far
+RETRY_DELAY_SECONDS = 5
+
+# Seconds an idle worker waits before looking for jobs again
+POLL_SECONDS = 0.5
+
+# Seconds between progress lines
+PROGRESS_SECONDS = 5
+
+# Slide parts a worker keeps between jobs before its cache is reset
+SLIDE_CACHE_LIMIT = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    spec TEXT NOT NULL,
+    output TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',   -- queued, running, done or failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,             -- earliest start (retry delay)
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    render_s REAL,
+    size INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, available_at);
+"""
+
+
+def connect(db_path=DEFAULT_DB_PATH):
+    """Opens the queue database (created on first use) in WAL mode, with explicit transactions"""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    # WAL: workers read and write concurrently; NORMAL sync is still crash-safe for the process
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _transaction(conn, function, *args):
+    """Runs function(conn, *args) in one write transaction (BEGIN IMMEDIATE takes the write lock up front)"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = function(conn, *args)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return result
+
+
+def enqueue(conn, specs, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Adds one job per deck spec; returns the job ids"""
+    for spec in specs:
+        if not isinstance(spec, dict) or not spec.get("output"):
+            raise ValueError(f"Deck spec needs an \"output\" path: {spec!r}")
+
+    def insert(conn):
+        now = time.time()
+        return [conn.execute(
+            "INSERT INTO jobs (spec, output, max_attempts, available_at, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+            (json.dumps(spec), spec["output"], max_attempts, now, now),
+        ).lastrowid for spec in specs]
+
+    return _transaction(conn, insert)
+
+
+def claim_job(conn, worker_id, lease_seconds=LEASE_SECONDS):
+    """
+    Claims the oldest available job for `worker_id`.
+
+    Jobs whose lease expired (their worker crashed) are claimed again, or
+    marked failed once they used up their attempts.
+
+    Returns:
+        the job row, or None if no job is available right now
+    """
+    def claim(conn):
+        now = time.time()
+        conn.execute(
+            "UPDATE jobs SET state = 'failed', lease_owner = NULL, finished_at = ?, "
+            "error = coalesce(error, 'Lease expired (worker crashed or hung)') "
+            "WHERE state = 'running' AND lease_expires < ? AND attempts >= max_attempts",
+            (now, now),
+        )
+        job = conn.execute(
+            "SELECT * FROM jobs WHERE (state = 'queued' AND available_at <= ?) "
+            "OR (state = 'running' AND lease_expires < ?) ORDER BY id LIMIT 1",
+            (now, now),
+        ).fetchone()
+        if job is None:
+            return None
+        conn.execute(
+            "UPDATE jobs SET state = 'running', attempts = attempts + 1, lease_owner = ?, lease_expires = ? WHERE id = ?",
+            (worker_id, now + lease_seconds, job["id"]),
+        )
+        return job
+
+    return _transaction(conn, claim)
+
+
+def renew_lease(conn, job_id, worker_id, lease_seconds=LEASE_SECONDS):
+    """Extends the lease of a running job; returns False if the worker no longer holds it"""
+    cursor = conn.execute(
+        "UPDATE jobs SET lease_expires = ? WHERE id = ? AND state = 'running' AND lease_owner = ?",
+        (time.time() + lease_seconds, job_id, worker_id),
+    )
+    return cursor.rowcount == 1
+
+
+def complete_job(conn, job_id, worker_id, render_s, size):
+    """Marks a job done; returns False if its lease was lost (another worker took it over)"""
+    cursor = conn.execute(
+        "UPDATE jobs SET state = 'done', lease_owner = NULL, error = NULL, finished_at = ?, render_s = ?, size = ? "
+        "WHERE id = ? AND state = 'running' AND lease_owner = ?",
+        (time.time(), render_s, size, job_id, worker_id),
+    )
+    return cursor.rowcount == 1
+
+
+def fail_job(conn, job_id, worker_id, error, permanent=False):
+    """Queues a failed job for a retry after a delay, or marks it failed (permanent or out of attempts)"""
+    now = time.time()
+    conn.execute(
+        "UPDATE jobs SET lease_owner = NULL, error = ?, "
+        "state = CASE WHEN ? OR attempts >= max_attempts THEN 'failed' ELSE 'queued' END, "
+        "available_at = ? + ? * attempts, "
+        "finished_at = CASE WHEN ? OR attempts >= max_attempts THEN ? END "
+        "WHERE id = ? AND state = 'running' AND lease_owner = ?",
+        (error, permanent, now, RETRY_DELAY_SECONDS, permanent, now, job_id, worker_id),
+    )
+
+
+def retry_failed(conn):
+    """Queues all failed jobs again with fresh attempts; returns their number"""
+    return conn.execute(
+        "UPDATE jobs SET state = 'queued', attempts = 0, available_at = ?, finished_at = NULL WHERE state = 'failed'",
+        (time.time(),),
+    ).rowcount
+
+
+def queue_counts(conn):
+    """Returns {"queued", "running", "done", "failed"} job counts"""
+    counts = dict.fromkeys(("queued", "running", "done", "failed"), 0)
+    for row in conn.execute("SELECT state, count(*) AS jobs FROM jobs GROUP BY state"):
+        counts[row["state"]] = row["jobs"]
+    return counts
+
+
+def _has_open_jobs(conn):
+    return conn.execute("SELECT 1 FROM jobs WHERE state IN ('queued', 'running') LIMIT 1").fetchone() is not None
+
+
+def _keep_lease(db_path, job_id, worker_id, lease_seconds, stop):
+    """Heartbeat thread: renews the lease until `stop` is set (own connection, sqlite3 objects are per thread)"""
+    conn = connect(db_path)
+    try:
+        while not stop.wait(lease_seconds / 3):
+            if not renew_lease(conn, job_id, worker_id, lease_seconds):
+                return
+    finally:
+        conn.close()
+
+
+def render_job(job, slide_parts, reproducible=False):
+    """Renders the deck of one job to its output path; returns the file size"""
+    import batch_build
+    import generate_pptx
+
+    spec = json.loads(job["spec"])
+    prs, _ = batch_build.build_deck(spec, slide_parts)
+    output_dir = os.path.dirname(job["output"])
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    # Atomic: a crash mid-save leaves no half-written deck, and the retry simply writes it again
+    generate_pptx.save_atomic(prs, job["output"], reproducible=spec.get("reproducible", reproducible))
+    return os.path.getsize(job["output"])
+
+
+def work(db_path=DEFAULT_DB_PATH, lease_seconds=LEASE_SECONDS, reproducible=False):
+    """
+    Worker loop: claims and renders jobs until no job is queued or running anymore.
+
+    Returns:
+        number of jobs this worker completed
+    """
+    import batch_build
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    conn = connect(db_path)
+    slide_parts = {}
+    completed = 0
+    with batch_build.shared_media():
+        while True:
+            job = claim_job(conn, worker_id, lease_seconds)
+            if job is None:
+                # Jobs of other workers may still fail and come back for a retry
+                if not _has_open_jobs(conn):
+                    break
+                time.sleep(POLL_SECONDS)
+                continue
+
+            if len(slide_parts) > SLIDE_CACHE_LIMIT:
+                slide_parts.clear()
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=_keep_lease, args=(db_path, job["id"], worker_id, lease_seconds, stop),
+                                         daemon=True)
+            heartbeat.start()
+            started = time.perf_counter()
+            try:
+                size = render_job(job, slide_parts, reproducible)
+            except batch_build.DeckSpecError as e:
+                # Unknown tokens or slides: the same on every attempt
+                fail_job(conn, job["id"], worker_id, f"{type(e).__name__}: {e}", permanent=True)
+            except Exception:
+                fail_job(conn, job["id"], worker_id, traceback.format_exc(limit=5))
+            else:
+                if complete_job(conn, job["id"], worker_id, time.perf_counter() - started, size):
+                    completed += 1
+            finally:
+                stop.set()
+                heartbeat.join()
+    conn.close()
+    return completed
+
+
+def _work_process(db_path, lease_seconds, reproducible):
+    work(db_path, lease_seconds, reproducible)
+
+
+def run_workers(db_path=DEFAULT_DB_PATH, workers=None, lease_seconds=LEASE_SECONDS, reproducible=False,
+                progress_seconds=PROGRESS_SECONDS):
+    """
+    Runs `workers` worker processes until the queue is drained, printing progress.
+
+    A worker process that dies is replaced while jobs are open; the job it had
+    claimed goes back to the queue once its lease runs out.
+
+    Returns:
+        final queue_counts()
+    """
+    workers = workers or os.cpu_count()
+    conn = connect(db_path)
+    done_before = queue_counts(conn)["done"]
+    started = time.perf_counter()
+
+    def start_worker():
+        process = multiprocessing.Process(target=_work_process, args=(db_path, lease_seconds, reproducible))
+        process.start()
+        return process
+
+    processes = [start_worker() for _ in range(workers)]
+    next_progress = time.perf_counter() + progress_seconds
+    while any(process.is_alive() for process in processes):
+        time.sleep(POLL_SECONDS)
+        for index, process in enumerate(processes):
+            if not process.is_alive() and process.exitcode != 0 and _has_open_jobs(conn):
+                print(f"⚠️  Worker {process.pid} died (exit code {process.exitcode}), starting a new one")
+                processes[index] = start_worker()
+        if time.perf_counter() >= next_progress:
+            next_progress += progress_seconds
+            counts = queue_counts(conn)
+            rate = (counts["done"] - done_before) / (time.perf_counter() - started)
+            print(f"📦 {counts['done']} done, {counts['running']} running, {counts['queued']} queued, "
+                  f"{counts['failed']} failed - {rate:.1f} decks/s")
+
+    counts = queue_counts(conn)
+    conn.close()
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Durable SQLite job queue for Brain-Bridges deck renders")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"Queue database (default: {DEFAULT_DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    enqueue_parser = commands.add_parser("enqueue", help="Add one job per deck spec")
+    enqueue_parser.add_argument("specs", metavar="DECK_SPECS.json", help="JSON list of deck specs (see batch_build.py)")
+    enqueue_parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                                help=f"Attempts per job before it is marked failed (default: {DEFAULT_MAX_ATTEMPTS})")
+    work_parser = commands.add_parser("work", help="Render queued jobs until the queue is empty")
+    work_parser.add_argument("--workers", type=int, default=0,
+                             help="Worker processes (default: 0 = one per CPU core)")
+    work_parser.add_argument("--lease", type=float, default=LEASE_SECONDS,
+                             help=f"Seconds before a crashed worker's job is taken over (default: {LEASE_SECONDS})")
+    work_parser.add_argument("--reproducible", action="store_true", default="SOURCE_DATE_EPOCH" in os.environ,
+                             help="Byte-identical decks (default when SOURCE_DATE_EPOCH is set)")
+    commands.add_parser("status", help="Show job counts and failed jobs")
+    commands.add_parser("retry", help="Queue all failed jobs again")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "enqueue":
+        if args.max_attempts < 1:
+            parser.error("--max-attempts must be at least 1")
+        with open(args.specs, encoding="utf-8") as f:
+            try:
+                job_ids = enqueue(conn, json.load(f), args.max_attempts)
+            except ValueError as e:
+                parser.error(str(e))
+        print(f"📥 {len(job_ids)} jobs queued in {args.db}")
+
+    elif args.command == "work":
+        if args.lease <= 0:
+            parser.error("--lease must be positive")
+        started = time.perf_counter()
+        done_before = queue_counts(conn)["done"]
+        counts = run_workers(args.db, args.workers or None, args.lease, args.reproducible)
+        elapsed = time.perf_counter() - started
+        print(f"✅ {counts['done'] - done_before} decks in {elapsed:.1f} s "
+              f"({(counts['done'] - done_before) / elapsed:.1f} decks/s), {counts['failed']} failed")
+
+    elif args.command == "status":
+        counts = queue_counts(conn)
+        print(f"📦 {counts['done']} done, {counts['running']} running, {counts['queued']} queued, {counts['failed']} failed")
+        for job in conn.execute("SELECT id, output, attempts, error FROM jobs WHERE state = 'failed' ORDER BY id"):
+            print(f"❌ #{job['id']} {job['output']} ({job['attempts']} attempts): {job['error'].strip().splitlines()[-1]}")
+
+    elif args.command == "retry":
+        print(f"🔁 {retry_failed(conn)} failed jobs queued again")
+    conn.close()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Memory profile of the build (python3 generate_pptx.py --memory-profile)
+
+Takes a tracemalloc snapshot before and after new_presentation() (template
+load and slide master), every create_slide_N call and the save, and reports
+per step:
+- the memory the step allocated and kept (traced growth), and its peak
+- the top allocation sites of that growth: the line that allocated it
+  (often inside python-pptx or lxml) and the line in this project that led there
+- the growth of the process RSS
+
+At the end it lists what the whole build still holds on to (retained growth
+since the first slide), so leaks and bloat can be traced to one builder.
+
+tracemalloc only sees memory allocated through Python. The lxml element
+trees (libxml2) and the pixel buffers of PIL images are allocated in C and
+only show up in the RSS column: a step with large RSS growth but small traced
+growth spends its memory in XML trees or images, not in Python objects.
+"""
+
+import functools
+import json
+import os
+import tracemalloc
+from datetime import datetime
+
+import generate_pptx
+
+DEFAULT_MEMORY_PROFILE_PATH = "output/Brain-Bridges_MEMORY.json"
+
+# Frames stored per allocation, enough to reach from lxml/python-pptx back into the builders
+TRACE_FRAMES = 25
+
+# Allocation sites reported per step
+TOP_SITES = 5
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Allocations made by the profiler itself (the snapshots) and by imports
+_IGNORED_FILES = {
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+}
+
+
+def _rss_kb():
+    """Current resident set size in KB (Linux), or None where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _frame_label(frame):
+    return f"{os.path.relpath(frame.filename, PROJECT_DIR) if frame.filename.startswith(PROJECT_DIR) else frame.filename}:{frame.lineno}"
+
+
+@functools.lru_cache(maxsize=None)
+def _project_caller(traceback):
+    """Most recent frame of the traceback that lies in this project (None if there is none)"""
+    for frame in reversed(traceback):
+        if frame.filename.startswith(PROJECT_DIR):
+            return _frame_label(frame)
+    return None
+
+
+def take_grouped_snapshot():
+    """
+    Takes a tracemalloc snapshot grouped by traceback: {traceback: (size, count)}.
+
+    Grouping walks every trace, so each snapshot is grouped once and reused as
+    "after" of one step and "before" of the next.
+    """
+    return {stat.traceback: (stat.size, stat.count)
+            for stat in tracemalloc.take_snapshot().statistics("traceback")}
+
+
+def top_sites(before, after, limit=TOP_SITES):
+    """
+    Returns the allocation sites that grew most between two grouped snapshots.
+
+    Sites are grouped by the allocating line plus the project line that called into it.
+    Only the grown entries are filtered (Snapshot.filter_traces() would walk every trace).
+    """
+    sites = {}
+    for traceback, (size, count) in after.items():
+        size_before, count_before = before.get(traceback, (0, 0))
+        if size <= size_before or traceback[-1].filename in _IGNORED_FILES:
+            continue
+        key = (_frame_label(traceback[-1]), _project_caller(traceback))
+        site = sites.setdefault(key, {"site": key[0], "caller": key[1], "size_kb": 0.0, "count": 0})
+        site["size_kb"] += (size - size_before) / 1024
+        site["count"] += count - count_before
+    ranked = sorted(sites.values(), key=lambda site: site["size_kb"], reverse=True)[:limit]
+    for site in ranked:
+        site["size_kb"] = round(site["size_kb"], 1)
+    return ranked
+
+
+def measure_memory(session, step, function, *args, **kwargs):
+    """Runs function(*args, **kwargs) between two snapshots and appends the step record"""
+    before = session["last_snapshot"]
+    rss_before = _rss_kb()
+    traced_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    result = function(*args, **kwargs)
+
+    traced_after, traced_peak = tracemalloc.get_traced_memory()
+    rss_after = _rss_kb()
+    after = take_grouped_snapshot()
+    session["last_snapshot"] = after
+    session["retained_kb"] += (traced_after - traced_before) / 1024
+    record = {
+        "step": step,
+        "traced_growth_kb": round((traced_after - traced_before) / 1024, 1),
+        "traced_peak_kb": round((traced_peak - traced_before) / 1024, 1),
+        "rss_growth_kb": rss_after - rss_before if rss_before is not None else None,
+        "retained_kb": round(session["retained_kb"], 1),
+        "top_sites": top_sites(before, after),
+    }
+    session["steps"].append(record)
+    return result, record
+
+
+def memory_profile_presentation(slides=None):
+    """
+    Builds the presentation like create_presentation() under tracemalloc, one
+    snapshot pair per slide builder.
+
+    Returns:
+        (prs, session) - the presentation and the profile session for memory_profile_save()
+    """
+    slides = generate_pptx.SLIDE_REGISTRY if slides is None else slides
+    tracemalloc.start(TRACE_FRAMES)
+    start_snapshot = take_grouped_snapshot()
+    session = {
+        "steps": [],
+        "start_snapshot": start_snapshot,
+        "last_snapshot": start_snapshot,
+        # Sum of the traced growth of all steps, so the profiler's own snapshots are not counted
+        "retained_kb": 0.0,
+        "rss_start_kb": _rss_kb(),
+    }
+
+    # Its own step, so the template load is not attributed to the first slide
+    prs, _ = measure_memory(session, "new_presentation", generate_pptx.new_presentation)
+    for entry in slides:
+        _, record = measure_memory(session, entry["builder"].__name__, entry["builder"], prs)
+        record["slide"] = entry["number"]
+        record["name"] = entry["name"]
+    generate_pptx.set_slide_total(prs)
+    return prs, session
+
+
+def memory_profile_save(session, prs, path, reproducible=False):
+    """Saves prs as the profiled "save" step, records what the build retained and stops tracing"""
+    measure_memory(session, "save", generate_pptx.save_atomic, prs, path, reproducible=reproducible)
+    session["retained_sites"] = top_sites(session.pop("start_snapshot"), session.pop("last_snapshot"),
+                                          limit=2 * TOP_SITES)
+    session["retained_kb"] = round(session["retained_kb"], 1)
+    rss_end = _rss_kb()
+    session["rss_growth_kb"] = rss_end - session["rss_start_kb"] if rss_end is not None else None
+    tracemalloc.stop()
+
+
+def _format_kb(value):
+    return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+
+def print_memory_profile(session):
+    """Prints one block per step (in build order) and the retained growth of the whole build"""
+    header = f"{'step':<28} {'traced KB':>10} {'peak KB':>10} {'RSS KB':>10} {'retained KB':>12}"
+    print(header)
+    print("-" * len(header))
+    for record in session["steps"]:
+        print(f"{record['step']:<28} {_format_kb(record['traced_growth_kb'])} {_format_kb(record['traced_peak_kb'])} "
+              f"{_format_kb(record['rss_growth_kb'])} {record['retained_kb']:>12.1f}")
+        for site in record["top_sites"]:
+            caller = f"  (via {site['caller']})" if site["caller"] and site["caller"] != site["site"] else ""
+            print(f"    {site['size_kb']:>9.1f} KB  {site['count']:>6} blocks  {site['site']}{caller}")
+    print("-" * len(header))
+    print(f"📈 Retained by the build: {session['retained_kb']:.1f} KB traced, "
+          f"{_format_kb(session['rss_growth_kb']).strip()} KB RSS")
+    for site in session["retained_sites"]:
+        caller = f"  (via {site['caller']})" if site["caller"] and site["caller"] != site["site"] else ""
+        print(f"    {site['size_kb']:>9.1f} KB  {site['count']:>6} blocks  {site['site']}{caller}")
+
+
+def write_memory_profile_json(session, path=DEFAULT_MEMORY_PROFILE_PATH):
+    """Writes the session (steps, retained sites and totals) as JSON"""
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "trace_frames": TRACE_FRAMES,
+        **session,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
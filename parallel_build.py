@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Parallel slide rendering for the Brain-Bridges generator
+
+Each slide builder runs in a worker process on its own scratch presentation.
+The worker hands back the finished slide XML plus the media it references,
+and the parent merges those slide parts into one package in deck order,
+re-creating relationships and de-duplicating media exactly like a serial
+build does. The merged package contains the same parts, in the same order,
+with the same bytes as create_presentation().
+"""
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.parts.slide import SlidePart
+
+import generate_pptx
+from build_trace import init_worker
+
+# Attributes in slide XML that point at a relationship id
+RELATIONSHIP_ID_ATTRIBUTES = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+
+def export_slide_part(slide):
+    """
+    Serializes a finished slide into a picklable slide part.
+
+    Returns:
+        dict with the slide XML ("xml") and its relationships ("rels") as
+        (rId, reltype, is_external, target) tuples in rId order, where target
+        is the media blob (or the URL for external relationships)
+    """
+    slide_part = slide.part
+    rels = []
+    for rel in sorted(slide_part.rels.values(), key=lambda rel: int(rel.rId[3:])):
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            continue
+        if rel.is_external:
+            rels.append((rel.rId, rel.reltype, True, rel.target_ref))
+        elif rel.reltype == RT.IMAGE:
+            rels.append((rel.rId, rel.reltype, False, rel.target_part.blob))
+        else:
+            raise ValueError(f"Unsupported slide relationship for merging: {rel.reltype}")
+
+    return {"xml": slide_part.blob, "rels": rels}
+
+
+def import_slide_part(prs, slide_data, layout_index=6):
+    """
+    Appends a slide part produced by export_slide_part() to `prs`.
+
+    Mirrors what prs.slides.add_slide() does, but with the finished slide XML,
+    so partnames, slide ids and relationship ids come out like a serial build.
+    Media is de-duplicated against the package and relationship ids are
+    remapped in the slide XML if the target package assigns different ones.
+    """
+    presentation_part = prs.part
+    slide_layout = prs.slide_layouts[layout_index]
+    partname = generate_pptx.next_slide_partname(prs)
+
+    slide_part = SlidePart(partname, CT.PML_SLIDE, presentation_part.package, parse_xml(slide_data["xml"]))
+    slide_part.relate_to(slide_layout.part, RT.SLIDE_LAYOUT)
+    generate_pptx.append_slide_part(prs, slide_part)
+
+    # Media last: new image partnames are numbered from the parts reachable in the package
+    rId_map = {}
+    for rId, reltype, is_external, target in slide_data["rels"]:
+        if is_external:
+            new_rId = slide_part.relate_to(target, reltype, is_external=True)
+        else:
+            image_part = presentation_part.package.get_or_add_image_part(io.BytesIO(target))
+            new_rId = slide_part.relate_to(image_part, reltype)
+        if new_rId != rId:
+            rId_map[rId] = new_rId
+
+    if rId_map:
+        for element in slide_part._element.iter(etree.Element):
+            for attribute in RELATIONSHIP_ID_ATTRIBUTES:
+                rId = element.get(attribute)
+                if rId in rId_map:
+                    element.set(attribute, rId_map[rId])
+
+    return slide_part.slide
+
+
+def render_slide_parts(slide_number):
+    """Worker entry point: builds one registered slide on a scratch presentation and exports it"""
+    prs = generate_pptx.create_presentation(generate_pptx.select_slides(str(slide_number)))
+    return [export_slide_part(slide) for slide in prs.slides]
+
+
+def create_presentation_parallel(slides=None, workers=None):
+    """
+    Creates the presentation with the slide builders spread over a process pool.
+
+    Args:
+        slides: Registry entries to build (default: the whole deck)
+        workers: Number of worker processes (None = one per CPU core)
+
+    Returns:
+        Presentation that serializes to the same parts as create_presentation(slides)
+    """
+    if slides is None:
+        slides = generate_pptx.SLIDE_REGISTRY
+    slide_numbers = [entry["number"] for entry in slides]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        rendered = list(pool.map(render_slide_parts, slide_numbers))
+
+    # Merge in fixed deck order, independent of which worker finished first
+    prs = generate_pptx.new_presentation()
+    for slide_parts in rendered:
+        for slide_data in slide_parts:
+            import_slide_part(prs, slide_data)
+
+    return generate_pptx.set_slide_total(prs)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Local HTTP render service for the Brain-Bridges generator
+
+Instead of starting python3 generate_pptx.py per render, a web app can post
+deck specs to a long-running service. Renders run in a pool of worker
+processes that are warmed up at startup: python-pptx, Pillow and the
+generator are imported and the default deck is built once, so its slides,
+images and the template already sit in each worker's caches (see
+batch_build.py). A request only pays for the slides its overrides change.
+
+    python3 render_service.py --port 8765 --workers 4
+
+    POST /render   deck spec as JSON, returns the .pptx
+                   {"slides": "12-15,23",
+                    "tokens": {"AUTOREGRESS_STEP_1": {"tokens": ["To", "be", "or", "not"]},
+                               "WHY_NOW_STEP_1": {"title": "Hardware got cheap"}},
+                    "reproducible": true}
+    GET  /slides   slide registry as JSON
+    GET  /health   worker and queue status
+    GET  /metrics  counters and latency histograms in Prometheus text format
+                   (GET /metrics.json: the same as JSON, see build_metrics.py)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import build_metrics
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# Largest accepted deck spec in bytes
+MAX_SPEC_SIZE = 1024 * 1024
+
+# Slide parts a worker keeps between requests before its cache is reset
+SLIDE_CACHE_LIMIT = 2000
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Worker process state, set up by _init_worker()
+_worker_resources = contextlib.ExitStack()
+_slide_parts = {}
+_worker_metrics = None
+
+
+def _init_worker():
+    """Imports the generator, enables media sharing and renders the default deck once"""
+    global _worker_metrics
+    import batch_build
+    _worker_metrics = build_metrics.new_metrics()
+    _worker_resources.enter_context(batch_build.shared_media())
+    _worker_resources.enter_context(build_metrics.instrumented_builders(_worker_metrics))
+    render_deck({})
+
+
+def _worker_pid():
+    return os.getpid()
+
+
+def render_deck(spec):
+    """
+    Worker entry point: builds the deck for `spec`.
+
+    Returns:
+        (pptx_bytes, metrics) - the .pptx and the metrics recorded since the last render
+    """
+    import batch_build
+    from reproducible import save_reproducible
+
+    if len(_slide_parts) > SLIDE_CACHE_LIMIT:
+        _slide_parts.clear()
+
+    prs, rebuilt = batch_build.build_deck(spec, _slide_parts)
+    buffer = io.BytesIO()
+    started = time.perf_counter()
+    if spec.get("reproducible"):
+        save_reproducible(prs, buffer)
+    else:
+        prs.save(buffer)
+    save_seconds = time.perf_counter() - started
+
+    pptx_bytes = buffer.getvalue()
+    metrics = _worker_metrics if _worker_metrics is not None else build_metrics.new_metrics()
+    build_metrics.record_deck(metrics, prs, rebuilt, len(pptx_bytes), save_seconds)
+    return pptx_bytes, build_metrics.take(metrics)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Handles /render, /slides and /health; renders are delegated to the server's worker pool"""
+
+    server_version = "BrainBridgesRender/1.0"
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, data, headers=None):
+        self._send(status, json.dumps(data).encode("utf-8"), headers=headers)
+
+    def _count_request(self, status, started=None):
+        with self.server.lock:
+            build_metrics.inc(self.server.metrics, "render_requests_total", status=status)
+            if started is not None:
+                build_metrics.observe(self.server.metrics, "render_seconds", time.perf_counter() - started)
+
+    def do_GET(self):
+        if self.path in ("/metrics", "/metrics.json"):
+            with self.server.lock:
+                if self.path == "/metrics":
+                    body = build_metrics.to_prometheus(self.server.metrics).encode("utf-8")
+                else:
+                    body = json.dumps(build_metrics.to_json(self.server.metrics)).encode("utf-8")
+            self._send(HTTPStatus.OK, body, PROMETHEUS_CONTENT_TYPE if self.path == "/metrics" else "application/json")
+        elif self.path == "/health":
+            self._send_json(HTTPStatus.OK, {
+                "workers": self.server.workers,
+                "in_flight": self.server.in_flight,
+                "capacity": self.server.capacity,
+            })
+        elif self.path == "/slides":
+            from generate_pptx import SLIDE_REGISTRY
+            self._send_json(HTTPStatus.OK, [
+                {"number": entry["number"], "name": entry["name"], "section": entry["section"]}
+                for entry in SLIDE_REGISTRY
+            ])
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_SPEC_SIZE:
+            self._count_request("too_large")
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Deck spec too large"})
+            return
+        try:
+            spec = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(spec, dict):
+                raise ValueError("Deck spec must be a JSON object")
+        except ValueError as e:
+            self._count_request("bad_request")
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid deck spec: {e}"})
+            return
+
+        # Concurrency limit: busy workers plus a short queue, everything beyond is turned away
+        if not self.server.slots.acquire(blocking=False):
+            self._count_request("busy")
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "All render workers busy"},
+                            headers={"Retry-After": "1"})
+            return
+        from batch_build import DeckSpecError
+        started = time.perf_counter()
+        try:
+            with self.server.lock:
+                self.server.in_flight += 1
+            pptx_bytes, worker_metrics = self.server.pool.submit(render_deck, spec).result()
+        except DeckSpecError as e:
+            # Unknown tokens or slides, token values of the wrong type, paths outside assets/
+            self._count_request("bad_request", started)
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except Exception as e:
+            self._count_request("error", started)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"})
+            return
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+            self.server.slots.release()
+
+        render_ms = (time.perf_counter() - started) * 1000
+        with self.server.lock:
+            build_metrics.merge(self.server.metrics, worker_metrics)
+        self._count_request("ok", started)
+        self._send(HTTPStatus.OK, pptx_bytes, PPTX_CONTENT_TYPE, headers={
+            "Content-Disposition": 'attachment; filename="Brain-Bridges.pptx"',
+            "X-Render-Time-Ms": f"{render_ms:.0f}",
+        })
+
+
+def create_server(host="127.0.0.1", port=8765, workers=None, queue=None):
+    """
+    Creates the HTTP server with a warmed-up worker pool (call serve_forever() on it).
+
+    Args:
+        host, port: Address to listen on (default: localhost only)
+        workers: Number of render processes (None = one per CPU core)
+        queue: Requests that may wait for a free worker before 503 is returned (None = 2 per worker)
+    """
+    workers = workers or os.cpu_count()
+    queue = 2 * workers if queue is None else queue
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    # One task per worker starts every process now, not on the first requests
+    for future in [pool.submit(_worker_pid) for _ in range(workers)]:
+        future.result()
+
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.pool = pool
+    server.workers = workers
+    server.capacity = workers + queue
+    server.slots = threading.BoundedSemaphore(server.capacity)
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.metrics = build_metrics.new_metrics()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Brain-Bridges deck renders over local HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Render worker processes (default: 0 = one per CPU core)")
+    parser.add_argument("--queue", type=int, default=None,
+                        help="Requests allowed to wait for a free worker before 503 (default: 2 per worker)")
+    args = parser.parse_args()
+
+    print("🔥 Warming up render workers...")
+    server = create_server(args.host, args.port, args.workers or None, args.queue)
+    print(f"🚀 Render service on http://{args.host}:{args.port} ({server.workers} warm workers, "
+          f"up to {server.capacity} requests in flight)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 Render service stopped")
+    finally:
+        server.server_close()
+        server.pool.shutdown()
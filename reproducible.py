@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Byte-reproducible .pptx output
+
+prs.save() stamps every ZIP entry with the current time, so two builds of the
+same sources differ in their bytes. The reproducible writer uses the same
+part order as python-pptx but fixed ZIP metadata (timestamp, permissions,
+creator system), and sets the core document properties (docProps/core.xml)
+to fixed values. Identical inputs then give identical files, and a content
+hash of the deck can be used as a cache key.
+
+The fixed time is taken from SOURCE_DATE_EPOCH if set (the usual convention
+for reproducible builds), otherwise 1980-01-01, the earliest ZIP timestamp.
+"""
+
+import os
+import zipfile
+from datetime import datetime, timezone
+
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+
+# Author / last-modified-by written into docProps/core.xml
+DOCUMENT_AUTHOR = "Brain-Bridges"
+
+
+def build_datetime():
+    """Returns the fixed build time (naive UTC) from SOURCE_DATE_EPOCH, or 1980-01-01"""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch is None:
+        return datetime(1980, 1, 1)
+    # ZIP timestamps cannot express anything before 1980
+    return max(datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None), datetime(1980, 1, 1))
+
+
+def zip_info(membername):
+    """Returns a ZipInfo for `membername` with fixed, platform-independent metadata"""
+    info = zipfile.ZipInfo(membername, date_time=build_datetime().timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3  # Unix, regardless of the building OS
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def apply_reproducible_core_properties(prs):
+    """Replaces the template's core properties (author, dates, revision) with fixed values"""
+    core_properties = prs.core_properties
+    core_properties.author = DOCUMENT_AUTHOR
+    core_properties.last_modified_by = DOCUMENT_AUTHOR
+    core_properties.created = build_datetime()
+    core_properties.modified = build_datetime()
+    core_properties.revision = 1
+
+
+class _ReproducibleZipPkgWriter(_ZipPkgWriter):
+    """ZIP writer that stamps every entry with zip_info() instead of the current time"""
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(zip_info(pack_uri.membername), blob)
+
+
+class _ReproduciblePackageWriter(PackageWriter):
+    """PackageWriter (same part order as prs.save()) on top of the reproducible ZIP writer"""
+
+    def _write(self):
+        with _ReproducibleZipPkgWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+
+def save_reproducible(prs, pkg_file):
+    """Saves prs like prs.save(), but byte-identical for identical content"""
+    apply_reproducible_core_properties(prs)
+    package = prs.part.package
+    _ReproduciblePackageWriter.write(pkg_file, package._rels, tuple(package.iter_parts()))
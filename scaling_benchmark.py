@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark: how build time, save time and memory grow with the deck size
+
+Builds synthetic decks of 100, 1,000 and 10,000 slides from the parametric
+builders (create_autoregression_slide, create_why_now_slide,
+create_placeholder_slide) and records build time, save time and peak RSS per
+size. Every size runs in its own process, so the peak RSS of one size does
+not carry over into the next; RSS growth is the peak above the process after
+imports, i.e. the part that scales with the deck.
+
+The growth curve is fitted as time ~ n^k (least squares on log-log, over all
+sizes and between the two largest): k ≈ 1 is linear, k ≈ 2 means something in
+the build is quadratic (e.g. a lookup that scans all existing slides or shapes
+for every new one). Within a run,
+the time per slide of the last tenth of the deck is compared with the first
+tenth, which shows the same thing from a single size.
+
+    python3 scaling_benchmark.py
+    python3 scaling_benchmark.py --sizes 100 1000 3000 --output scaling.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_OUTPUT_PATH = "output/Brain-Bridges_SCALING.json"
+
+
+def synthetic_builders(count):
+    """Yields `count` slide builders cycling through the parametric slide types"""
+    import generate_pptx
+    from design_tokens import (AUTOREGRESS_STEP_1, AUTOREGRESS_STEP_2, AUTOREGRESS_STEP_3,
+                               AUTOREGRESS_STEP_FINAL, WHY_NOW_STEP_1, WHY_NOW_STEP_2, WHY_NOW_STEP_3)
+
+    templates = [
+        lambda prs, n: generate_pptx.create_autoregression_slide(prs, AUTOREGRESS_STEP_1),
+        lambda prs, n: generate_pptx.create_autoregression_slide(prs, AUTOREGRESS_STEP_2),
+        lambda prs, n: generate_pptx.create_autoregression_slide(prs, AUTOREGRESS_STEP_3),
+        lambda prs, n: generate_pptx.create_autoregression_slide(prs, AUTOREGRESS_STEP_FINAL),
+        lambda prs, n: generate_pptx.create_why_now_slide(prs, WHY_NOW_STEP_1),
+        lambda prs, n: generate_pptx.create_why_now_slide(prs, WHY_NOW_STEP_2),
+        lambda prs, n: generate_pptx.create_why_now_slide(prs, WHY_NOW_STEP_3),
+        lambda prs, n: generate_pptx.create_placeholder_slide(prs, n),
+    ]
+    for index in range(count):
+        yield templates[index % len(templates)], index + 1
+
+
+def _peak_rss_kb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in KB everywhere else
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure_size(count):
+    """Builds and saves a deck of `count` slides in this process; returns the measurements"""
+    import generate_pptx
+
+    prs = generate_pptx.new_presentation()
+    rss_start_kb = _peak_rss_kb()
+    tenth = max(count // 10, 1)
+    slide_times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_started = time.perf_counter()
+        for builder, slide_num in synthetic_builders(count):
+            started = time.perf_counter()
+            builder(prs, slide_num)
+            slide_times.append(time.perf_counter() - started)
+        build_s = time.perf_counter() - build_started
+    generate_pptx.set_slide_total(prs)
+
+    buffer = io.BytesIO()
+    save_started = time.perf_counter()
+    prs.save(buffer)
+    save_s = time.perf_counter() - save_started
+
+    first_ms = sum(slide_times[:tenth]) / tenth * 1000
+    last_ms = sum(slide_times[-tenth:]) / tenth * 1000
+    return {
+        "slides": count,
+        "build_s": round(build_s, 3),
+        "save_s": round(save_s, 3),
+        "ms_per_slide": round(build_s / count * 1000, 3),
+        "first_tenth_ms_per_slide": round(first_ms, 3),
+        "last_tenth_ms_per_slide": round(last_ms, 3),
+        "peak_rss_mb": round(_peak_rss_kb() / 1024, 1),
+        # Growth above the interpreter + libraries + template, which is what scales with the deck
+        "rss_growth_mb": round((_peak_rss_kb() - rss_start_kb) / 1024, 1),
+        "file_mb": round(len(buffer.getvalue()) / 1024 / 1024, 2),
+    }
+
+
+def run_size(count):
+    """Runs measure_size(count) in a fresh interpreter, so peak RSS belongs to this size alone"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure", str(count)],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def fit_exponent(sizes, values):
+    """Least-squares slope of log(value) over log(size): value ~ size^k, returns k (None below 2 points)"""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if not denominator:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator, 2)
+
+
+def growth_label(exponent):
+    if exponent is None:
+        return "n/a"
+    if exponent < 1.2:
+        return "linear"
+    if exponent < 1.7:
+        return "superlinear"
+    return "quadratic or worse"
+
+
+def fit_growth(sizes, values):
+    """Returns {"overall": k over all sizes, "largest": k between the two largest sizes}"""
+    return {"overall": fit_exponent(sizes, values), "largest": fit_exponent(sizes[-2:], values[-2:])}
+
+
+def print_results(results, fits):
+    print(f"{'slides':>8} {'build s':>9} {'save s':>8} {'ms/slide':>9} {'first 10%':>10} {'last 10%':>9} "
+          f"{'peak RSS MB':>12} {'growth MB':>10} {'file MB':>8}")
+    print("-" * 91)
+    for result in results:
+        print(f"{result['slides']:>8} {result['build_s']:>9.2f} {result['save_s']:>8.2f} "
+              f"{result['ms_per_slide']:>9.2f} {result['first_tenth_ms_per_slide']:>10.2f} "
+              f"{result['last_tenth_ms_per_slide']:>9.2f} {result['peak_rss_mb']:>12.1f} {result['rss_growth_mb']:>10.1f} "
+              f"{result['file_mb']:>8.2f}")
+    print("-" * 91)
+    sizes = [result["slides"] for result in results]
+    for metric, fit in fits.items():
+        overall_text = f"{fit['overall']:.2f}" if fit["overall"] is not None else "-"
+        line = f"📈 {metric:<12} ~ n^{overall_text:<5} ({growth_label(fit['overall'])})"
+        if len(sizes) > 2 and fit["largest"] is not None:
+            # A quadratic term shows most clearly between the largest sizes
+            line += f", n^{fit['largest']:.2f} from {sizes[-2]} to {sizes[-1]} slides ({growth_label(fit['largest'])})"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure how the generator scales with the number of slides")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Deck sizes in slides (default: 100 1000 10000)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help=f"JSON report (default: {DEFAULT_OUTPUT_PATH})")
+    parser.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # Child process: one size, result as JSON on the last stdout line
+        print(json.dumps(measure_size(args.measure)))
+        raise SystemExit(0)
+    if any(size < 1 for size in args.sizes):
+        parser.error("--sizes must be positive")
+
+    results = []
+    for size in sorted(set(args.sizes)):
+        print(f"⏱️  Building {size} slides...")
+        results.append(run_size(size))
+
+    sizes = [result["slides"] for result in results]
+    fits = {
+        "build time": fit_growth(sizes, [result["build_s"] for result in results]),
+        "save time": fit_growth(sizes, [result["save_s"] for result in results]),
+        "RSS growth": fit_growth(sizes, [result["rss_growth_mb"] for result in results]),
+    }
+    print_results(results, fits)
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "results": results,
+            "growth_exponents": fits,
+        }, f, indent=2)
+    print(f"💾 Scaling report written: {args.output}")
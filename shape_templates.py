@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Precompiled shape templates for repeated cards, cells and token boxes
+
+A ShapeTemplate bundles the styling of one kind of auto shape (geometry,
+fill, border, corner radius and the TextStyle of its text) and builds the
+<p:sp> XML python-pptx would write for it once. Stamping the template onto
+a slide then appends a copy of that shape with only position, size, text
+and colors patched in, instead of add_shape() plus a chain of fill, line,
+adjustment and text setters per shape:
+
+    SHAPE_VECTOR_CELL = ShapeTemplate(MSO_SHAPE.ROUNDED_RECTANGLE, fill=VECTOR_CELL_FILL_COLOR,
+                                      line=VECTOR_CELL_BORDER_COLOR, line_width=VECTOR_CELL_BORDER_WIDTH,
+                                      text_style=STYLE_VECTOR)
+    SHAPE_VECTOR_CELL.stamp(slide.shapes, cell_x, y, VECTOR_CELL_WIDTH, TOKEN_BOX_HEIGHT, "0.23")
+
+Stamped shapes get their id and name from slide.shapes exactly like
+add_shape() ("Rounded Rectangle 12"), so the result is the same XML.
+"""
+
+import copy
+
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import AutoShapeType, Shape
+
+# fill=NO_FILL: transparent shape (fill.background())
+NO_FILL = "none"
+
+
+class ShapeTemplate:
+    """An auto shape styled once and stamped onto slides as copies"""
+
+    FIELDS = ("autoshape_type", "fill", "line", "line_width", "adjustment", "text_style", "vertical_anchor")
+
+    def __init__(self, autoshape_type, fill=None, line=None, line_width=None, adjustment=None,
+                 text_style=None, vertical_anchor=None):
+        self.autoshape_type = autoshape_type
+        self.fill = fill
+        self.line = line
+        self.line_width = line_width
+        self.adjustment = adjustment
+        self.text_style = text_style
+        self.vertical_anchor = vertical_anchor
+        self._basename = AutoShapeType(autoshape_type).basename
+        self._sp = None
+
+    def __repr__(self):
+        # Stable across processes: slide fingerprints (build_cache.py) hash the templates a builder uses
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"ShapeTemplate({fields})"
+
+    def _compile(self):
+        """Builds the styled <p:sp> through python-pptx itself"""
+        autoshape_type = AutoShapeType(self.autoshape_type)
+        sp = CT_Shape.new_autoshape_sp(0, "", autoshape_type.prst, 0, 0, 0, 0)
+        shape = Shape(sp, None)
+        if self.fill == NO_FILL:
+            shape.fill.background()
+        elif self.fill is not None:
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = self.fill
+        if self.line is not None:
+            shape.line.color.rgb = self.line
+        if self.line_width is not None:
+            shape.line.width = self.line_width
+        if self.adjustment is not None:
+            shape.adjustments[0] = self.adjustment
+        if self.vertical_anchor is not None:
+            shape.text_frame.vertical_anchor = self.vertical_anchor
+        return sp
+
+    def stamp(self, shapes, left, top, width, height, text=None, fill=None, line=None, text_color=None):
+        """
+        Appends a copy of this shape to a slide.
+
+        Args:
+            shapes: slide.shapes of the target slide
+            left, top, width, height: Position and size (Length)
+            text: Text in the template's text style (None leaves the shape empty)
+            fill: RGBColor overriding the template's fill for this shape
+            line: RGBColor overriding the template's border color for this shape
+            text_color: RGBColor overriding the text style's color for this shape
+
+        Returns:
+            the new python-pptx Shape
+        """
+        if self._sp is None:
+            self._sp = self._compile()
+        sp = copy.deepcopy(self._sp)
+        shape_id = shapes._next_shape_id
+        cNvPr = sp.nvSpPr.cNvPr
+        cNvPr.id = shape_id
+        cNvPr.name = f"{self._basename} {shape_id - 1}"
+        # int() truncates like the "%d" python-pptx formats add_shape() positions with
+        sp.x, sp.y, sp.cx, sp.cy = int(left), int(top), int(width), int(height)
+        shapes._spTree.insert_element_before(sp, "p:extLst")
+        shape = shapes._shape_factory(sp)
+
+        if fill is not None:
+            if not _set_solid_color(sp.spPr, fill):
+                shape.fill.solid()
+                shape.fill.fore_color.rgb = fill
+        if line is not None:
+            ln = sp.spPr.find(qn("a:ln"))
+            if ln is None or not _set_solid_color(ln, line):
+                shape.line.color.rgb = line
+        if text is not None:
+            self.text_style.apply(shape.text_frame, text, color=text_color)
+        return shape
+
+
+def _set_solid_color(parent, color):
+    """Patches the <a:solidFill><a:srgbClr val=""/> of `parent`, False if it has none"""
+    solidFill = parent.find(qn("a:solidFill"))
+    if solidFill is None or len(solidFill) != 1 or solidFill[0].tag != qn("a:srgbClr"):
+        return False
+    solidFill[0].set("val", str(color))
+    return True
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Per-slide budgets for build time, shape count, XML size and media size
+
+Every registry entry in generate_pptx.py may declare a "budget" next to its
+builder; limits it does not declare come from DEFAULT_SLIDE_BUDGET:
+
+    {"number": 22, ..., "builder": create_slide_22,
+     "budget": {"cpu_ms": 150, "shapes": 60, "xml_kb": 48}}
+
+After a slide is built (generate_pptx.build_slide) it is measured and checked.
+Depending on the mode (python3 generate_pptx.py --budgets warn|fail|off) a
+slide over budget prints a warning with the measured numbers or fails the
+build with SlideBudgetError. Slides taken from the build cache are not
+rebuilt and therefore not checked again.
+
+Time is the builder's CPU time, which - unlike wall time - does not grow
+when parallel workers share the CPU. It still varies with the machine and
+with one-time costs of the first slide using a feature, so time budgets
+leave headroom; shape, XML and media budgets are exact.
+"""
+
+import os
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# Budget mode, inherited by worker processes: "warn" (default), "fail" or "off"
+BUDGET_MODE_ENV = "BRAIN_BRIDGES_BUDGETS"
+BUDGET_MODES = ("warn", "fail", "off")
+
+# Shape elements counted per slide (including shapes inside groups)
+SHAPE_XPATH = ".//p:sp | .//p:pic | .//p:cxnSp | .//p:graphicFrame | .//p:grpSp"
+
+# Measured value per budget key: (label, unit)
+BUDGET_METRICS = {
+    "cpu_ms": ("CPU time", "ms"),
+    "shapes": ("shapes", ""),
+    "xml_kb": ("XML", "KB"),
+    "media_kb": ("media", "KB"),
+}
+
+
+class SlideBudgetError(Exception):
+    """A slide exceeded its budget while budgets are enforced (--budgets fail)"""
+
+
+def budget_mode():
+    mode = os.environ.get(BUDGET_MODE_ENV, "warn")
+    if mode not in BUDGET_MODES:
+        raise ValueError(f"{BUDGET_MODE_ENV} must be one of {', '.join(BUDGET_MODES)}, not '{mode}'")
+    return mode
+
+
+def _last_slide(prs):
+    # Not prs.slides[-1]: that renames all slide parts first, O(slides) per call
+    presentation_part = prs.part
+    return presentation_part.related_slide(presentation_part._element.sldIdLst[-1].rId)
+
+
+def measure_slide(slide, cpu_ms):
+    """Returns the budgeted numbers of a finished slide"""
+    slide_part = slide.part
+    media_bytes = sum(len(rel.target_part.blob) for rel in slide_part.rels.values()
+                      if rel.reltype == RT.IMAGE and not rel.is_external)
+    return {
+        "cpu_ms": round(cpu_ms, 1),
+        "shapes": len(slide.shapes._spTree.xpath(SHAPE_XPATH)),
+        "xml_kb": round(len(slide_part.blob) / 1024, 1),
+        "media_kb": round(media_bytes / 1024, 1),
+    }
+
+
+def over_budget(measured, budget):
+    """Returns [(key, measured, limit)] for every limit of `budget` that `measured` exceeds"""
+    return [(key, measured[key], limit) for key, limit in budget.items()
+            if limit is not None and measured[key] > limit]
+
+
+def _format_value(key, value):
+    return f"{value:g} {BUDGET_METRICS[key][1]}".rstrip()
+
+
+def format_violations(entry, violations):
+    details = ", ".join(f"{BUDGET_METRICS[key][0]} {_format_value(key, value)} > {_format_value(key, limit)}"
+                        for key, value, limit in violations)
+    return f"Slide {entry['number']} ({entry['name']}) over budget: {details}"
+
+
+def check_slide_budget(entry, prs, cpu_ms, default_budget):
+    """
+    Checks the slide the entry's builder just appended to prs against its budget.
+
+    Returns:
+        list of violations (empty if within budget or budgets are off)
+
+    Raises:
+        SlideBudgetError: if the slide is over budget and the mode is "fail"
+    """
+    mode = budget_mode()
+    if mode == "off":
+        return []
+    budget = {**default_budget, **entry.get("budget", {})}
+    violations = over_budget(measure_slide(_last_slide(prs), cpu_ms), budget)
+    if violations:
+        message = format_violations(entry, violations)
+        if mode == "fail":
+            raise SlideBudgetError(message)
+        print(f"⚠️  {message}")
+    return violations
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Streaming package writer for very large decks
+
+prs.save() serializes the whole object graph at the end, so every slide of
+the deck has to stay in memory until the last one is built. The streaming
+writer builds one slide at a time on a host presentation (master, layouts,
+theme), writes the slide XML, its relationships and any new media straight
+into the ZIP and then drops the slide from the host again. Only the slide
+list (partnames and media hashes) is kept until the end, when the template
+parts, presentation.xml and [Content_Types].xml are written.
+
+    write_presentation_streaming("output/report.pptx", builders)
+"""
+
+import contextlib
+import os
+import zipfile
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, CT_Types, serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.opc.spec import default_content_types
+from pptx.oxml import parse_xml
+
+import generate_pptx
+
+
+def _slide_rels_xml(slide_part, partname, media_partnames):
+    """Returns the .rels bytes for a streamed slide, pointing images at their streamed media parts"""
+    rels = CT_Relationships.new()
+    for rel in sorted(slide_part.rels.values(), key=lambda rel: int(rel.rId[3:])):
+        if rel.is_external:
+            rels.add_rel(rel.rId, rel.reltype, rel.target_ref, is_external=True)
+        elif rel.reltype == RT.IMAGE:
+            target = media_partnames[rel.target_part.sha1]
+            rels.add_rel(rel.rId, rel.reltype, target.relative_ref(partname.baseURI))
+        elif rel.reltype == RT.SLIDE_LAYOUT:
+            rels.add_rel(rel.rId, rel.reltype, rel.target_part.partname.relative_ref(partname.baseURI))
+        else:
+            raise ValueError(f"Unsupported slide relationship for streaming: {rel.reltype}")
+    return rels.xml_file_bytes
+
+
+def write_presentation_streaming(path, builders, reproducible=False):
+    """
+    Builds the slides one after another and streams each into the .pptx at `path`.
+
+    Args:
+        path: Output file, replaced atomically once the package is complete
+        builders: Iterable of slide builders (callables taking prs, appending one slide);
+            may be a generator, so the slide list itself never has to exist in memory
+        reproducible: Fixed ZIP metadata and docProps (see reproducible.py)
+
+    Returns:
+        Number of slides written
+    """
+    prs = generate_pptx.new_presentation()
+    presentation_part = prs.part
+    sldIdLst = prs.element.get_or_add_sldIdLst()
+
+    if reproducible:
+        from reproducible import apply_reproducible_core_properties, zip_info
+        apply_reproducible_core_properties(prs)
+
+    slide_partnames = []
+    media_partnames = {}
+    media_content_types = {}
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as zipf:
+
+            def write(pack_uri, blob):
+                zipf.writestr(zip_info(pack_uri.membername) if reproducible else pack_uri.membername, blob)
+
+            for number, builder in enumerate(builders, start=1):
+                builder(prs)
+                slide_part = prs.slides[-1].part
+                partname = PackURI(f"/ppt/slides/slide{number}.xml")
+
+                # Media is written once per image content, on first use
+                for rel in slide_part.rels.values():
+                    if rel.is_external or rel.reltype != RT.IMAGE:
+                        continue
+                    image_part = rel.target_part
+                    if image_part.sha1 not in media_partnames:
+                        media_number = len(media_partnames) + 1
+                        media_partname = PackURI(f"/ppt/media/image{media_number}.{image_part.partname.ext}")
+                        write(media_partname, image_part.blob)
+                        media_partnames[image_part.sha1] = media_partname
+                        media_content_types[media_partname] = image_part.content_type
+
+                write(partname, slide_part.blob)
+                write(partname.rels_uri, _slide_rels_xml(slide_part, partname, media_partnames))
+                slide_partnames.append(partname)
+
+                # Drop the finished slide from the host, so it (and its images) can be freed
+                sldId = sldIdLst[-1]
+                sldIdLst.remove(sldId)
+                presentation_part.drop_rel(sldId.rId)
+
+            # Template parts (master, layouts, theme, docProps, ...) are unchanged by the slides,
+            # except for the slide count in the master's counter, known only now
+            generate_pptx.set_slide_total(prs, len(slide_partnames))
+            package = presentation_part.package
+            write(PACKAGE_URI.rels_uri, package._rels.xml)
+            template_parts = [part for part in package.iter_parts() if part is not presentation_part]
+            for part in template_parts:
+                write(part.partname, part.blob)
+                if part._rels:
+                    write(part.partname.rels_uri, part._rels.xml)
+
+            # presentation.xml last: it lists every slide
+            presentation_rels = parse_xml(presentation_part.rels.xml)
+            first_rId = max(int(rId[3:]) for rId in presentation_part.rels.keys()) + 1
+            for index, partname in enumerate(slide_partnames):
+                rId = f"rId{first_rId + index}"
+                presentation_rels.add_rel(rId, RT.SLIDE, partname.relative_ref(presentation_part.partname.baseURI))
+                sldIdLst._add_sldId(id=256 + index, rId=rId)
+            write(presentation_part.partname, presentation_part.blob)
+            write(presentation_part.partname.rels_uri, presentation_rels.xml_file_bytes)
+
+            defaults, overrides = _ContentTypesItem([presentation_part] + template_parts)._defaults_and_overrides
+            for media_partname, content_type in media_content_types.items():
+                if (media_partname.ext.lower(), content_type) in default_content_types:
+                    defaults[media_partname.ext] = content_type
+                else:
+                    overrides[media_partname] = content_type
+            for partname in slide_partnames:
+                overrides[partname] = CT.PML_SLIDE
+
+            # Same element order as python-pptx: defaults by extension, overrides by partname
+            content_types = CT_Types.new()
+            for ext, content_type in sorted(defaults.items()):
+                content_types.add_default(ext, content_type)
+            for partname, content_type in sorted(overrides.items()):
+                content_types.add_override(partname, content_type)
+            write(CONTENT_TYPES_URI, serialize_part_xml(content_types))
+    except BaseException:
+        # A failing builder (e.g. --budgets fail) must not leave the half-written package behind
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+    return len(slide_partnames)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed build history: record, restore, prune, compact
+
+    python3 -m unittest test_history_store
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import generate_pptx
+import history_store
+
+
+class HistoryStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.history_dir = os.path.join(tmp.name, ".history")
+
+    def save_deck(self, name, slides):
+        """Saves the registry slides `slides` as deck `name`, returns its path"""
+        path = os.path.join(self.tmp, name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_pptx.save_atomic(generate_pptx.create_presentation(generate_pptx.select_slides(slides)), path)
+        return path
+
+    def test_restore_writes_the_recorded_deck(self):
+        path = self.save_deck("deck.pptx", "1-4")
+        history_store.record_build(path, "2025_11_17___15_26_22", self.history_dir)
+
+        restored_path = os.path.join(self.tmp, "restored.pptx")
+        identical = history_store.restore_build("2025_11_17___15_26_22", restored_path, self.history_dir)
+        self.assertTrue(identical)
+        with open(path, "rb") as recorded, open(restored_path, "rb") as restored:
+            self.assertEqual(restored.read(), recorded.read())
+
+    def test_unchanged_parts_are_stored_once(self):
+        path = self.save_deck("deck.pptx", "1-4")
+        new_parts, _ = history_store.record_build(path, "2025_11_17___15_26_22", self.history_dir)
+        self.assertGreater(new_parts, 0)
+        new_parts, new_bytes = history_store.record_build(path, "2025_11_17___15_26_22_2", self.history_dir)
+        self.assertEqual((new_parts, new_bytes), (0, 0))
+
+    def test_prune_keeps_the_newest_builds(self):
+        path = self.save_deck("deck.pptx", "1")
+        # Same second: the counter orders them, _10 after _2
+        build_ids = ["2025_11_16___09_00_00"] + [f"2025_11_17___15_26_22_{n}" for n in (10, 2, 3)]
+        for build_id in build_ids:
+            history_store.record_build(path, build_id, self.history_dir)
+        self.assertEqual(history_store.list_builds(self.history_dir),
+                         ["2025_11_16___09_00_00", "2025_11_17___15_26_22_2", "2025_11_17___15_26_22_3",
+                          "2025_11_17___15_26_22_10"])
+
+        removed = history_store.prune(2, self.history_dir)
+        self.assertEqual(removed, ["2025_11_16___09_00_00", "2025_11_17___15_26_22_2"])
+        self.assertEqual(history_store.list_builds(self.history_dir),
+                         ["2025_11_17___15_26_22_3", "2025_11_17___15_26_22_10"])
+        with self.assertRaises(KeyError):
+            history_store.restore_build("2025_11_16___09_00_00", os.path.join(self.tmp, "x.pptx"), self.history_dir)
+        with self.assertRaises(ValueError):
+            history_store.prune(0, self.history_dir)
+
+    def test_compact_frees_only_unreferenced_parts(self):
+        history_store.record_build(self.save_deck("old.pptx", "1-2"), "2025_11_16___09_00_00", self.history_dir)
+        history_store.record_build(self.save_deck("new.pptx", "1"), "2025_11_17___15_26_22", self.history_dir)
+        self.assertEqual(history_store.compact(self.history_dir), 0)
+
+        history_store.prune(1, self.history_dir)
+        self.assertGreater(history_store.compact(self.history_dir), 0)
+        restored_path = os.path.join(self.tmp, "restored.pptx")
+        self.assertTrue(history_store.restore_build("2025_11_17___15_26_22", restored_path, self.history_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test that `generate_pptx.py --incremental` takes an unchanged deck from the cache
+
+Runs the CLI twice in a copy of the project: the first run builds every
+slide, the second must take all of them from .build_cache/.
+
+    python3 -m unittest test_incremental_cache
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_incremental(project_dir):
+    """Runs one incremental build, returns (slides from cache, slides rebuilt)"""
+    result = subprocess.run(
+        [sys.executable, "generate_pptx.py", "--incremental"],
+        cwd=project_dir, capture_output=True, text=True, check=True
+    )
+    match = re.search(r"(\d+) slides from cache, (\d+) rebuilt", result.stdout)
+    if match is None:
+        raise AssertionError(f"No incremental build summary in output:\n{result.stdout}")
+    return int(match.group(1)), int(match.group(2))
+
+
+class IncrementalCacheTest(unittest.TestCase):
+
+    def test_second_run_takes_every_slide_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project_dir = os.path.join(tmp, "project")
+            shutil.copytree(PROJECT_DIR, project_dir, ignore=shutil.ignore_patterns(
+                ".git", "output", "temp", ".build_cache", "legacy", "__pycache__"))
+
+            cached, rebuilt = run_incremental(project_dir)
+            self.assertEqual(cached, 0)
+            self.assertGreater(rebuilt, 0)
+
+            cached, rebuilt = run_incremental(project_dir)
+            self.assertEqual(rebuilt, 0)
+            self.assertGreater(cached, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test that a parallel build writes the same bytes as a serial build
+
+Both decks are saved reproducibly (fixed ZIP metadata and docProps, see
+reproducible.py), so any difference in parts, part names, slide ids,
+relationship ids or media numbering shows up as differing bytes.
+
+    python3 -m unittest test_parallel_build
+"""
+
+import contextlib
+import io
+import unittest
+
+import generate_pptx
+from parallel_build import create_presentation_parallel
+from reproducible import save_reproducible
+
+
+def deck_bytes(prs):
+    buffer = io.BytesIO()
+    save_reproducible(prs, buffer)
+    return buffer.getvalue()
+
+
+class ParallelBuildTest(unittest.TestCase):
+
+    def test_parallel_build_matches_serial_build(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = deck_bytes(generate_pptx.create_presentation())
+            parallel = deck_bytes(create_presentation_parallel(workers=2))
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test that the render service only accepts design token overrides
+
+Starts render_service.py with one worker and posts deck specs: names outside
+design_tokens.py, values of the wrong type and paths outside assets/ are
+answered with 400, a valid spec with the deck.
+
+    python3 -m unittest test_render_service
+"""
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import unittest
+import urllib.error
+import urllib.request
+import zipfile
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class RenderServiceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        port = free_port()
+        cls.url = f"http://127.0.0.1:{port}"
+        cls.service = subprocess.Popen(
+            [sys.executable, "render_service.py", "--port", str(port), "--workers", "1"],
+            cwd=PROJECT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                urllib.request.urlopen(f"{cls.url}/health", timeout=1).close()
+                return
+            except OSError:
+                if cls.service.poll() is not None or time.monotonic() > deadline:
+                    cls.tearDownClass()
+                    raise
+                time.sleep(0.2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.terminate()
+        cls.service.wait()
+
+    def render(self, spec):
+        """Posts `spec` to /render, returns (status, body)"""
+        request = urllib.request.Request(f"{self.url}/render", data=json.dumps(spec).encode("utf-8"))
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def test_rejects_names_outside_design_tokens(self):
+        for name in ("os", "SLIDE_REGISTRY", "define_styles", "_slide_allocators", "hero_image_path"):
+            with self.subTest(name=name):
+                status, body = self.render({"tokens": {name: 1}, "slides": "1"})
+                self.assertEqual(status, 400)
+                self.assertIn("Unknown design token", json.loads(body)["error"])
+
+    def test_rejects_values_of_another_type(self):
+        for tokens in ({"ARROW_WIDTH": "wide"}, {"COLOR_BACKGROUND_DARK": "red"}, {"WHY_NOW_TITLE": 1},
+                       {"AUTOREGRESS_STEP_1": {"unknown_key": "x"}}, {"KEYWORD_THEME_PROBLEM": "#FFFFFF"}):
+            with self.subTest(tokens=tokens):
+                status, _ = self.render({"tokens": tokens, "slides": "1"})
+                self.assertEqual(status, 400)
+
+    def test_rejects_paths_outside_assets(self):
+        for path in (os.path.abspath(__file__), "assets/../design_tokens.py", "../assets/blue.png"):
+            with self.subTest(path=path):
+                status, _ = self.render({"tokens": {"HERO_IMAGE_PATH": path}, "slides": "5"})
+                self.assertEqual(status, 400)
+
+    def test_renders_valid_overrides(self):
+        status, body = self.render({"tokens": {"WHY_NOW_STEP_1": {"title": "Hardware got cheap"},
+                                               "COLOR_BACKGROUND_DARK": "#000000"}, "slides": "23"})
+        self.assertEqual(status, 200)
+        with zipfile.ZipFile(io.BytesIO(body)) as deck:
+            self.assertIn(b"Hardware got cheap", deck.read("ppt/slides/slide1.xml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that add_blank_slide() allocates slides exactly like python-pptx
+
+add_blank_slide() takes partnames, slide ids and relationship ids from running
+counters instead of prs.slides.add_slide()'s scans. Both must produce the same
+slide list, also when other code adds or removes slides in between (the
+counters are then recomputed).
+
+    python3 -m unittest test_slide_allocation
+"""
+
+import unittest
+
+import generate_pptx
+
+
+def slide_list(prs):
+    """(slide id, relationship id, partname) per slide, read without prs.slides (which renames parts)"""
+    return [(sldId.id, sldId.rId, str(prs.part.related_part(sldId.rId).partname))
+            for sldId in prs.element.get_or_add_sldIdLst()]
+
+
+def add_slide(prs):
+    """Reference: python-pptx's own add_slide() with the blank layout"""
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def remove_last_slide(prs):
+    sldIdLst = prs.element.get_or_add_sldIdLst()
+    sldId = sldIdLst[-1]
+    sldIdLst.remove(sldId)
+    prs.part.drop_rel(sldId.rId)
+
+
+class SlideAllocationTest(unittest.TestCase):
+
+    def test_blank_slides_match_python_pptx(self):
+        counters, reference = generate_pptx.new_presentation(), generate_pptx.new_presentation()
+        for _ in range(30):
+            generate_pptx.add_blank_slide(counters)
+            add_slide(reference)
+        self.assertEqual(slide_list(counters), slide_list(reference))
+
+    def test_slides_added_and_removed_by_other_code(self):
+        # "blank": add_blank_slide() vs add_slide(), "other": add_slide() on both decks, "remove": last slide
+        steps = ["blank", "other", "blank", "remove", "blank", "remove", "remove", "blank", "blank"]
+        counters, reference = generate_pptx.new_presentation(), generate_pptx.new_presentation()
+        for step in steps:
+            if step == "remove":
+                remove_last_slide(counters)
+                remove_last_slide(reference)
+            else:
+                (generate_pptx.add_blank_slide if step == "blank" else add_slide)(counters)
+                add_slide(reference)
+            self.assertEqual(slide_list(counters), slide_list(reference), f"after step {step}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test that every build path writes the deck's slide count into the master ("/25")
+
+Runs the CLI in a copy of the project, like a user would (generate_pptx.py
+is then loaded twice, as __main__ and as generate_pptx), and reads the count
+from the master's slide counter in the written deck.
+
+    python3 -m unittest test_slide_total
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+PREVIEW_PATH = os.path.join("output", "Brain-Bridges_PREVIEW.pptx")
+
+
+def slide_total(path):
+    """Returns the slide count shown by the master's slide counter of the deck at `path`"""
+    with zipfile.ZipFile(path) as zipf:
+        master_xml = zipf.read("ppt/slideMasters/slideMaster1.xml").decode("utf-8")
+    match = re.search(r'type="slidenum">.*?</a:fld><a:r><a:t>/(\d+)</a:t>', master_xml)
+    if match is None:
+        raise AssertionError("No slide counter in the master")
+    return int(match.group(1))
+
+
+class SlideTotalTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project_dir = os.path.join(tmp.name, "project")
+        shutil.copytree(PROJECT_DIR, self.project_dir, ignore=shutil.ignore_patterns(
+            ".git", "output", "temp", ".build_cache", "legacy", "__pycache__"))
+
+    def build(self, *args):
+        """Runs generate_pptx.py with `args`, returns the slide total of the written deck"""
+        subprocess.run([sys.executable, "generate_pptx.py", *args],
+                       cwd=self.project_dir, capture_output=True, text=True, check=True)
+        path = PREVIEW_PATH if "--slides" in args else os.path.join("output", "Brain-Bridges_LATEST.pptx")
+        return slide_total(os.path.join(self.project_dir, path))
+
+    def test_serial_build(self):
+        self.assertEqual(self.build(), 25)
+
+    def test_incremental_build_cold_and_warm(self):
+        self.assertEqual(self.build("--incremental", "--slides", "1-4"), 4)
+        # Slides 1-4 from the cache, the last slide rebuilt
+        self.assertEqual(self.build("--incremental", "--slides", "1-5"), 5)
+        self.assertEqual(self.build("--incremental", "--slides", "1-5"), 5)
+
+    def test_profile_build(self):
+        self.assertEqual(self.build("--profile", os.path.join("output", "profile.json"), "--slides", "1-5"), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
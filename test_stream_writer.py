@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test that the streaming writer produces the same package parts as prs.save()
+
+Both decks are written reproducibly (see reproducible.py); the streamed ZIP
+orders its members differently, so parts are compared by name and content.
+
+    python3 -m unittest test_stream_writer
+"""
+
+import contextlib
+import functools
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+import generate_pptx
+from reproducible import save_reproducible
+from stream_writer import write_presentation_streaming
+
+
+def package_parts(pkg_file):
+    """Returns {member name: bytes} of a .pptx"""
+    with zipfile.ZipFile(pkg_file) as zipf:
+        return {name: zipf.read(name) for name in zipf.namelist()}
+
+
+class StreamWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+
+    def test_streamed_parts_match_regular_save(self):
+        buffer = io.BytesIO()
+        path = os.path.join(self.tmp, "streamed.pptx")
+        with contextlib.redirect_stdout(io.StringIO()):
+            save_reproducible(generate_pptx.create_presentation(), buffer)
+            builders = (functools.partial(generate_pptx.build_slide, entry=entry)
+                        for entry in generate_pptx.SLIDE_REGISTRY)
+            written = write_presentation_streaming(path, builders, reproducible=True)
+
+        self.assertEqual(written, len(generate_pptx.SLIDE_REGISTRY))
+        streamed, saved = package_parts(path), package_parts(buffer)
+        self.assertEqual(sorted(streamed), sorted(saved))
+        for name in saved:
+            self.assertEqual(streamed[name], saved[name], name)
+
+    def test_failed_build_leaves_no_files(self):
+        def failing_builder(prs):
+            raise RuntimeError("builder failed")
+
+        path = os.path.join(self.tmp, "streamed.pptx")
+        with self.assertRaises(RuntimeError):
+            write_presentation_streaming(path, [generate_pptx.create_slide_1, failing_builder])
+        self.assertEqual(os.listdir(self.tmp), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Precompiled text styles for the slide builders
+
+A TextStyle bundles the paragraph and run formatting of one kind of text
+(alignment, size, bold, italic, color and font, usually straight from the
+design tokens) and compiles it once into the <a:p> XML python-pptx would
+write for it. Applying the style to a text frame then stamps a copy of that
+paragraph with the text filled in, instead of a dozen python-pptx proxy
+calls per text box:
+
+    STYLE_CONTENT_TITLE = TextStyle(size=FONT_SIZE_CONTENT_TITLE, bold=FONT_BOLD_CONTENT_TITLE,
+                                    color=FONT_COLOR_CONTENT_TITLE, font=FONT_FAMILY_TITLE,
+                                    align=PP_ALIGN.CENTER)
+    STYLE_CONTENT_TITLE.apply(title_box.text_frame, "Market Reality")
+
+Size, bold, italic and color are written as the paragraph's default run
+properties, the font name on every run (PowerPoint ignores a paragraph-level
+font name).
+
+Styles compiled against the deck theme (set_theme(), see deck_theme.py)
+leave out the default text color and body font and refer to the theme for
+its other colors and the heading font, instead of spelling them out.
+"""
+
+import copy
+import re
+
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.text.text import _Paragraph, _Run
+
+# Text python-pptx has to split (paragraphs, line breaks) or escape (control characters)
+_SPECIAL_TEXT = re.compile("[\x00-\x08\x0a-\x1f]")
+
+# DeckTheme the styles compile against (set_theme()), None: colors and fonts spelled out
+_theme = None
+
+
+def set_theme(theme):
+    """Compiles all text styles against `theme` (a deck_theme.DeckTheme, or None) from now on"""
+    global _theme
+    _theme = theme
+
+
+class TextStyle:
+    """Paragraph and run formatting, compiled once and applied to text frames in one step"""
+
+    FIELDS = ("size", "bold", "italic", "color", "font", "align")
+
+    def __init__(self, size=None, bold=None, italic=None, color=None, font=None, align=None):
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.color = color
+        self.font = font
+        self.align = align
+        # Compiled <a:p> and <a:rPr> per color (the style's own color is None), for self._theme
+        self._paragraphs = {}
+        self._run_properties = {}
+        self._theme = None
+
+    def __repr__(self):
+        # Stable across processes: slide fingerprints (build_cache.py) hash the styles a builder uses,
+        # the theme included, since the compiled XML depends on it
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"TextStyle({fields}, theme={_theme!r})"
+
+    def _format(self, font, color):
+        """Sets size, bold, italic and color on a python-pptx Font, theme colors as references"""
+        if self.size is not None:
+            font.size = self.size
+        if self.bold is not None:
+            font.bold = self.bold
+        if self.italic is not None:
+            font.italic = self.italic
+        if color is not None and _theme is not None:
+            color = _theme.text_color(color)
+        if isinstance(color, RGBColor):
+            font.color.rgb = color
+        elif color is not None:
+            font.color.theme_color = color
+
+    def _font_name(self):
+        """The font name to write, None if the text inherits it from the theme"""
+        if self.font is None or _theme is None:
+            return self.font
+        return _theme.text_font(self.font)
+
+    def _compile(self, color):
+        """Builds the styled <a:p><a:pPr/><a:r><a:rPr/><a:t/></a:r></a:p> through python-pptx itself"""
+        p = parse_xml(f"<a:p {nsdecls('a')}><a:r><a:t/></a:r></a:p>")
+        paragraph = _Paragraph(p, None)
+        if self.align is not None:
+            paragraph.alignment = self.align
+        self._format(paragraph.font, color)
+        font_name = self._font_name()
+        if font_name is not None:
+            paragraph.runs[0].font.name = font_name
+        return p
+
+    def list_style(self):
+        """
+        Returns this style as an <a:lstStyle> for a placeholder: the text of a
+        slide's placeholder inherits it from the layout or master placeholder.
+        The font name is a default run property here as well.
+        """
+        p = parse_xml(f"<a:p {nsdecls('a')}/>")
+        paragraph = _Paragraph(p, None)
+        if self.align is not None:
+            paragraph.alignment = self.align
+        self._format(paragraph.font, self.color)
+        font_name = self._font_name()
+        if font_name is not None:
+            paragraph.font.name = font_name
+        lstStyle = parse_xml(f"<a:lstStyle {nsdecls('a')}/>")
+        lvl1pPr = p.get_or_add_pPr()
+        lvl1pPr.tag = qn("a:lvl1pPr")
+        lstStyle.append(lvl1pPr)
+        return lstStyle
+
+    def _compile_run(self, color):
+        """Builds the styled <a:rPr> of a run that carries all of its formatting itself"""
+        r = parse_xml(f"<a:r {nsdecls('a')}><a:t/></a:r>")
+        run = _Run(r, None)
+        self._format(run.font, color)
+        font_name = self._font_name()
+        if font_name is not None:
+            run.font.name = font_name
+        return r.get_or_add_rPr()
+
+    def _compiled(self, cache_name, compile, color):
+        """Returns the XML `compile` made for `color`, compiled once per color and theme"""
+        if self._theme is not _theme:
+            self._paragraphs, self._run_properties, self._theme = {}, {}, _theme
+        cache = getattr(self, cache_name)
+        key = None if color is None or color == self.color else color
+        compiled = cache.get(key)
+        if compiled is None:
+            compiled = cache[key] = compile(self.color if key is None else key)
+        return compiled
+
+    def apply(self, text_frame, text, color=None):
+        """
+        Replaces the text of `text_frame` with `text` in this style.
+
+        Args:
+            text_frame: python-pptx TextFrame (of a text box or auto shape)
+            text: New text; "\\n" starts a new paragraph, "\\v" a line break, as with TextFrame.text
+            color: RGBColor overriding the style's color for this text
+        """
+        template = self._compiled("_paragraphs", self._compile, color)
+        txBody = text_frame._txBody
+        if not text or _SPECIAL_TEXT.search(text):
+            # Let python-pptx split and escape the text, then format what it made
+            text_frame.text = text
+            pPr, rPr = template.pPr, template.r_lst[0].rPr
+            for p in txBody.p_lst:
+                if pPr is not None:
+                    p.insert(0, copy.deepcopy(pPr))
+                if rPr is not None:
+                    for r in p.r_lst:
+                        r.insert(0, copy.deepcopy(rPr))
+            return
+
+        txBody.clear_content()
+        p = copy.deepcopy(template)
+        p.r_lst[0].t.text = text
+        txBody.append(p)
+
+    def add_run(self, paragraph, text, color=None):
+        """
+        Appends `text` as a run in this style to `paragraph`, for paragraphs that
+        mix several styles (a bold label followed by plain text).
+
+        Args:
+            paragraph: python-pptx _Paragraph
+            text: Text of the run
+            color: RGBColor overriding the style's color for this run
+
+        Returns:
+            the new python-pptx _Run
+        """
+        run = paragraph.add_run()
+        run._r.insert(0, copy.deepcopy(self._compiled("_run_properties", self._compile_run, color)))
+        run.text = text
+        return run
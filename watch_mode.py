@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the Brain-Bridges generator
+
+Keeps one warm interpreter around (python-pptx, Pillow and lxml stay
+imported) and polls generate_pptx.py, design_tokens.py and assets/. On a
+change the edited modules are reloaded in place and the deck is rebuilt
+through the slide cache (see build_cache.py), so only slides whose
+fingerprint changed are rebuilt. Unchanged slides are kept in memory between
+rebuilds, and the output is replaced atomically.
+
+    python3 generate_pptx.py --watch
+    python3 generate_pptx.py --watch --slides autoregression
+"""
+
+import importlib
+import os
+import time
+import traceback
+
+import build_cache
+import design_tokens
+import generate_pptx
+
+# Files and folders whose changes trigger a rebuild
+WATCH_PATHS = ("generate_pptx.py", "design_tokens.py", "assets")
+
+# Seconds between two file system polls
+POLL_INTERVAL = 0.05
+
+
+def snapshot(paths=WATCH_PATHS):
+    """Returns {file path: (mtime_ns, size)} for every watched file"""
+    files = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                for name in names:
+                    file_path = os.path.join(folder, name)
+                    stat = os.stat(file_path)
+                    files[file_path] = (stat.st_mtime_ns, stat.st_size)
+        elif os.path.exists(path):
+            stat = os.stat(path)
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def reload_generator(changed):
+    """Reloads the generator modules affected by the `changed` file paths"""
+    if "design_tokens.py" in changed:
+        importlib.reload(design_tokens)
+    # generate_pptx star-imports the tokens, so it is reloaded for token changes as well
+    if "design_tokens.py" in changed or "generate_pptx.py" in changed:
+        importlib.reload(generate_pptx)
+
+
+def rebuild(selection=None, output_path=None, slide_cache=None):
+    """
+    Rebuilds the deck through the slide cache and writes it atomically.
+
+    Args:
+        selection: --slides selection to build (None = whole deck)
+        output_path: Target file (default: LATEST, or PREVIEW for a selection)
+        slide_cache: In-memory {fingerprint: slide part} dict kept between rebuilds
+
+    Returns:
+        List of the slide numbers that were rebuilt
+    """
+    if output_path is None:
+        output_path = "output/Brain-Bridges_PREVIEW.pptx" if selection else "output/Brain-Bridges_LATEST.pptx"
+
+    slides = generate_pptx.select_slides(selection)
+    prs, rebuilt = build_cache.create_presentation_incremental(slides, memory_cache=slide_cache)
+
+    with generate_pptx.output_lock(os.path.dirname(output_path)):
+        generate_pptx.save_atomic(prs, output_path)
+    return rebuilt
+
+
+def watch(selection=None, output_path=None, interval=POLL_INTERVAL):
+    """Rebuilds on every change to the watched files until interrupted with Ctrl+C"""
+    slide_cache = {}
+    started = time.perf_counter()
+    rebuilt = rebuild(selection, output_path, slide_cache)
+    print(f"✅ Initial build: {len(rebuilt)} slides rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+    print(f"👀 Watching {', '.join(WATCH_PATHS)} (Ctrl+C to stop)")
+
+    files = snapshot()
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            changed = {path for path in files.keys() | current.keys() if files.get(path) != current.get(path)}
+            if not changed:
+                continue
+            files = current
+
+            started = time.perf_counter()
+            try:
+                reload_generator(changed)
+                rebuilt = rebuild(selection, output_path, slide_cache)
+            except Exception:
+                # Keep the daemon alive on a broken edit; the next save retries
+                traceback.print_exc()
+                print(f"❌ Rebuild failed after change to {', '.join(sorted(changed))}")
+                continue
+
+            slide_list = ", ".join(str(number) for number in rebuilt) or "none"
+            print(f"🔄 {', '.join(sorted(changed))}: rebuilt slides {slide_list} "
+                  f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("👋 Watch mode stopped")